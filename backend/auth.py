@@ -1,30 +1,99 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, NamedTuple, Optional
+import os
+import threading
+import time
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import schemas
 import database
+from passwords import verify_password, get_password_hash, verify_password_async
 
 # Security configuration
 SECRET_KEY = "your-secret-key-here-change-in-production"  # Change this in production!
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-security = HTTPBearer()
-
+# Authenticated principal cache configuration
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "1024"))
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+security = HTTPBearer()
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password for storing"""
-    return pwd_context.hash(password)
+class Principal(NamedTuple):
+    """Resolved identity of an authenticated user"""
+    id: int
+    email: str
+    is_active: bool
+    is_admin: bool
+    created_at: datetime
+
+
+class PrincipalCache:
+    """Thread-safe TTL + LRU cache of principals keyed by JWT subject.
+
+    The cache is per process, so changes made through another worker are
+    picked up once the TTL expires; local admin changes invalidate explicitly.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, subject: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[subject]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, subject: str, principal: Principal) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, subject: str) -> None:
+        with self._lock:
+            self._entries.pop(subject, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_TTL_SECONDS, PRINCIPAL_CACHE_MAX_SIZE)
 
 
 def get_user_by_email(db: Session, email: str):
@@ -42,6 +111,19 @@ def authenticate_user(db: Session, email: str, password: str):
     return user
 
 
+async def authenticate_user_async(db: Session, email: str, password: str):
+    """Authenticate user with bcrypt verification offloaded to the password pool.
+
+    Raises passwords.PasswordPoolSaturated when the pool is full.
+    """
+    user = await run_in_threadpool(get_user_by_email, db, email)
+    if not user:
+        return False
+    if not await verify_password_async(password, user.hashed_password):
+        return False
+    return user
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -54,36 +136,86 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(database.get_db)
-):
-    """Get current authenticated user from JWT token"""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+def _token_email(credentials: HTTPAuthorizationCredentials) -> str:
+    """Validate a bearer token and return the email it was issued to"""
     try:
         token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
-            raise credentials_exception
+            raise _credentials_exception()
         token_data = schemas.TokenData(email=email)
     except JWTError:
-        raise credentials_exception
-    
-    user = get_user_by_email(db, email=token_data.email)
+        raise _credentials_exception()
+    return token_data.email
+
+
+def _cache_principal(email: str, user) -> Principal:
     if user is None:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    principal = Principal(
+        id=user.id,
+        email=user.email,
+        is_active=user.is_active,
+        is_admin=user.is_admin,
+        created_at=user.created_at
+    )
+    principal_cache.set(email, principal)
+    return principal
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(database.get_db)
+) -> Principal:
+    """Get current authenticated user from JWT token.
+
+    Declared sync so FastAPI runs it (and its database query) in the threadpool
+    instead of blocking the event loop. Resolved users are served from
+    ``principal_cache`` until the TTL expires or they are invalidated.
+    """
+    email = _token_email(credentials)
+    principal = principal_cache.get(email)
+    if principal is not None:
+        return principal
+    
+    return _cache_principal(email, get_user_by_email(db, email=email))
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(database.get_async_db)
+) -> Principal:
+    """Get current authenticated user for endpoints on the async session path.
+
+    Looks the user up on the request's async session, so these endpoints never
+    check out a sync connection or a threadpool slot. Shares ``principal_cache``
+    with get_current_user.
+    """
+    email = _token_email(credentials)
+    principal = principal_cache.get(email)
+    if principal is not None:
+        return principal
+    
+    result = await db.execute(select(database.AdminUser).where(database.AdminUser.email == email))
+    return _cache_principal(email, result.scalars().first())
 
 
 def create_admin_user(db: Session, email: str, password: str, is_admin: bool = False):
     """Create a new admin user"""
-    hashed_password = get_password_hash(password)
+    return add_admin_user(db, email, get_password_hash(password), is_admin=is_admin)
+
+
+def add_admin_user(db: Session, email: str, hashed_password: str, is_admin: bool = False):
+    """Create a new admin user from an already hashed password"""
     db_user = database.AdminUser(
         email=email,
         hashed_password=hashed_password,
@@ -95,7 +227,7 @@ def create_admin_user(db: Session, email: str, password: str, is_admin: bool = F
     return db_user
 
 
-async def get_current_admin_user(current_user: database.AdminUser = Depends(get_current_user)):
+def get_current_admin_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     """Get current user and verify they are an admin"""
     if not current_user.is_admin:
         raise HTTPException(
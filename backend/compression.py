@@ -0,0 +1,217 @@
+"""
+Response compression for StackHealth Scorecard Platform
+ASGI middleware negotiating zstd, brotli or gzip for buffered and streamed responses
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+# Encodings in server preference order; unavailable ones are skipped
+COMPRESSION_ENCODINGS = [
+    encoding.strip()
+    for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+    if encoding.strip()
+]
+# Buffered responses smaller than this are sent uncompressed
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+
+# Media types worth compressing; images, archives and fonts are already compressed
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/javascript",
+    "application/xml",
+    "application/pdf",
+    "image/svg+xml"
+)
+
+
+class GzipEncoder:
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        # Sync flush so each streamed chunk is decodable as soon as it arrives
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int = 4):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encoders() -> Dict[str, Callable]:
+    """Encoders whose libraries are installed, keyed by content coding"""
+    encoders = {"gzip": GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, preference: Sequence[str]) -> Optional[str]:
+    """Pick the most preferred encoding the client accepts (q > 0), if any"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+
+    for encoding in preference:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Compress responses with the best encoding both sides support.
+
+    Bodies sent in one message are compressed when they reach minimum_size;
+    streamed bodies (StreamingResponse, FileResponse) are compressed chunk by
+    chunk and flushed, so NDJSON exports still arrive incrementally. A strong
+    ETag is weakened on compressed responses, since the bytes on the wire no
+    longer match the identity representation; If-None-Match uses weak
+    comparison, so either form revalidates.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+        encodings: Sequence[str] = COMPRESSION_ENCODINGS
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = available_encoders()
+        self.preference: List[str] = [encoding for encoding in encodings if encoding in self.encoders]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.preference:
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            encoding = negotiate_encoding(accept_encoding, self.preference)
+            if encoding is not None:
+                responder = CompressionResponder(
+                    self.app, encoding, self.encoders[encoding], self.minimum_size
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, encoder_factory: Callable, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.encoder = None
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    def _encoded_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # FileResponse sends its ETag unquoted; entity tags must be quoted strings
+            if not etag.startswith('"'):
+                etag = f'"{etag}"'
+            headers["ETag"] = f"W/{etag}"
+        return headers
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the headers until the first body chunk shows whether to compress
+            self.initial_message = message
+            return
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = Headers(raw=self.initial_message["headers"])
+            if not is_compressible(headers) or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+            else:
+                self.encoder = self.encoder_factory()
+                headers = self._encoded_headers()
+                if more_body:
+                    del headers["Content-Length"]
+                    body = self.encoder.compress(body)
+                else:
+                    body = self.encoder.compress(body) + self.encoder.finish()
+                    headers["Content-Length"] = str(len(body))
+                message["body"] = body
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if not self.passthrough:
+            body = self.encoder.compress(body) if body else b""
+            if not more_body:
+                body += self.encoder.finish()
+            message["body"] = body
+        await self.send(message)
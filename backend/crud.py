@@ -1,11 +1,37 @@
+from sqlalchemy import and_, case, extract, func, insert, or_, select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
-from datetime import date
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+from datetime import date, datetime
+import base64
+import data_versions
 import database
 import schemas
+from response_cache import response_cache
+import scoring
+import summary
 import json
 
 
+def encode_cursor(*values: Any) -> str:
+    """Encode keyset values into an opaque pagination cursor"""
+    raw = json.dumps([v.isoformat() if isinstance(v, (date, datetime)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Decode a pagination cursor, raising ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != 2 or not isinstance(values[1], int):
+        raise ValueError("Invalid cursor")
+    return values
+
+
 def create_product(db: Session, product: schemas.ProductCreate) -> database.Product:
     """Create a new product"""
     db_product = database.Product(
@@ -13,14 +39,87 @@ def create_product(db: Session, product: schemas.ProductCreate) -> database.Prod
         description=product.description
     )
     db.add(db_product)
+    data_versions.bump(db, data_versions.PRODUCTS)
     db.commit()
     db.refresh(db_product)
     return db_product
 
 
-def get_products(db: Session, skip: int = 0, limit: int = 100) -> List[database.Product]:
+def _split_page(items: List[Any], limit: int, key) -> Tuple[List[Any], Optional[str]]:
+    """Drop the look-ahead row from a keyset page and build the next page's cursor"""
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor(*key(items[-1]))
+
+
+# Columns of list responses, selected as plain rows so endpoints can serialize
+# them without building ORM objects or Pydantic models
+PRODUCT_LIST_COLUMNS = (
+    database.Product.id,
+    database.Product.name,
+    database.Product.description,
+    database.Product.created_at
+)
+SCORECARD_LIST_COLUMNS = (
+    database.Scorecard.id,
+    database.Scorecard.product_id,
+    database.Product.name.label("product_name"),
+    database.Scorecard.category,
+    database.Scorecard.date,
+    database.Scorecard.score,
+    database.Scorecard.breakdown,
+    database.Scorecard.feedback,
+    database.Scorecard.tool_suggestions,
+    database.Scorecard.created_at
+)
+SCORECARD_FIELDS = {column.key: column for column in SCORECARD_LIST_COLUMNS}
+# Columns the keyset cursor is built from
+SCORECARD_PAGE_KEY_FIELDS = ("date", "id")
+
+
+def _products_stmt():
+    """Products ordered by creation date (newest first)"""
+    return select(*PRODUCT_LIST_COLUMNS).order_by(
+        database.Product.created_at.desc(), database.Product.id.desc()
+    )
+
+
+def _products_page_stmt(cursor: Optional[str], limit: int):
+    stmt = _products_stmt()
+
+    if cursor:
+        created_at, product_id = decode_cursor(cursor)
+        try:
+            created_at = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        stmt = stmt.where(or_(
+            database.Product.created_at < created_at,
+            and_(database.Product.created_at == created_at, database.Product.id < product_id)
+        ))
+
+    # Fetch one extra row to learn whether there is a next page
+    return stmt.limit(limit + 1)
+
+
+def _product_page_key(product: Row) -> Tuple[datetime, int]:
+    return product.created_at, product.id
+
+
+def get_products(db: Session, skip: int = 0, limit: int = 100) -> List[Row]:
     """Get all products ordered by creation date (newest first)"""
-    return db.query(database.Product).order_by(database.Product.created_at.desc()).offset(skip).limit(limit).all()
+    return db.execute(_products_stmt().offset(skip).limit(limit)).all()
+
+
+def get_products_page(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Tuple[List[Row], Optional[str]]:
+    """Get a page of products using keyset pagination on (created_at, id)"""
+    products = db.execute(_products_page_stmt(cursor, limit)).all()
+    return _split_page(products, limit, _product_page_key)
 
 
 def get_product_by_id(db: Session, product_id: int) -> Optional[database.Product]:
@@ -35,147 +134,7 @@ def get_product_by_name(db: Session, name: str) -> Optional[database.Product]:
 
 def calculate_score(breakdown: Dict[str, Any], category: str) -> float:
     """Calculate category score as percentage (0-100%) based on breakdown fields"""
-    
-    # Updated weights for independent category scoring
-    weights = {
-        "security": {
-            # Static & Dynamic Testing (12 points = 40%)
-            "sast": 3, "dast": 3, "sast_dast_in_ci": 4, "triaging_findings": 2,
-            # Dependency & Secrets Management (8 points = 27%)
-            "secrets_scanning": 2, "sca_tool_used": 3, "cve_alerts": 3,
-            # Security Culture & Governance (10 points = 33%)
-            "threat_modeling": 3, "compliance": 2, "training": 2, 
-            "bug_bounty_policy": 1, "security_champions": 2
-        },
-        "automation": {
-            # Test Automation Foundation (15 points = 37.5%)
-            "automated_testing": 2, "testing_framework": 3, "dedicated_environment": 2,
-            "source_controlled": 3, "quick_setup": 1, "external_updates": 2, "test_reporting": 2,
-            # Test Design & Maintenance (13 points = 32.5%)
-            "seeded_data": 2, "test_independence": -5, "data_reseeding": 3,
-            "test_subsets": 3, "rapid_updates": 2, "database_automation": 2,
-            "cross_browser_testing": 2, "parallel_execution": 2, "flakiness_management": 2,
-            # CI/CD Integration & Deployment Testing (12 points = 30%)
-            "post_deploy_sanity": 3, "sanity_independence": -2, "smoke_testing": 3,
-            "performance_integration": 2, "security_integration": 2, "notification_integration": 1,
-            "test_dashboard": 2, "automated_scheduling": 1
-        },
-        "performance": {
-            # Performance Strategy & Planning (10 points = 33%)
-            "performance_requirements": 3, "regular_testing": 2, "performance_budget": 2, "trend_analysis": 3,
-            # Testing Implementation & Tools (12 points = 40%)
-            "dedicated_tools": 2, "ci_integration": 4, "production_like_env": 3, "load_testing": 3,
-            # Monitoring & Observability (8 points = 27%)
-            "realtime_monitoring": 2, "core_metrics": 2, "resource_utilization": 1,
-            "dashboard_viz": 2, "automated_alerting": 1
-        },
-        "cicd": {
-            # DORA Metrics (20 points = 44%)
-            "deployment_frequency": 5, "lead_time": 5, "recovery_time": 5, "change_failure_rate": 5,
-            # Pipeline Foundation (15 points = 33%)
-            "automated_builds": 3, "automated_tests": 4, "code_quality_gates": 3,
-            "security_integration": 3, "artifact_management": 2,
-            # Deployment & Release Management (10 points = 23%)
-            "automated_deployment": 3, "environment_promotion": 2, "rollback_capability": 3,
-            "feature_flags": 2
-        }
-    }
-    
-    category_weights = weights.get(category, {})
-    total_weighted_score = 0
-    total_possible_score = 0
-    
-    # Calculate maximum possible score for the category
-    max_scores = {
-        "security": 30,
-        "automation": 40,  # Base score, bonuses can exceed this
-        "performance": 30,
-        "cicd": 45  # Base score, bonuses can exceed this
-    }
-    
-    category_max = max_scores.get(category, 100)
-    
-    # Special handling for different field types
-    dora_metrics = ['deployment_frequency', 'lead_time', 'recovery_time', 'change_failure_rate']
-    coverage_fields = ['api_coverage', 'functional_coverage', 'integration_coverage', 'workflow_coverage']
-    test_type_fields = ['test_types', 'load_testing']
-    
-    for field, value in breakdown.items():
-        weight = category_weights.get(field, 0)
-        
-        if weight == 0:
-            continue  # Skip fields not in weights
-        
-        if category == "cicd" and field in dora_metrics:
-            # DORA metrics: map string values to scores
-            dora_scores = {
-                "on-demand": 5, "daily": 4, "weekly": 2, "monthly": 1,
-                "<1hour": 5, "<1day": 4, "<1week": 2, ">1week": 1,
-                "0-5%": 5, "6-15%": 4, "16-30%": 2, ">30%": 1
-            }
-            score_value = dora_scores.get(value, 0)
-            total_weighted_score += score_value
-            total_possible_score += 5  # Max DORA score
-            
-        elif field in coverage_fields:
-            # Coverage fields: map percentage ranges to scores
-            if field == "api_coverage":
-                coverage_scores = {"0%": 0, "1-20%": 1, "20-40%": 2, 
-                                 "40-60%": 4, "60-80%": 7, "80-100%": 10}
-                max_score = 10  # Bonus points
-            elif field == "functional_coverage":
-                coverage_scores = {"0%": 0, "1-20%": 1, "20-40%": 2, 
-                                 "40-70%": 3, "70-100%": 5}
-                max_score = 5  # Bonus points
-            elif field == "integration_coverage":
-                coverage_scores = {"0%": 0, "1-50%": 1, "50-80%": 2, "80-100%": 3}
-                max_score = 3  # Bonus points
-            else:  # workflow_coverage
-                coverage_scores = {"0%": 0, "1-20%": 1, "20-50%": 2, "50-100%": 4}
-                max_score = 4
-            
-            score_value = coverage_scores.get(value, 0)
-            total_weighted_score += score_value
-            # For automation bonuses, don't add to total_possible_score
-            if category != "automation":
-                total_possible_score += max_score
-                
-        elif field in test_type_fields:
-            if field == "test_types":
-                # Performance test types
-                type_scores = {"smoke": 1, "load": 2, "stress": 3, "spike": 4, "soak": 5}
-                score_value = type_scores.get(value, 0)
-                total_weighted_score += score_value
-                total_possible_score += 5
-            elif field == "load_testing":
-                # CI/CD load testing integration
-                total_weighted_score += (1 if value else 0) * weight
-                total_possible_score += weight
-            
-        else:
-            # Boolean fields with potential negative weights (anti-patterns)
-            if weight < 0:
-                # For negative weights (anti-patterns)
-                if not value:  # Anti-pattern is present (field is False)
-                    total_weighted_score += weight  # Add penalty
-                # If value is True, no penalty applied
-                total_possible_score += abs(weight)
-            else:
-                # Normal positive scoring
-                total_weighted_score += (1 if value else 0) * weight
-                total_possible_score += weight
-    
-    # Calculate percentage score
-    if total_possible_score == 0:
-        return 0.0
-    
-    # For categories with bonuses (automation, cicd), allow scores > 100%
-    percentage_score = (total_weighted_score / category_max) * 100
-    
-    # Ensure score doesn't go below 0 due to penalties
-    final_score = max(0, percentage_score)
-    
-    return round(final_score, 2)
+    return scoring.score(breakdown, category)
 
 
 def generate_feedback_and_suggestions(breakdown: Dict[str, Any], category: str, score: float) -> tuple[str, str]:
@@ -308,27 +267,204 @@ def create_scorecard(
         tool_suggestions=tool_suggestions
     )
     db.add(db_scorecard)
+    
+    # Keep the latest-score summary and data version in the same transaction
+    summary.record_scorecard(db, db_scorecard)
+    data_versions.bump(db, data_versions.SCORECARDS)
     db.commit()
+    # Invalidate after commit so a concurrent miss cannot re-cache the old rows
+    response_cache.invalidate(db_scorecard.product_id, db_scorecard.category)
     db.refresh(db_scorecard)
     return db_scorecard
 
 
+class BulkScorecardOutcome(NamedTuple):
+    """Result for one item of a bulk insert; error is set when the item was rejected"""
+    id: Optional[int] = None
+    score: Optional[float] = None
+    error: Optional[str] = None
+
+
+def _insert_scorecard_rows(db: Session, params: List[Dict[str, Any]]) -> List[int]:
+    """Bulk insert scorecard rows and return their ids in parameter order"""
+    table = database.Scorecard.__table__
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite cannot order batched RETURNING rows, so sort_by_parameter_order would
+        # fall back to one INSERT per row. Rowids are assigned in VALUES order under
+        # the write lock, so sorting the returned ids restores parameter order.
+        return sorted(db.execute(insert(table).returning(table.c.id), params).scalars())
+    return db.execute(
+        insert(table).returning(table.c.id, sort_by_parameter_order=True), params
+    ).scalars().all()
+
+
+class _NewScorecard(NamedTuple):
+    product_id: int
+    category: str
+    date: date
+    score: float
+
+
+def create_scorecards(
+    db: Session,
+    scorecards: List[schemas.ScorecardCreate]
+) -> List[BulkScorecardOutcome]:
+    """Create many scorecards in one transaction.
+
+    Products are checked with one IN query, each category is scored in one
+    batch, and accepted rows are written with a single bulk INSERT. Items for
+    unknown products, or that fail to score, are rejected; the rest are
+    committed together. Returns one outcome per input item, in input order.
+    """
+    product_ids = {scorecard.product_id for scorecard in scorecards}
+    known_products = set(db.execute(
+        select(database.Product.id).where(database.Product.id.in_(product_ids))
+    ).scalars()) if product_ids else set()
+    
+    outcomes: List[Optional[BulkScorecardOutcome]] = [None] * len(scorecards)
+    accepted_by_category: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+    for index, scorecard in enumerate(scorecards):
+        if scorecard.product_id not in known_products:
+            outcomes[index] = BulkScorecardOutcome(error="Product not found")
+            continue
+        accepted_by_category.setdefault(scorecard.category, []).append(
+            (index, scorecard.breakdown.dict())
+        )
+    
+    # Score each category in one pass over its compiled rubric
+    rows: Dict[int, Dict[str, Any]] = {}
+    for category, items in accepted_by_category.items():
+        try:
+            scores = scoring.score_many([breakdown for _, breakdown in items], category)
+        except Exception:
+            # A malformed breakdown fails the batch; rescore item by item below
+            scores = [None] * len(items)
+        for (index, breakdown), calculated_score in zip(items, scores):
+            try:
+                if calculated_score is None:
+                    calculated_score = scoring.score_many([breakdown], category)[0]
+                feedback, tool_suggestions = generate_feedback_and_suggestions(
+                    breakdown, category, calculated_score
+                )
+            except Exception as e:
+                outcomes[index] = BulkScorecardOutcome(error=f"Could not score scorecard: {e}")
+                continue
+            scorecard = scorecards[index]
+            rows[index] = {
+                "product_id": scorecard.product_id,
+                "category": category,
+                "date": scorecard.date,
+                "score": calculated_score,
+                "breakdown": breakdown,
+                "feedback": feedback,
+                "tool_suggestions": tool_suggestions
+            }
+    
+    if rows:
+        order = sorted(rows)
+        params = [rows[index] for index in order]
+        inserted_ids = _insert_scorecard_rows(db, params)
+        
+        # Keep the latest-score summary and data version in the same transaction
+        summary.record_scorecards(db, (
+            _NewScorecard(row["product_id"], row["category"], row["date"], row["score"])
+            for row in params
+        ))
+        data_versions.bump(db, data_versions.SCORECARDS)
+        db.commit()
+        for product_id, category in {(row["product_id"], row["category"]) for row in params}:
+            response_cache.invalidate(product_id, category)
+        
+        for index, scorecard_id in zip(order, inserted_ids):
+            outcomes[index] = BulkScorecardOutcome(id=scorecard_id, score=rows[index]["score"])
+    
+    return outcomes
+
+
+def _scorecards_stmt(
+    product_id: Optional[int],
+    category: Optional[str],
+    fields: Optional[List[str]] = None
+):
+    """Scorecards, newest first, optionally filtered by product and category.
+
+    ``fields`` names the SCORECARD_FIELDS to select; unselected columns such as
+    breakdown are never read from the database. None selects every field.
+    """
+    if fields is None:
+        fields = list(SCORECARD_FIELDS)
+    stmt = select(*(SCORECARD_FIELDS[field] for field in fields))
+    if "product_name" in fields:
+        # Join the product name in the same query to avoid N+1 lookups
+        stmt = stmt.join(database.Scorecard.product)
+    
+    if product_id:
+        stmt = stmt.where(database.Scorecard.product_id == product_id)
+    if category:
+        stmt = stmt.where(database.Scorecard.category == category)
+    
+    return stmt.order_by(database.Scorecard.date.desc(), database.Scorecard.id.desc())
+
+
+def _scorecards_page_stmt(
+    product_id: Optional[int],
+    category: Optional[str],
+    cursor: Optional[str],
+    limit: int,
+    fields: Optional[List[str]] = None
+):
+    if fields is not None:
+        # The next cursor is read from the last row, so its key columns are always selected
+        fields = list(dict.fromkeys([*fields, *SCORECARD_PAGE_KEY_FIELDS]))
+    stmt = _scorecards_stmt(product_id, category, fields)
+
+    if cursor:
+        scorecard_date, scorecard_id = decode_cursor(cursor)
+        try:
+            scorecard_date = date.fromisoformat(scorecard_date)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        stmt = stmt.where(or_(
+            database.Scorecard.date < scorecard_date,
+            and_(database.Scorecard.date == scorecard_date, database.Scorecard.id < scorecard_id)
+        ))
+
+    # Fetch one extra row to learn whether there is a next page
+    return stmt.limit(limit + 1)
+
+
+def _scorecard_page_key(scorecard: Row) -> Tuple[date, int]:
+    return scorecard.date, scorecard.id
+
+
 def get_scorecards_by_product(
     db: Session, 
     product_id: Optional[int] = None, 
     category: Optional[str] = None,
     skip: int = 0, 
-    limit: int = 100
-) -> List[database.Scorecard]:
-    """Get scorecards, optionally filtered by product and category"""
-    query = db.query(database.Scorecard)
-    
-    if product_id:
-        query = query.filter(database.Scorecard.product_id == product_id)
-    if category:
-        query = query.filter(database.Scorecard.category == category)
-    
-    return query.order_by(database.Scorecard.date.desc()).offset(skip).limit(limit).all()
+    limit: int = 100,
+    fields: Optional[List[str]] = None
+) -> List[Row]:
+    """Get scorecards, optionally filtered by product and category and limited to ``fields``"""
+    stmt = _scorecards_stmt(product_id, category, fields).offset(skip).limit(limit)
+    return db.execute(stmt).all()
+
+
+def get_scorecards_page(
+    db: Session,
+    product_id: Optional[int] = None,
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Row], Optional[str]]:
+    """Get a page of scorecards using keyset pagination on (date, id).
+
+    With ``fields``, rows also carry the date and id columns of the cursor.
+    """
+    stmt = _scorecards_page_stmt(product_id, category, cursor, limit, fields)
+    scorecards = db.execute(stmt).all()
+    return _split_page(scorecards, limit, _scorecard_page_key)
 
 
 def get_scorecard_by_id(db: Session, scorecard_id: int) -> Optional[database.Scorecard]:
@@ -336,48 +472,315 @@ def get_scorecard_by_id(db: Session, scorecard_id: int) -> Optional[database.Sco
     return db.query(database.Scorecard).filter(database.Scorecard.id == scorecard_id).first()
 
 
+TREND_COLUMNS = (database.Scorecard.date, database.Scorecard.score, database.Scorecard.category)
+
+
+def _trend_start_date(quarters: int) -> date:
+    """Calculate trend start date based on quarters (each quarter = 3 months)"""
+    from datetime import datetime, timedelta
+    
+    months_back = quarters * 3
+    return datetime.now().date() - timedelta(days=months_back * 30)  # Approximate
+
+
+def _trend_stmt(product_id: int, category: str, quarters: int):
+    start_date = _trend_start_date(quarters)
+    
+    # Select only the plotted columns; breakdown and feedback are never needed here
+    return select(*TREND_COLUMNS).where(
+        database.Scorecard.product_id == product_id,
+        database.Scorecard.category == category,
+        database.Scorecard.date >= start_date
+    ).order_by(database.Scorecard.date.asc())
+
+
 def get_trend_data(
     db: Session, 
     product_id: int, 
     category: str, 
     quarters: int = 4
-) -> List[database.Scorecard]:
+) -> List[Tuple[date, float, str]]:
     """Get quarterly trend data for a product's specific category over time"""
+    return db.execute(_trend_stmt(product_id, category, quarters)).all()
+
+
+def get_trend_data_batch(
+    db: Session,
+    pairs: Optional[List[Tuple[int, str]]] = None,
+    quarters: int = 4
+) -> List[Tuple[int, str, date, float]]:
+    """Get trend data for many (product_id, category) pairs in one query.
+
+    Rows are ordered by product, category and date so callers can group them
+    into series in a single pass. ``pairs=None`` returns every product and category.
+    """
+    query = db.query(
+        database.Scorecard.product_id,
+        database.Scorecard.category,
+        database.Scorecard.date,
+        database.Scorecard.score
+    ).filter(database.Scorecard.date >= _trend_start_date(quarters))
+    
+    if pairs is not None:
+        if not pairs:
+            return []
+        query = query.filter(
+            tuple_(database.Scorecard.product_id, database.Scorecard.category).in_(pairs)
+        )
+    
+    return query.order_by(
+        database.Scorecard.product_id,
+        database.Scorecard.category,
+        database.Scorecard.date.asc()
+    ).all()
+
+
+def _quarterly_improvement_stmt(product_id: int, category: str, quarters: int):
     from datetime import datetime, timedelta
     
-    # Calculate start date based on quarters (each quarter = 3 months)
-    months_back = quarters * 3
-    start_date = datetime.now().date() - timedelta(days=months_back * 30)  # Approximate
+    # Look back the requested number of quarters (4 quarters = last 12 months)
+    start_date = datetime.now().date() - timedelta(days=quarters * 365 // 4)
     
-    return db.query(database.Scorecard).filter(
+    # Bucket by calendar quarter in SQL (portable across SQLite and Postgres)
+    year = extract("year", database.Scorecard.date)
+    month = extract("month", database.Scorecard.date)
+    quarter = case((month <= 3, 1), (month <= 6, 2), (month <= 9, 3), else_=4)
+    
+    # Rank scorecards within each quarter so the most recent one comes first;
+    # of several on that date, the first recorded (lowest id) wins
+    ranked = select(
+        *TREND_COLUMNS,
+        func.row_number().over(
+            partition_by=(year, quarter),
+            order_by=(database.Scorecard.date.desc(), database.Scorecard.id.asc())
+        ).label("quarter_rank")
+    ).where(
         database.Scorecard.product_id == product_id,
         database.Scorecard.category == category,
         database.Scorecard.date >= start_date
-    ).order_by(database.Scorecard.date.asc()).all()
+    ).subquery()
+    
+    return select(ranked.c.date, ranked.c.score, ranked.c.category).where(
+        ranked.c.quarter_rank == 1
+    ).order_by(ranked.c.date.asc())
 
 
 def get_quarterly_improvement_data(
     db: Session,
     product_id: int,
-    category: str
-) -> List[database.Scorecard]:
+    category: str,
+    quarters: int = 4
+) -> List[Tuple[date, float, str]]:
     """Get quarterly assessment data showing improvement trends"""
-    from datetime import datetime, timedelta
+    return db.execute(_quarterly_improvement_stmt(product_id, category, quarters)).all()
+
+
+REPORT_EXPORT_PAGE_SIZE = 200
+
+
+def report_row_key(row) -> Tuple[str, str, date, int]:
+    """Keyset position of a get_report_rows row, to pass back as ``after``"""
+    return row.product_name, row.category, row.date, row.id
+
+
+def get_report_rows(
+    db: Session,
+    product_ids: Optional[List[int]] = None,
+    categories: Optional[List[str]] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    latest_only: bool = False,
+    after: Optional[Tuple[str, str, date, int]] = None,
+    limit: int = REPORT_EXPORT_PAGE_SIZE
+):
+    """Get one page of the rendered fields of scorecards matching a report export filter.
+
+    Rows are ordered by product name, category, date and id; pass the
+    report_row_key of the last row as ``after`` to fetch the next page.
+    """
+    columns = (
+        database.Scorecard.id,
+        database.Product.name.label("product_name"),
+        database.Scorecard.product_id,
+        database.Scorecard.category,
+        database.Scorecard.date,
+        database.Scorecard.score,
+        database.Scorecard.breakdown,
+        database.Scorecard.feedback,
+        database.Scorecard.tool_suggestions
+    )
+    filters = []
+    if product_ids:
+        filters.append(database.Scorecard.product_id.in_(product_ids))
+    if categories:
+        filters.append(database.Scorecard.category.in_(categories))
+    if date_from:
+        filters.append(database.Scorecard.date >= date_from)
+    if date_to:
+        filters.append(database.Scorecard.date <= date_to)
     
-    # Get last 12 months of data to show quarterly progression
-    start_date = datetime.now().date() - timedelta(days=365)
+    if not latest_only:
+        rows = select(*columns).join(database.Product).where(*filters).subquery()
+    else:
+        # Keep only the most recent scorecard per product and category
+        ranked = select(
+            *columns,
+            func.row_number().over(
+                partition_by=(database.Scorecard.product_id, database.Scorecard.category),
+                order_by=(database.Scorecard.date.desc(), database.Scorecard.id.desc())
+            ).label("latest_rank")
+        ).join(database.Product).where(*filters).subquery()
+        rows = select(
+            *(ranked.c[column.key] for column in columns)
+        ).where(ranked.c.latest_rank == 1).subquery()
     
-    scorecards = db.query(database.Scorecard).filter(
+    order = (rows.c.product_name, rows.c.category, rows.c.date, rows.c.id)
+    stmt = select(rows).order_by(*order).limit(limit)
+    if after is not None:
+        stmt = stmt.where(tuple_(*order) > tuple_(*after))
+    return db.execute(stmt).all()
+
+
+def get_portfolio_rows(db: Session, product_id: int, quarters: int = 4):
+    """Get every category's trend for a product in one query.
+
+    Rows are ordered by category and date. Feedback and tool suggestions are
+    only selected for the latest scorecard in each category.
+    """
+    ranked = db.query(
+        database.Scorecard.category,
+        database.Scorecard.date,
+        database.Scorecard.score,
+        database.Scorecard.feedback,
+        database.Scorecard.tool_suggestions,
+        func.row_number().over(
+            partition_by=database.Scorecard.category,
+            order_by=(database.Scorecard.date.desc(), database.Scorecard.id.desc())
+        ).label("latest_rank")
+    ).filter(
         database.Scorecard.product_id == product_id,
-        database.Scorecard.category == category,
-        database.Scorecard.date >= start_date
-    ).order_by(database.Scorecard.date.asc()).all()
+        database.Scorecard.date >= _trend_start_date(quarters)
+    ).subquery()
+    
+    is_latest = ranked.c.latest_rank == 1
+    return db.query(
+        ranked.c.category,
+        ranked.c.date,
+        ranked.c.score,
+        case((is_latest, ranked.c.feedback)).label("feedback"),
+        case((is_latest, ranked.c.tool_suggestions)).label("tool_suggestions")
+    ).order_by(ranked.c.category, ranked.c.date.asc(), ranked.c.latest_rank.desc()).all()
+
+
+# Async read path: the same statements executed on an AsyncSession
+
+async def get_product_by_id_async(db: AsyncSession, product_id: int) -> Optional[database.Product]:
+    """Get a product by ID"""
+    return await db.get(database.Product, product_id)
+
+
+async def get_products_async(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Row]:
+    """Get all products ordered by creation date (newest first)"""
+    result = await db.execute(_products_stmt().offset(skip).limit(limit))
+    return result.all()
+
+
+async def get_products_page_async(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Tuple[List[Row], Optional[str]]:
+    """Get a page of products using keyset pagination on (created_at, id)"""
+    result = await db.execute(_products_page_stmt(cursor, limit))
+    return _split_page(result.all(), limit, _product_page_key)
+
+
+async def get_scorecards_by_product_async(
+    db: AsyncSession,
+    product_id: Optional[int] = None,
+    category: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[List[str]] = None
+) -> List[Row]:
+    """Get scorecards, optionally filtered by product and category and limited to ``fields``"""
+    stmt = _scorecards_stmt(product_id, category, fields).offset(skip).limit(limit)
+    result = await db.execute(stmt)
+    return result.all()
+
+
+async def get_scorecards_page_async(
+    db: AsyncSession,
+    product_id: Optional[int] = None,
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Row], Optional[str]]:
+    """Get a page of scorecards using keyset pagination on (date, id).
+
+    With ``fields``, rows also carry the date and id columns of the cursor.
+    """
+    result = await db.execute(_scorecards_page_stmt(product_id, category, cursor, limit, fields))
+    return _split_page(result.all(), limit, _scorecard_page_key)
+
+
+async def get_trend_data_async(
+    db: AsyncSession,
+    product_id: int,
+    category: str,
+    quarters: int = 4
+) -> List[Tuple[date, float, str]]:
+    """Get quarterly trend data for a product's specific category over time"""
+    result = await db.execute(_trend_stmt(product_id, category, quarters))
+    return result.all()
+
+
+async def get_quarterly_improvement_data_async(
+    db: AsyncSession,
+    product_id: int,
+    category: str,
+    quarters: int = 4
+) -> List[Tuple[date, float, str]]:
+    """Get quarterly assessment data showing improvement trends"""
+    result = await db.execute(_quarterly_improvement_stmt(product_id, category, quarters))
+    return result.all()
+
+
+def iter_export_rows(
+    db: Session,
+    product_id: Optional[int] = None,
+    category: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    batch_size: int = 1000
+):
+    """Stream scorecard rows for export from a server-side cursor, batch_size rows at a time"""
+    stmt = select(
+        database.Scorecard.id,
+        database.Scorecard.product_id,
+        database.Product.name.label("product_name"),
+        database.Scorecard.category,
+        database.Scorecard.date,
+        database.Scorecard.score,
+        database.Scorecard.breakdown,
+        database.Scorecard.feedback,
+        database.Scorecard.tool_suggestions,
+        database.Scorecard.created_at
+    ).join(database.Product)
     
-    # Group by quarters and return the most recent scorecard per quarter
-    quarterly_data = {}
-    for scorecard in scorecards:
-        quarter_key = f"{scorecard.date.year}-Q{((scorecard.date.month - 1) // 3) + 1}"
-        if quarter_key not in quarterly_data or scorecard.date > quarterly_data[quarter_key].date:
-            quarterly_data[quarter_key] = scorecard
+    if product_id:
+        stmt = stmt.where(database.Scorecard.product_id == product_id)
+    if category:
+        stmt = stmt.where(database.Scorecard.category == category)
+    if date_from:
+        stmt = stmt.where(database.Scorecard.date >= date_from)
+    if date_to:
+        stmt = stmt.where(database.Scorecard.date <= date_to)
     
-    return list(quarterly_data.values())
+    # yield_per streams results instead of buffering the whole result set
+    result = db.execute(stmt.order_by(database.Scorecard.id).execution_options(yield_per=batch_size))
+    try:
+        yield from result
+    finally:
+        result.close()
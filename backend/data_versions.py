@@ -0,0 +1,55 @@
+"""
+Data version counters for StackHealth Scorecard Platform
+Tracks a change counter per table so read endpoints can answer conditional requests cheaply
+"""
+
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+import database
+
+PRODUCTS = "products"
+SCORECARDS = "scorecards"
+
+_versions = database.DataVersion.__table__
+
+
+def bump(db: Session, *tables: str) -> None:
+    """Increment the version of each table.
+
+    One upsert creates missing counters and increments existing ones, so
+    concurrent first writes cannot collide. Runs inside the caller's
+    transaction, so the new version becomes visible together with the write it
+    describes; the caller commits.
+    """
+    stmt = database.upsert(db, _versions)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[_versions.c.table_name],
+            set_={"version": _versions.c.version + 1}
+        ),
+        [{"table_name": table, "version": 1} for table in tables]
+    )
+
+
+def _versions_stmt(tables):
+    return select(_versions.c.table_name, _versions.c.version).where(
+        _versions.c.table_name.in_(tables)
+    )
+
+
+def get_versions(db: Session, *tables: str) -> Dict[str, int]:
+    """Current versions of the given tables (0 for tables never written)"""
+    versions = dict.fromkeys(tables, 0)
+    versions.update(db.execute(_versions_stmt(tables)).all())
+    return versions
+
+
+async def get_versions_async(db: AsyncSession, *tables: str) -> Dict[str, int]:
+    """Current versions of the given tables (0 for tables never written)"""
+    versions = dict.fromkeys(tables, 0)
+    versions.update((await db.execute(_versions_stmt(tables))).all())
+    return versions
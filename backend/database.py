@@ -1,20 +1,46 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey, Date, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey, Date, JSON, Index
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
+from fastapi.concurrency import run_in_threadpool
+import logging
 import os
 
+from db_settings import async_url, build_async_engine, build_engine
+
+logger = logging.getLogger(__name__)
+
+
+def default_async_url(url: str):
+    """The async URL for url, or None when its backend has no async driver"""
+    try:
+        return async_url(url)
+    except ValueError as e:
+        logger.warning(f"{e}; async endpoints will run on the sync engine")
+        return None
+
+
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/scorecard.db")
+# Read-heavy endpoints use an async engine on the same database (aiosqlite / asyncpg)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or default_async_url(DATABASE_URL)
 
 # Ensure data directory exists
 os.makedirs("data", exist_ok=True)
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+engine = build_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if ASYNC_DATABASE_URL:
+    async_engine = build_async_engine(ASYNC_DATABASE_URL)
+    # Loaded objects stay usable after commit; async sessions cannot lazy-load expired attributes
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+else:
+    async_engine = None
+    AsyncSessionLocal = None
+
 Base = declarative_base()
 
 class AdminUser(Base):
@@ -39,6 +65,11 @@ class Product(Base):
     # Relationship with scorecards
     scorecards = relationship("Scorecard", back_populates="product", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyset pagination on (created_at, id)
+        Index("ix_products_created_at_id", "created_at", "id"),
+    )
+
 
 class Scorecard(Base):
     __tablename__ = "scorecards"
@@ -56,10 +87,56 @@ class Scorecard(Base):
     # Relationships
     product = relationship("Product", back_populates="scorecards")
 
+    __table_args__ = (
+        # Trend, quarterly and per-product listing queries filter on product + category
+        # and sort by date; trailing score makes trend reads index-only
+        Index("ix_scorecards_product_category_date", "product_id", "category", "date", "score"),
+        # Category-only listings sorted by date
+        Index("ix_scorecards_category_date", "category", "date"),
+        # Unfiltered listings and keyset pagination on (date, id)
+        Index("ix_scorecards_date_id", "date", "id"),
+    )
+
+
+class ProductCategorySummary(Base):
+    """Latest score and running statistics per product and category, maintained on write"""
+    __tablename__ = "product_category_summary"
+
+    product_id = Column(Integer, ForeignKey("products.id"), primary_key=True)
+    category = Column(String, primary_key=True)
+    latest_score = Column(Float, nullable=False)
+    latest_date = Column(Date, nullable=False)
+    scorecard_count = Column(Integer, nullable=False, default=0)
+    mean_score = Column(Float, nullable=False)
+    min_score = Column(Float, nullable=False)
+    max_score = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    product = relationship("Product")
+
+
+class DataVersion(Base):
+    """Per-table change counter, bumped in the same transaction as each write"""
+    __tablename__ = "data_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
 
+def create_tables():
+    """Create any missing tables; schema changes go through the Alembic migrations"""
+    Base.metadata.create_all(bind=engine)
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
+
+def upsert(db, table):
+    """INSERT for the session's database that supports ON CONFLICT DO UPDATE.
+
+    SQLite and Postgres share the syntax; other backends are not supported.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
 
 
 # Dependency to get DB session
@@ -69,3 +146,39 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+class SyncSessionAdapter:
+    """Async facade over sync sessions for databases without an async driver.
+
+    Covers the calls the async read path makes. Each runs in the threadpool on
+    its own short-lived session, so no connection is held while a request waits
+    for a thread (which would deadlock once the pool is smaller than the number
+    of waiting requests).
+    """
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def _execute(self, statement, *args, **kwargs):
+        with self.session_factory() as db:
+            # Buffer the rows so the result outlives the session
+            return db.execute(statement, *args, **kwargs).freeze()()
+
+    def _get(self, *args, **kwargs):
+        with self.session_factory() as db:
+            return db.get(*args, **kwargs)
+
+    async def execute(self, statement, *args, **kwargs):
+        return await run_in_threadpool(self._execute, statement, *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await run_in_threadpool(self._get, *args, **kwargs)
+
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        yield SyncSessionAdapter(SessionLocal)
+        return
+    async with AsyncSessionLocal() as db:
+        yield db
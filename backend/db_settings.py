@@ -0,0 +1,154 @@
+"""
+Database engine settings for StackHealth Scorecard Platform
+Builds a tuned SQLAlchemy engine per backend from environment configuration
+"""
+
+import os
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Async drivers used for each backend's AsyncEngine
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg"
+}
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "on")
+
+
+class DatabaseSettings(NamedTuple):
+    """Pool and connection tuning, read from the environment"""
+    # Connection pool (Postgres and other server databases)
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    statement_timeout_ms: int
+    # SQLite pragmas
+    sqlite_journal_mode: str
+    sqlite_synchronous: str
+    sqlite_busy_timeout_ms: int
+    sqlite_mmap_size: int
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        return cls(
+            pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", "true"),
+            statement_timeout_ms=int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000")),
+            sqlite_journal_mode=os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+            sqlite_synchronous=os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+            sqlite_busy_timeout_ms=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+            sqlite_mmap_size=int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+        )
+
+
+def engine_options(url: str, settings: DatabaseSettings) -> Dict[str, Any]:
+    """create_engine keyword arguments for a database URL"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend == "sqlite":
+        # Pragmas are applied per connection in _apply_sqlite_pragmas; the driver-level
+        # timeout matches busy_timeout so both layers wait the same amount
+        return {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": settings.sqlite_busy_timeout_ms / 1000
+            }
+        }
+
+    options = {
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_timeout": settings.pool_timeout,
+        "pool_recycle": settings.pool_recycle,
+        "pool_pre_ping": settings.pool_pre_ping
+    }
+    if backend == "postgresql" and settings.statement_timeout_ms > 0:
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(settings.statement_timeout_ms)}
+            }
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.statement_timeout_ms}"}
+    return options
+
+
+def async_url(url: str) -> str:
+    """Swap a database URL's driver for the backend's async driver"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.get_backend_name()} databases")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+def _apply_sqlite_pragmas(engine: Engine, settings: DatabaseSettings) -> None:
+    in_memory = engine.url.database in (None, "", ":memory:")
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            # WAL needs a database file; in-memory databases keep their default journal
+            if not in_memory:
+                cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+            cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+            cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
+            cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size}")
+        finally:
+            cursor.close()
+
+
+def build_engine(url: str, settings: Optional[DatabaseSettings] = None) -> Engine:
+    """Create an engine tuned for the database backend in url"""
+    settings = settings or DatabaseSettings.from_env()
+    engine = create_engine(url, **engine_options(url, settings))
+    if engine.dialect.name == "sqlite":
+        _apply_sqlite_pragmas(engine, settings)
+    return engine
+
+
+def build_async_engine(url: str, settings: Optional[DatabaseSettings] = None) -> AsyncEngine:
+    """Create an AsyncEngine with the same tuning as build_engine"""
+    settings = settings or DatabaseSettings.from_env()
+    options = engine_options(url, settings)
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:"):
+        # aiosqlite defaults to NullPool, which would start a connection thread and
+        # re-run the pragmas on every request; pool file connections like the sync engine
+        options["poolclass"] = AsyncAdaptedQueuePool
+    engine = create_async_engine(url, **options)
+    if engine.dialect.name == "sqlite":
+        # Connection events are registered on the underlying sync engine
+        _apply_sqlite_pragmas(engine.sync_engine, settings)
+    return engine
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """Connection pool metrics for health reporting"""
+    pool = engine.pool
+    stats = {
+        "backend": engine.dialect.name,
+        "pool_class": type(pool).__name__,
+        "status": pool.status()
+    }
+    # QueuePool (the default for file databases and server backends) exposes counters
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if callable(counter):
+            stats[name] = counter()
+    return stats
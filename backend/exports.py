@@ -0,0 +1,110 @@
+"""
+Scorecard exports for StackHealth Scorecard Platform
+Streams scorecard rows as NDJSON or CSV in fixed-size batches
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import schemas
+
+# Supported export formats and their media types
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+DEFAULT_BATCH_SIZE = 1000
+
+BASE_COLUMNS = (
+    "id", "product_id", "product_name", "category", "date", "score",
+    "feedback", "tool_suggestions", "created_at"
+)
+
+BREAKDOWN_MODELS = {
+    "security": schemas.SecurityScorecard,
+    "automation": schemas.AutomationScorecard,
+    "performance": schemas.PerformanceScorecard,
+    "cicd": schemas.CICDScorecard
+}
+
+
+def breakdown_columns(category: Optional[str] = None) -> List[str]:
+    """Flattened breakdown column names for one category, or every category"""
+    categories = [category] if category else list(BREAKDOWN_MODELS)
+    columns = {}
+    for name in categories:
+        for field in BREAKDOWN_MODELS[name].model_fields:
+            columns.setdefault(f"breakdown.{field}")
+    return list(columns)
+
+
+def export_record(row, flatten: bool = False) -> Dict[str, Any]:
+    """Build a JSON-ready record from a crud.iter_export_rows row"""
+    record = {
+        "id": row.id,
+        "product_id": row.product_id,
+        "product_name": row.product_name,
+        "category": row.category,
+        "date": row.date.isoformat(),
+        "score": row.score,
+        "feedback": row.feedback,
+        "tool_suggestions": row.tool_suggestions,
+        "created_at": row.created_at.isoformat() if row.created_at else None
+    }
+    breakdown = row.breakdown or {}
+    if flatten:
+        for field, value in breakdown.items():
+            record[f"breakdown.{field}"] = value
+    else:
+        record["breakdown"] = breakdown
+    return record
+
+
+def stream_ndjson(
+    rows: Iterable,
+    flatten: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[str]:
+    """Encode rows as NDJSON, yielding one chunk per batch of rows"""
+    batch = []
+    for row in rows:
+        batch.append(json.dumps(export_record(row, flatten)))
+        if len(batch) >= batch_size:
+            yield "\n".join(batch) + "\n"
+            batch.clear()
+    if batch:
+        yield "\n".join(batch) + "\n"
+
+
+def stream_csv(
+    rows: Iterable,
+    flatten: bool = False,
+    category: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[str]:
+    """Encode rows as CSV, yielding one chunk per batch of rows.
+
+    Flattened exports get one column per rubric field of the category (or of all
+    categories); breakdown keys outside the rubric are left out. Unflattened
+    exports carry the breakdown as a JSON column.
+    """
+    columns = list(BASE_COLUMNS) + (breakdown_columns(category) if flatten else ["breakdown"])
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+
+    pending = 0
+    for row in rows:
+        record = export_record(row, flatten)
+        if not flatten:
+            record["breakdown"] = json.dumps(record["breakdown"])
+        writer.writerow(record)
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
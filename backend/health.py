@@ -4,7 +4,10 @@ import time
 import sys
 from datetime import datetime
 from sqlalchemy import text
-from database import get_db
+from database import async_engine, engine, get_db
+from db_settings import pool_stats
+from auth import principal_cache
+from response_cache import response_cache
 
 router = APIRouter()
 
@@ -18,7 +21,8 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat(),
         "version": "2.0.0",
-        "uptime_seconds": int(time.time() - startup_time)
+        "uptime_seconds": int(time.time() - startup_time),
+        "auth_cache": principal_cache.stats()
     }
 
 @router.get("/health/detailed")
@@ -55,8 +59,12 @@ async def detailed_health():
                 "cpu_count": psutil.cpu_count()
             },
             "database": {
-                "status": db_status
+                "status": db_status,
+                "pool": pool_stats(engine),
+                "async_pool": pool_stats(async_engine.sync_engine) if async_engine is not None else None
             },
+            "auth_cache": principal_cache.stats(),
+            "response_cache": response_cache.stats(),
             "endpoints": {
                 "api_docs": "/docs",
                 "health": "/health",
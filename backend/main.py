@@ -1,25 +1,46 @@
-from fastapi import FastAPI, Depends, HTTPException, Response, status
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import timedelta
+from pydantic import ValidationError
+from typing import Any, Dict, List, Optional, Union
+from datetime import date, timedelta
 import crud
+import data_versions
 import schemas
 import database
 import auth
-from pdf_generator import generate_pdf_report
+import passwords
+import rescore
+import summary
+import pdf_jobs
+import exports
+from compression import CompressionMiddleware
 from health import router as health_router
+from response_cache import response_cache
+import hashlib
+import json
 import logging
+import os
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum number of scorecards accepted by one bulk request
+MAX_BULK_SCORECARDS = int(os.getenv("MAX_BULK_SCORECARDS", "1000"))
+# Bulk bodies larger than this are rejected before they are read into memory
+MAX_BULK_BODY_BYTES = int(os.getenv("MAX_BULK_BODY_BYTES", str(8 * 1024 * 1024)))
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
 app = FastAPI(
     title="Software Scorecard Dashboard API",
     description="API for tracking and visualizing software scorecards with authentication",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for frontend integration
@@ -31,12 +52,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses for clients that talk to uvicorn without nginx in front
+app.add_middleware(CompressionMiddleware)
+
 security = HTTPBearer()
 
 # Startup event to seed database
 @app.on_event("startup")
 async def startup_event():
-    """Run database seeding on application startup"""
+    """Create missing tables and seed the database on application startup"""
+    database.create_tables()
     try:
         from seed_data import seed_database
         seed_database()
@@ -44,6 +69,12 @@ async def startup_event():
         logger.error(f"Failed to seed database: {e}")
         # Don't fail startup if seeding fails
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop password and PDF render worker processes"""
+    passwords.password_pool.shutdown()
+    pdf_jobs.render_queue.shutdown()
+
 # Include health check routes
 app.include_router(health_router, tags=["health"])
 
@@ -54,14 +85,66 @@ def read_root():
     return {"message": "Software Scorecard Dashboard API v2.0 is running!"}
 
 
+def make_etag(request: Request, versions: Dict[str, int], *extra: Any) -> str:
+    """Strong ETag for a read: the URL plus the versions of every table it reads"""
+    key = json.dumps([
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        sorted(versions.items()),
+        [str(value) for value in extra]
+    ])
+    return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Attach the ETag, and return a 304 if the client already holds this version.
+
+    Read the versions before the data: a write landing in between then produces a
+    newer body under the older tag, which only costs the client one extra refresh.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    response.headers.update(headers)
+    
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    # If-None-Match uses weak comparison
+    tags = {tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")}
+    if "*" in tags or etag in tags:
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+def json_response(response: Response, content: Any) -> ORJSONResponse:
+    """Serialize JSON-ready content directly, skipping response_model validation.
+
+    For hot list endpoints whose rows already match the declared schema; headers
+    set on the injected ``response`` (ETag, next cursor) are carried over.
+    """
+    direct = ORJSONResponse(content)
+    direct.headers.raw.extend(response.headers.raw)
+    return direct
+
+
 # Authentication endpoints
+def password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many concurrent password operations, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.post("/auth/login", response_model=schemas.Token)
-def login_for_access_token(
+async def login_for_access_token(
     login_request: schemas.LoginRequest,
     db: Session = Depends(database.get_db)
 ):
     """Authenticate user and return access token"""
-    user = auth.authenticate_user(db, login_request.email, login_request.password)
+    try:
+        user = await auth.authenticate_user_async(db, login_request.email, login_request.password)
+    except passwords.PasswordPoolSaturated:
+        raise password_pool_busy()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -76,25 +159,32 @@ def login_for_access_token(
 
 
 @app.post("/auth/register", response_model=schemas.AdminUser)
-def register_admin_user(
+async def register_admin_user(
     user_data: schemas.AdminUserCreate,
     db: Session = Depends(database.get_db)
 ):
     """Register a new user (anyone can register, but they won't be admin by default)"""
     # Check if user already exists
-    existing_user = auth.get_user_by_email(db, user_data.email)
+    existing_user = await run_in_threadpool(auth.get_user_by_email, db, user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
     
-    return auth.create_admin_user(db, user_data.email, user_data.password, is_admin=False)
+    try:
+        hashed_password = await passwords.get_password_hash_async(user_data.password)
+    except passwords.PasswordPoolSaturated:
+        raise password_pool_busy()
+    
+    return await run_in_threadpool(
+        auth.add_admin_user, db, user_data.email, hashed_password, is_admin=False
+    )
 
 
 @app.get("/auth/me", response_model=schemas.AdminUser)
 def get_current_user_info(
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    current_user: auth.Principal = Depends(auth.get_current_user)
 ):
     """Get current user information"""
     return current_user
@@ -102,7 +192,7 @@ def get_current_user_info(
 
 @app.get("/auth/users", response_model=List[schemas.AdminUser])
 def get_all_users(
-    current_user: database.AdminUser = Depends(auth.get_current_admin_user),
+    current_user: auth.Principal = Depends(auth.get_current_admin_user),
     db: Session = Depends(database.get_db)
 ):
     """Get all users (admin only)"""
@@ -112,7 +202,7 @@ def get_all_users(
 @app.post("/auth/manage-admin")
 def manage_admin_privileges(
     request: schemas.AdminManagementRequest,
-    current_user: database.AdminUser = Depends(auth.get_current_admin_user),
+    current_user: auth.Principal = Depends(auth.get_current_admin_user),
     db: Session = Depends(database.get_db)
 ):
     """Grant or revoke admin privileges (admin only)"""
@@ -123,6 +213,7 @@ def manage_admin_privileges(
     target_user.is_admin = request.is_admin
     db.commit()
     db.refresh(target_user)
+    auth.principal_cache.invalidate(target_user.email)
     
     return {"message": f"Admin privileges {'granted' if request.is_admin else 'revoked'} for {target_user.email}"}
 
@@ -148,16 +239,36 @@ def setup_first_admin(
     target_user.is_admin = True
     db.commit()
     db.refresh(target_user)
+    auth.principal_cache.invalidate(target_user.email)
     
     return {"message": f"First admin setup complete for {target_user.email}"}
 
 
+@app.post("/admin/rescore", response_model=schemas.RescoreResult)
+def rescore_scorecards(
+    category: str,
+    current_user: auth.Principal = Depends(auth.get_current_admin_user),
+    db: Session = Depends(database.get_db)
+):
+    """Recompute stored scores, feedback and suggestions for a category (admin only)"""
+    # Validate category
+    valid_categories = ["automation", "performance", "security", "cicd"]
+    if category not in valid_categories:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+        )
+    
+    counts = rescore.rescore_category(db, category)
+    return {"category": category, "rescored": counts.rescored, "skipped": counts.skipped}
+
+
 # Product endpoints (protected)
 @app.post("/products", response_model=schemas.Product)
 def create_product(
     product: schemas.ProductCreate, 
     db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    current_user: auth.Principal = Depends(auth.get_current_user)
 ):
     """Create a new product"""
     # Check if product with same name already exists
@@ -169,21 +280,43 @@ def create_product(
 
 
 @app.get("/products", response_model=List[schemas.Product])
-def list_products(
+async def list_products(
+    request: Request,
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
-    db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_async_db),
+    current_user: auth.Principal = Depends(auth.get_current_user_async)
 ):
-    """Get all products"""
-    return crud.get_products(db, skip=skip, limit=limit) 
+    """Get all products.
+
+    Pass ``cursor`` (empty for the first page) to use keyset pagination instead of
+    skip/limit; the next page's cursor is returned in the ``X-Next-Cursor`` header.
+    """
+    versions = await data_versions.get_versions_async(db, data_versions.PRODUCTS)
+    cached = not_modified(request, response, make_etag(request, versions))
+    if cached:
+        return cached
+    
+    if cursor is None:
+        products = await crud.get_products_async(db, skip=skip, limit=limit)
+    else:
+        try:
+            products, next_cursor = await crud.get_products_page_async(db, cursor=cursor, limit=limit)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+    
+    return json_response(response, [product._asdict() for product in products])
 
 # Scorecard endpoints (protected)
 @app.post("/scorecards", response_model=schemas.Scorecard)
 def create_scorecard(
     scorecard: schemas.ScorecardCreate,
     db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    current_user: auth.Principal = Depends(auth.get_current_user)
 ):
     """Submit a new scorecard with feedback"""
     # Verify product exists
@@ -202,71 +335,398 @@ def create_scorecard(
     return crud.create_scorecard(db=db, scorecard=scorecard)
 
 
-@app.get("/scorecards", response_model=List[schemas.ScorecardWithProduct])
-def list_scorecards(
+def bulk_too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=413, detail=detail)
+
+
+async def read_bulk_body(request: Request) -> bytes:
+    """Read a bulk body, rejecting it as soon as it exceeds MAX_BULK_BODY_BYTES"""
+    too_large = bulk_too_large(f"Request body too large; the limit is {MAX_BULK_BODY_BYTES} bytes")
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_BULK_BODY_BYTES:
+        raise too_large
+    
+    # Chunked bodies carry no length, so count while reading
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_BULK_BODY_BYTES:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def read_bulk_items(request: Request) -> List[Any]:
+    """Parse a bulk body: a JSON array, or NDJSON with one scorecard per line.
+
+    Unparseable NDJSON lines are returned as ValueErrors so they are reported per item.
+    """
+    body = await read_bulk_body(request)
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    too_many = bulk_too_large(f"Too many scorecards; the limit is {MAX_BULK_SCORECARDS} per request")
+    
+    if content_type in NDJSON_MEDIA_TYPES:
+        items = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            if len(items) == MAX_BULK_SCORECARDS:
+                raise too_many
+            try:
+                items.append(json.loads(line))
+            except ValueError as e:
+                items.append(ValueError(f"Invalid JSON: {e}"))
+        return items
+    
+    try:
+        items = json.loads(body)
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON array or NDJSON")
+    if len(items) > MAX_BULK_SCORECARDS:
+        raise too_many
+    return items
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+    )
+
+
+@app.post("/scorecards/bulk", response_model=schemas.BulkScorecardResult)
+async def create_scorecards_bulk(
+    request: Request,
+    db: Session = Depends(database.get_db),
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Submit many scorecards at once as a JSON array or NDJSON.
+
+    Valid items are scored and inserted together in one transaction; invalid items
+    (bad payloads, unknown categories or products) are reported per item.
+    """
+    items = await read_bulk_items(request)
+    
+    valid_categories = ["automation", "performance", "security", "cicd"]
+    results: List[Optional[schemas.BulkScorecardItemResult]] = [None] * len(items)
+    accepted, accepted_indexes = [], []
+    for index, item in enumerate(items):
+        error = None
+        if isinstance(item, ValueError):
+            error = str(item)
+        else:
+            try:
+                scorecard = schemas.ScorecardCreate.model_validate(item)
+            except ValidationError as e:
+                error = validation_message(e)
+            else:
+                if scorecard.category not in valid_categories:
+                    error = f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+        
+        if error:
+            results[index] = schemas.BulkScorecardItemResult(index=index, status="error", error=error)
+        else:
+            accepted.append(scorecard)
+            accepted_indexes.append(index)
+    
+    outcomes = await run_in_threadpool(crud.create_scorecards, db, accepted) if accepted else []
+    for index, outcome in zip(accepted_indexes, outcomes):
+        results[index] = schemas.BulkScorecardItemResult(
+            index=index,
+            status="error" if outcome.error else "created",
+            id=outcome.id,
+            score=outcome.score,
+            error=outcome.error
+        )
+    
+    created = sum(result.status == "created" for result in results)
+    return schemas.BulkScorecardResult(created=created, failed=len(results) - created, results=results)
+
+
+def parse_scorecard_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Validate a ``fields`` query value; None means every field"""
+    if fields is None:
+        return None
+    if fields.strip() == "summary":
+        requested = list(schemas.ScorecardSummary.model_fields)
+    else:
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+    
+    valid_fields = list(schemas.ScorecardWithProduct.model_fields)
+    invalid = [field for field in requested if field not in valid_fields]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid fields: {', '.join(invalid)}. Must be among: {', '.join(valid_fields)}"
+        )
+    return list(dict.fromkeys(["id", *requested]))
+
+
+@app.get(
+    "/scorecards",
+    response_model=List[Union[schemas.ScorecardWithProduct, schemas.ScorecardSummary]]
+)
+async def list_scorecards(
+    request: Request,
+    response: Response,
     product_id: Optional[int] = None,
     category: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_async_db),
+    current_user: auth.Principal = Depends(auth.get_current_user_async)
 ):
-    """Get scorecards, optionally filtered by product and category"""
-    scorecards = crud.get_scorecards_by_product(
-        db, product_id=product_id, category=category, skip=skip, limit=limit
+    """Get scorecards, optionally filtered by product and category.
+
+    Pass ``cursor`` (empty for the first page) to use keyset pagination instead of
+    skip/limit; the next page's cursor is returned in the ``X-Next-Cursor`` header.
+    Pass ``fields`` as a comma-separated list of ScorecardWithProduct fields, or
+    ``summary`` for the ScorecardSummary fields, to return (and select) only those
+    columns; ``id`` is always included.
+    """
+    selected = parse_scorecard_fields(fields)
+    
+    versions = await data_versions.get_versions_async(
+        db, data_versions.PRODUCTS, data_versions.SCORECARDS
     )
+    cached = not_modified(request, response, make_etag(request, versions))
+    if cached:
+        return cached
     
-    # Convert to response format with product name
-    result = []
-    for scorecard in scorecards:
-        scorecard_data = schemas.ScorecardWithProduct(
-            id=scorecard.id,
-            product_id=scorecard.product_id,
-            product_name=scorecard.product.name,
-            category=scorecard.category,
-            date=scorecard.date,
-            score=scorecard.score,
-            breakdown=scorecard.breakdown,
-            feedback=scorecard.feedback,
-            tool_suggestions=scorecard.tool_suggestions,
-            created_at=scorecard.created_at
+    if cursor is None:
+        scorecards = await crud.get_scorecards_by_product_async(
+            db, product_id=product_id, category=category, skip=skip, limit=limit, fields=selected
         )
-        result.append(scorecard_data)
+    else:
+        try:
+            scorecards, next_cursor = await crud.get_scorecards_page_async(
+                db, product_id=product_id, category=category, cursor=cursor, limit=limit,
+                fields=selected
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
     
-    return result
+    # Rows already carry the ScorecardWithProduct columns, product name included
+    if selected is None:
+        return json_response(response, [scorecard._asdict() for scorecard in scorecards])
+    # Cursor pages also select the key columns; return only what was asked for
+    return json_response(response, [
+        {field: scorecard._mapping[field] for field in selected} for scorecard in scorecards
+    ])
+
+
+@app.get("/scorecards/export")
+def export_scorecards(
+    format: str = "ndjson",
+    flatten: bool = False,
+    product_id: Optional[int] = None,
+    category: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(database.get_db),
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Stream every matching scorecard as NDJSON or CSV.
+
+    Rows are read from a server-side cursor and encoded in batches, so memory use
+    does not grow with the number of rows. Set ``flatten`` to turn breakdown
+    fields into ``breakdown.<field>`` columns.
+    """
+    if format not in exports.EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid format. Must be one of: {', '.join(exports.EXPORT_FORMATS)}"
+        )
+    
+    # Validate category
+    valid_categories = ["automation", "performance", "security", "cicd"]
+    if category and category not in valid_categories:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+        )
+    
+    # The session stays open until the response finishes streaming (FastAPI < 0.106
+    # runs dependency teardown after the response is sent)
+    rows = crud.iter_export_rows(
+        db, product_id=product_id, category=category, date_from=date_from, date_to=date_to,
+        batch_size=exports.DEFAULT_BATCH_SIZE
+    )
+    if format == "csv":
+        chunks = exports.stream_csv(rows, flatten=flatten, category=category)
+    else:
+        chunks = exports.stream_ndjson(rows, flatten=flatten)
+    
+    headers = {
+        "Content-Disposition": f"attachment; filename=scorecards.{format}"
+    }
+    return StreamingResponse(chunks, headers=headers, media_type=exports.EXPORT_FORMATS[format])
+
+
+def load_report_snapshot(db: Session, scorecard_id: int) -> pdf_jobs.ReportSnapshot:
+    scorecard = crud.get_scorecard_by_id(db, scorecard_id=scorecard_id)
+    if not scorecard:
+        raise HTTPException(status_code=404, detail="Scorecard not found")
+    return pdf_jobs.snapshot_scorecard(scorecard)
+
+
+def pdf_job_response(job: pdf_jobs.PdfJob) -> schemas.PdfJob:
+    return schemas.PdfJob(
+        job_id=job.id,
+        scorecard_id=job.scorecard_id,
+        status=job.status,
+        error=job.error,
+        download_url=f"/scorecards/{job.scorecard_id}/pdf"
+    )
+
+
+@app.post("/scorecards/{scorecard_id}/pdf", response_model=schemas.PdfJob, status_code=202)
+def enqueue_scorecard_pdf(
+    scorecard_id: int,
+    db: Session = Depends(database.get_db),
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Queue a PDF render for a scorecard and return the job to poll"""
+    snapshot = load_report_snapshot(db, scorecard_id)
+    return pdf_job_response(pdf_jobs.render_queue.submit(snapshot))
+
+
+@app.get("/pdf-jobs/{job_id}", response_model=schemas.PdfJob)
+def get_pdf_job(
+    job_id: str,
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Get the status of a PDF render job"""
+    job = pdf_jobs.render_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="PDF job not found")
+    return pdf_job_response(job)
 
 
 @app.get("/scorecards/{scorecard_id}/pdf")
-def get_scorecard_pdf(
+async def get_scorecard_pdf(
     scorecard_id: int,
     db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    current_user: auth.Principal = Depends(auth.get_current_user)
 ):
-    """Generate and return PDF report for a scorecard"""
-    scorecard = crud.get_scorecard_by_id(db, scorecard_id=scorecard_id)
-    if not scorecard:
-        raise HTTPException(status_code=404, detail="Scorecard not found")
+    """Return the PDF report for a scorecard, rendering it first if it is not cached"""
+    snapshot = await run_in_threadpool(load_report_snapshot, db, scorecard_id)
     
-    # Generate PDF
-    pdf_bytes = generate_pdf_report(scorecard)
+    try:
+        path = await pdf_jobs.render_queue.render(snapshot)
+    except Exception as e:
+        logger.error(f"Failed to render PDF for scorecard {scorecard_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to render PDF report")
     
-    # Return PDF as response
-    filename = f"scorecard_{scorecard.product.name}_{scorecard.category}_{scorecard.date}.pdf"
+    # Stream the cached artifact
+    filename = f"scorecard_{snapshot.product.name}_{snapshot.category}_{snapshot.date}.pdf"
     headers = {
-        "Content-Disposition": f"attachment; filename={filename}",
-        "Content-Type": "application/pdf"
+        "Content-Disposition": f"attachment; filename={filename}"
     }
     
-    return Response(content=pdf_bytes, headers=headers, media_type="application/pdf")
+    return FileResponse(path, headers=headers, media_type="application/pdf")
+
+
+def load_portfolio_snapshot(db: Session, product_id: int, quarters: int) -> pdf_jobs.PortfolioSnapshot:
+    product = crud.get_product_by_id(db, product_id=product_id)
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    rows = crud.get_portfolio_rows(db, product_id, quarters)
+    return pdf_jobs.snapshot_portfolio(product, rows)
+
+
+@app.get("/products/{product_id}/report")
+async def get_product_portfolio_pdf(
+    product_id: int,
+    quarters: int = 4,
+    db: Session = Depends(database.get_db),
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Return a multi-page PDF covering every category of a product with trend charts"""
+    snapshot = await run_in_threadpool(load_portfolio_snapshot, db, product_id, quarters)
+    
+    try:
+        path = await pdf_jobs.render_queue.render_portfolio(snapshot)
+    except Exception as e:
+        logger.error(f"Failed to render portfolio PDF for product {product_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to render PDF report")
+    
+    filename = f"portfolio_{snapshot.product.name}.pdf"
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}"
+    }
+    
+    return FileResponse(path, headers=headers, media_type="application/pdf")
+
+
+@app.post("/reports/export")
+def export_reports(
+    request: schemas.ReportExportRequest,
+    db: Session = Depends(database.get_db),
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Stream a ZIP of PDF reports for every scorecard matching the filter"""
+    # Validate categories
+    valid_categories = ["automation", "performance", "security", "cicd"]
+    if request.categories and not set(request.categories) <= set(valid_categories):
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+        )
+    
+    def fetch_page(after=None):
+        return crud.get_report_rows(
+            db,
+            product_ids=request.product_ids,
+            categories=request.categories,
+            date_from=request.date_from,
+            date_to=request.date_to,
+            latest_only=request.latest_only,
+            after=after,
+            limit=crud.REPORT_EXPORT_PAGE_SIZE
+        )
+    
+    page = fetch_page()
+    if not page:
+        raise HTTPException(status_code=404, detail="No scorecards match the export filter")
+    
+    async def snapshots():
+        # Page through the rows as the archive is written instead of loading them all up front
+        rows = page
+        while rows:
+            for row in rows:
+                yield pdf_jobs.snapshot_row(row)
+            if len(rows) < crud.REPORT_EXPORT_PAGE_SIZE:
+                break
+            rows = await run_in_threadpool(fetch_page, crud.report_row_key(rows[-1]))
+    
+    headers = {
+        "Content-Disposition": "attachment; filename=scorecard_reports.zip"
+    }
+    return StreamingResponse(
+        pdf_jobs.stream_reports_zip(snapshots()), headers=headers, media_type="application/zip"
+    )
 
 
 @app.get("/scorecards/{scorecard_id}", response_model=schemas.Scorecard)
 def get_scorecard(
     scorecard_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    current_user: auth.Principal = Depends(auth.get_current_user)
 ):
     """Get a specific scorecard with all details"""
+    versions = data_versions.get_versions(db, data_versions.PRODUCTS, data_versions.SCORECARDS)
+    cached = not_modified(request, response, make_etag(request, versions))
+    if cached:
+        return cached
+    
     scorecard = crud.get_scorecard_by_id(db, scorecard_id=scorecard_id)
     if not scorecard:
         raise HTTPException(status_code=404, detail="Scorecard not found")
@@ -274,19 +734,32 @@ def get_scorecard(
     return scorecard
 
 
+def trend_points(rows) -> List[Dict[str, Any]]:
+    """JSON-ready trend points, the form kept in the response cache"""
+    return [
+        {"date": row_date.isoformat(), "score": score, "category": row_category}
+        for row_date, score, row_category in rows
+    ]
+
+
 @app.get("/trends/{product_id}/{category}", response_model=List[schemas.TrendData])
-def get_trend_data(
+async def get_trend_data(
     product_id: int,
     category: str,
+    request: Request,
+    response: Response,
     quarters: int = 4,
-    db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    db: AsyncSession = Depends(database.get_async_db),
+    current_user: auth.Principal = Depends(auth.get_current_user_async)
 ):
     """Get quarterly trend data for a product's specific category"""
-    # Verify product exists
-    product = crud.get_product_by_id(db, product_id=product_id)
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
+    # The trend window moves with the calendar, so the date is part of the ETag
+    versions = await data_versions.get_versions_async(
+        db, data_versions.PRODUCTS, data_versions.SCORECARDS
+    )
+    cached = not_modified(request, response, make_etag(request, versions, date.today()))
+    if cached:
+        return cached
     
     # Validate category
     valid_categories = ["automation", "performance", "security", "cicd"]
@@ -296,30 +769,103 @@ def get_trend_data(
             detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
         )
     
-    trend_data = crud.get_trend_data(db, product_id, category, quarters)
+    async def load_trend():
+        # Verify product exists
+        product = await crud.get_product_by_id_async(db, product_id=product_id)
+        if not product:
+            raise HTTPException(status_code=404, detail="Product not found")
+        
+        trend_data = await crud.get_trend_data_async(db, product_id, category, quarters)
+        return trend_points(trend_data)
+    
+    return json_response(response, await response_cache.get_or_compute(
+        "trends", product_id, category, (quarters, date.today()), load_trend,
+        data_version=versions[data_versions.SCORECARDS]
+    ))
+
+
+@app.post("/trends/batch", response_model=schemas.TrendBatchResponse)
+def get_trend_data_batch(
+    request: schemas.TrendBatchRequest,
+    db: Session = Depends(database.get_db),
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Get trend series for many product/category pairs (or "all") in one request"""
+    pairs = None
+    if request.pairs != "all":
+        # Validate categories
+        valid_categories = ["automation", "performance", "security", "cicd"]
+        invalid = sorted({pair.category for pair in request.pairs} - set(valid_categories))
+        if invalid:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
+            )
+        pairs = list(dict.fromkeys((pair.product_id, pair.category) for pair in request.pairs))
+    
+    rows = crud.get_trend_data_batch(db, pairs=pairs, quarters=request.quarters)
+    
+    # Group the ordered rows into columnar series
+    series = {}
+    for product_id, category, row_date, score in rows:
+        entry = series.get((product_id, category))
+        if entry is None:
+            entry = series[(product_id, category)] = {
+                "product_id": product_id, "category": category, "dates": [], "scores": []
+            }
+        entry["dates"].append(row_date)
+        entry["scores"].append(score)
     
+    # Requested pairs keep their order and come back empty when they have no data
+    if pairs is not None:
+        return {"series": [
+            series.get(pair, {"product_id": pair[0], "category": pair[1], "dates": [], "scores": []})
+            for pair in pairs
+        ]}
+    return {"series": list(series.values())}
+
+
+@app.get("/summary", response_model=List[schemas.ProductCategorySummary])
+def get_summary(
+    category: Optional[str] = None,
+    db: Session = Depends(database.get_db),
+    current_user: auth.Principal = Depends(auth.get_current_user)
+):
+    """Get the latest score and statistics for every product and category"""
     return [
-        schemas.TrendData(
-            date=scorecard.date,
-            score=scorecard.score,
-            category=scorecard.category
+        schemas.ProductCategorySummary(
+            product_id=row.product_id,
+            product_name=row.product.name,
+            category=row.category,
+            latest_score=row.latest_score,
+            latest_date=row.latest_date,
+            scorecard_count=row.scorecard_count,
+            mean_score=row.mean_score,
+            min_score=row.min_score,
+            max_score=row.max_score
         )
-        for scorecard in trend_data
+        for row in summary.get_summaries(db, category=category)
     ]
 
 
 @app.get("/quarterly-improvement/{product_id}/{category}", response_model=List[schemas.TrendData])
-def get_quarterly_improvement(
+async def get_quarterly_improvement(
     product_id: int,
     category: str,
-    db: Session = Depends(database.get_db),
-    current_user: database.AdminUser = Depends(auth.get_current_user)
+    request: Request,
+    response: Response,
+    quarters: int = 4,
+    db: AsyncSession = Depends(database.get_async_db),
+    current_user: auth.Principal = Depends(auth.get_current_user_async)
 ):
     """Get quarterly improvement data showing one scorecard per quarter"""
-    # Verify product exists
-    product = crud.get_product_by_id(db, product_id=product_id)
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
+    # The trend window moves with the calendar, so the date is part of the ETag
+    versions = await data_versions.get_versions_async(
+        db, data_versions.PRODUCTS, data_versions.SCORECARDS
+    )
+    cached = not_modified(request, response, make_etag(request, versions, date.today()))
+    if cached:
+        return cached
     
     # Validate category
     valid_categories = ["automation", "performance", "security", "cicd"]
@@ -329,16 +875,22 @@ def get_quarterly_improvement(
             detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
         )
     
-    quarterly_data = crud.get_quarterly_improvement_data(db, product_id, category)
+    if quarters < 1:
+        raise HTTPException(status_code=400, detail="quarters must be at least 1")
     
-    return [
-        schemas.TrendData(
-            date=scorecard.date,
-            score=scorecard.score,
-            category=scorecard.category
-        )
-        for scorecard in quarterly_data
-    ]
+    async def load_quarterly():
+        # Verify product exists
+        product = await crud.get_product_by_id_async(db, product_id=product_id)
+        if not product:
+            raise HTTPException(status_code=404, detail="Product not found")
+        
+        quarterly_data = await crud.get_quarterly_improvement_data_async(db, product_id, category, quarters)
+        return trend_points(quarterly_data)
+    
+    return json_response(response, await response_cache.get_or_compute(
+        "quarterly", product_id, category, (quarters, date.today()), load_quarterly,
+        data_version=versions[data_versions.SCORECARDS]
+    ))
 
 
 if __name__ == "__main__":
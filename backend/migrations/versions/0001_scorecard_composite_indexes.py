@@ -0,0 +1,35 @@
+"""Add composite indexes for scorecard trend and listing queries
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tables may already carry these indexes when created through create_all
+    op.create_index(
+        "ix_scorecards_product_category_date",
+        "scorecards",
+        ["product_id", "category", "date", "score"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_scorecards_category_date",
+        "scorecards",
+        ["category", "date"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scorecards_category_date", table_name="scorecards")
+    op.drop_index("ix_scorecards_product_category_date", table_name="scorecards")
@@ -0,0 +1,34 @@
+"""Add indexes for keyset pagination of products and scorecards
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_products_created_at_id",
+        "products",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_scorecards_date_id",
+        "scorecards",
+        ["date", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scorecards_date_id", table_name="scorecards")
+    op.drop_index("ix_products_created_at_id", table_name="products")
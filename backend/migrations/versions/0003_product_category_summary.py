@@ -0,0 +1,74 @@
+"""Add materialized product/category summary table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+# Latest scorecard per (product, category) joined to its running statistics;
+# same tie-break as summary.rebuild_summaries (latest date, then latest insert)
+BACKFILL = """
+INSERT INTO product_category_summary (
+    product_id, category, latest_score, latest_date, scorecard_count,
+    mean_score, min_score, max_score, updated_at
+)
+SELECT stats.product_id, stats.category, ranked.score, ranked.date,
+       stats.scorecard_count, stats.mean_score, stats.min_score, stats.max_score,
+       CURRENT_TIMESTAMP
+FROM (
+    SELECT product_id, category, COUNT(*) AS scorecard_count, AVG(score) AS mean_score,
+           MIN(score) AS min_score, MAX(score) AS max_score
+    FROM scorecards
+    GROUP BY product_id, category
+) AS stats
+JOIN (
+    SELECT product_id, category, score, date,
+           ROW_NUMBER() OVER (
+               PARTITION BY product_id, category ORDER BY date DESC, id DESC
+           ) AS latest_rank
+    FROM scorecards
+) AS ranked
+  ON ranked.product_id = stats.product_id
+ AND ranked.category = stats.category
+ AND ranked.latest_rank = 1
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # The table may already exist when created through create_all
+    if not sa.inspect(bind).has_table("product_category_summary"):
+        _create_table()
+
+    # Backfill from existing scorecards unless the application has already filled it
+    if bind.execute(sa.text("SELECT COUNT(*) FROM product_category_summary")).scalar() == 0:
+        op.execute(BACKFILL)
+
+
+def _create_table() -> None:
+    op.create_table(
+        "product_category_summary",
+        sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), primary_key=True),
+        sa.Column("category", sa.String(), primary_key=True),
+        sa.Column("latest_score", sa.Float(), nullable=False),
+        sa.Column("latest_date", sa.Date(), nullable=False),
+        sa.Column("scorecard_count", sa.Integer(), nullable=False),
+        sa.Column("mean_score", sa.Float(), nullable=False),
+        sa.Column("min_score", sa.Float(), nullable=False),
+        sa.Column("max_score", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("product_category_summary")
@@ -0,0 +1,31 @@
+"""Add per-table data version counters for ETags
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The table may already exist when created through create_all
+    if sa.inspect(op.get_bind()).has_table("data_versions"):
+        return
+
+    op.create_table(
+        "data_versions",
+        sa.Column("table_name", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("data_versions")
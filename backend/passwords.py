@@ -0,0 +1,78 @@
+"""
+Password hashing for StackHealth Scorecard Platform
+Runs bcrypt in a bounded process pool so logins never tie up the request threadpool
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from passlib.context import CryptContext
+
+# Password pool configuration (workers + queue limit = maximum in-flight operations)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "16"))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plaintext password against its hash"""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """Hash a password for storing"""
+    return pwd_context.hash(password)
+
+
+class PasswordPoolSaturated(Exception):
+    """Raised when the password pool has no free worker or queue slot"""
+
+
+class PasswordPool:
+    """Bounded process pool for password hashing and verification"""
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    async def run(self, fn, *args):
+        """Run fn(*args) in the pool without blocking the event loop"""
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolSaturated()
+        try:
+            future = self._get_executor().submit(fn, *args)
+            return await asyncio.wrap_future(future)
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_pool = PasswordPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE_LIMIT)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the password pool"""
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the password pool"""
+    return await password_pool.run(get_password_hash, password)
@@ -1,10 +1,93 @@
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.lineplots import LinePlot
+from reportlab.graphics.widgets.markers import makeMarker
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
+import copy
 from io import BytesIO
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Sequence, Tuple
+
+# Categories covered by a portfolio report, in page order
+REPORT_CATEGORIES = ("automation", "performance", "security", "cicd")
+
+
+class ReportStyles(NamedTuple):
+    """Paragraph and table styles shared by every report"""
+    normal: ParagraphStyle
+    title: ParagraphStyle
+    subtitle: ParagraphStyle
+    section: ParagraphStyle
+    overview_table: TableStyle
+    breakdown_table: TableStyle
+
+
+def get_report_styles() -> ReportStyles:
+    """Per-report copies of the shared styles, so a report can adjust its own"""
+    return ReportStyles(*(
+        TableStyle(parent=style) if isinstance(style, TableStyle) else copy.copy(style)
+        for style in _build_report_styles()
+    ))
+
+
+@lru_cache(maxsize=None)
+def _build_report_styles() -> ReportStyles:
+    """Build the report style registry once per process"""
+    styles = getSampleStyleSheet()
+    
+    return ReportStyles(
+        normal=styles['Normal'],
+        title=ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#2c3e50'),
+            alignment=1,  # Center alignment
+            spaceAfter=20
+        ),
+        subtitle=ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#7f8c8d'),
+            alignment=1,  # Center alignment
+            spaceAfter=30
+        ),
+        section=ParagraphStyle(
+            'SectionTitle',
+            parent=styles['Heading2'],
+            fontSize=18,
+            textColor=colors.HexColor('#2c3e50'),
+            spaceBefore=20,
+            spaceAfter=10
+        ),
+        overview_table=TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7'))
+        ]),
+        breakdown_table=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
+        ])
+    )
 
 
 def generate_pdf_report(scorecard) -> bytes:
@@ -14,38 +97,14 @@ def generate_pdf_report(scorecard) -> bytes:
     buffer = BytesIO()
     
     # Create the PDF document
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=1*inch)
-    
-    # Get sample styles
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2c3e50'),
-        alignment=1,  # Center alignment
-        spaceAfter=20
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#7f8c8d'),
-        alignment=1,  # Center alignment
-        spaceAfter=30
-    )
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=1*inch, invariant=True)
     
-    section_style = ParagraphStyle(
-        'SectionTitle',
-        parent=styles['Heading2'],
-        fontSize=18,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceBefore=20,
-        spaceAfter=10
-    )
+    # Styles copied from the registry built once per process
+    report_styles = get_report_styles()
+    title_style = report_styles.title
+    subtitle_style = report_styles.subtitle
+    section_style = report_styles.section
+    normal_style = report_styles.normal
     
     # Build the PDF content
     story = []
@@ -60,20 +119,11 @@ def generate_pdf_report(scorecard) -> bytes:
         ["Product:", scorecard.product.name],
         ["Category:", scorecard.category.title()],
         ["Assessment Date:", scorecard.date.strftime("%B %d, %Y")],
-        ["Overall Score:", f"{scorecard.score:.1f}%"],
-        ["Generated On:", datetime.now().strftime("%B %d, %Y at %I:%M %p")]
+        ["Overall Score:", f"{scorecard.score:.1f}%"]
     ]
     
     overview_table = Table(overview_data, colWidths=[2*inch, 4*inch])
-    overview_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7'))
-    ]))
+    overview_table.setStyle(report_styles.overview_table)
     
     story.append(overview_table)
     story.append(Spacer(1, 20))
@@ -89,23 +139,11 @@ def generate_pdf_report(scorecard) -> bytes:
     
     for field, value in scorecard.breakdown.items():
         status = "✓ Yes" if value else "✗ No"
-        status_color = colors.green if value else colors.red
         label = field_labels.get(field, field.replace('_', ' ').title())
         breakdown_data.append([label, status, ""])
     
     breakdown_table = Table(breakdown_data, colWidths=[3*inch, 1.5*inch, 2*inch])
-    breakdown_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-    ]))
+    breakdown_table.setStyle(report_styles.breakdown_table)
     
     story.append(breakdown_table)
     story.append(Spacer(1, 20))
@@ -114,20 +152,20 @@ def generate_pdf_report(scorecard) -> bytes:
     if scorecard.feedback:
         story.append(Paragraph("Assessment Feedback", section_style))
         feedback_text = scorecard.feedback.replace('\n', '<br/>')
-        story.append(Paragraph(feedback_text, styles['Normal']))
+        story.append(Paragraph(feedback_text, normal_style))
         story.append(Spacer(1, 15))
     
     # Tool suggestions section
     if scorecard.tool_suggestions:
         story.append(Paragraph("Recommended Tools & Actions", section_style))
         suggestions_text = scorecard.tool_suggestions.replace('\n', '<br/>')
-        story.append(Paragraph(suggestions_text, styles['Normal']))
+        story.append(Paragraph(suggestions_text, normal_style))
         story.append(Spacer(1, 15))
     
     # Score interpretation
     story.append(Paragraph("Score Interpretation", section_style))
     score_interpretation = get_score_interpretation(scorecard.score)
-    story.append(Paragraph(score_interpretation, styles['Normal']))
+    story.append(Paragraph(score_interpretation, normal_style))
     
     # Build the PDF
     doc.build(story)
@@ -139,49 +177,173 @@ def generate_pdf_report(scorecard) -> bytes:
     return pdf_data
 
 
-def get_field_labels(category: str) -> dict:
-    """Get human-readable labels for scorecard fields"""
-    labels = {
-        "security": {
-            "sast": "Static Application Security Testing (SAST)",
-            "dast": "Dynamic Application Security Testing (DAST)", 
-            "sast_dast_in_ci": "Security Testing Integrated in CI/CD",
-            "triaging_findings": "Security Findings Triaged & Remediated",
-            "secrets_scanning": "Secrets Scanning in CI",
-            "sca_tool_used": "Software Composition Analysis (SCA) Tool",
-            "cve_alerts": "Critical CVE Auto-Alerts",
-            "pr_enforcement": "Dependency Scanning in Pull Requests",
-            "training": "Developer Security Training",
-            "threat_modeling": "Threat Modeling Process",
-            "bug_bounty_policy": "Bug Bounty or Disclosure Policy",
-            "compliance": "Compliance Standards (SOC2, FedRAMP, etc.)",
-            "secure_design_reviews": "Security in Design Reviews",
-            "predeployment_threat_modeling": "Pre-deployment Threat Modeling"
-        },
-        "automation": {
-            "ci_pipeline": "Continuous Integration Pipeline",
-            "automated_testing": "Automated Testing Suite",
-            "deployment_automation": "Automated Deployment Process",
-            "monitoring_alerts": "Automated Monitoring & Alerts",
-            "infrastructure_as_code": "Infrastructure as Code"
-        },
-        "performance": {
-            "load_testing": "Load Testing Implementation",
-            "performance_monitoring": "Performance Monitoring Tools",
-            "caching_strategy": "Caching Strategy Implementation",
-            "database_optimization": "Database Performance Optimization",
-            "cdn_usage": "Content Delivery Network Usage"
-        },
-        "cicd": {
-            "automated_builds": "Automated Build Process",
-            "automated_tests": "Automated Testing in Pipeline",
-            "code_quality_gates": "Code Quality Gates",
-            "deployment_pipeline": "Deployment Pipeline",
-            "rollback_strategy": "Rollback Strategy",
-            "environment_parity": "Environment Parity"
-        }
+
+def generate_portfolio_report(portfolio) -> bytes:
+    """Generate a multi-page PDF covering every category of a product"""
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=1*inch, invariant=True)
+    
+    report_styles = get_report_styles()
+    title_style = report_styles.title
+    subtitle_style = report_styles.subtitle
+    section_style = report_styles.section
+    normal_style = report_styles.normal
+    
+    story = []
+    
+    # Cover page: latest score and change per category
+    story.append(Paragraph("Software Portfolio Report", title_style))
+    story.append(Paragraph(f"{portfolio.product.name} - All Categories", subtitle_style))
+    story.append(Spacer(1, 12))
+    
+    summary_data = [["Category", "Latest Score", "Rating", "Change", "Assessments"]]
+    for series in portfolio.categories:
+        if not series.points:
+            summary_data.append([series.category.title(), "-", "Not assessed", "-", "0"])
+            continue
+        latest = series.points[-1][1]
+        change = latest - series.points[0][1]
+        summary_data.append([
+            series.category.title(),
+            f"{latest:.1f}%",
+            get_score_rating(latest),
+            f"{change:+.1f}%",
+            str(len(series.points))
+        ])
+    
+    summary_table = Table(summary_data, colWidths=[1.5*inch, 1.2*inch, 1.6*inch, 1*inch, 1.2*inch])
+    summary_table.setStyle(report_styles.breakdown_table)
+    story.append(summary_table)
+    story.append(Spacer(1, 20))
+    # Dated from the data itself, so a cached artifact never shows a stale render time
+    assessed = [point_date for series in portfolio.categories for point_date, _ in series.points]
+    if assessed:
+        story.append(Paragraph(f"Data As Of: {max(assessed).strftime('%B %d, %Y')}", normal_style))
+    
+    # One page per category with its trend chart and latest commentary
+    for series in portfolio.categories:
+        story.append(PageBreak())
+        story.append(Paragraph(f"{series.category.title()} Assessment", section_style))
+        
+        if not series.points:
+            story.append(Paragraph("No assessments recorded in this period.", normal_style))
+            continue
+        
+        story.append(Paragraph("Score Trend", section_style))
+        story.append(build_trend_chart(series.points))
+        story.append(Spacer(1, 20))
+        
+        if series.feedback:
+            story.append(Paragraph("Latest Assessment Feedback", section_style))
+            story.append(Paragraph(series.feedback.replace('\n', '<br/>'), normal_style))
+            story.append(Spacer(1, 15))
+        
+        if series.tool_suggestions:
+            story.append(Paragraph("Recommended Tools & Actions", section_style))
+            story.append(Paragraph(series.tool_suggestions.replace('\n', '<br/>'), normal_style))
+            story.append(Spacer(1, 15))
+        
+        story.append(Paragraph("Score Interpretation", section_style))
+        story.append(Paragraph(get_score_interpretation(series.points[-1][1]), normal_style))
+    
+    doc.build(story)
+    
+    pdf_data = buffer.getvalue()
+    buffer.close()
+    
+    return pdf_data
+
+
+def build_trend_chart(
+    points: Sequence[Tuple[date, float]],
+    width: float = 6*inch,
+    height: float = 2.75*inch
+) -> Drawing:
+    """Draw a score-over-time line chart (dates on x, 0-100% on y)"""
+    drawing = Drawing(width, height)
+    
+    chart = LinePlot()
+    chart.x = 40
+    chart.y = 30
+    chart.width = width - 60
+    chart.height = height - 50
+    chart.data = [[(point_date.toordinal(), score) for point_date, score in points]]
+    chart.lines[0].strokeColor = colors.HexColor('#2980b9')
+    chart.lines[0].strokeWidth = 2
+    chart.lines[0].symbol = makeMarker('FilledCircle', size=4)
+    
+    chart.yValueAxis.valueMin = 0
+    chart.yValueAxis.valueMax = 100
+    chart.yValueAxis.valueStep = 20
+    chart.yValueAxis.labelTextFormat = '%d%%'
+    
+    # Pad the x range so a single assessment still gets a visible axis
+    first, last = points[0][0].toordinal(), points[-1][0].toordinal()
+    padding = max((last - first) // 20, 15)
+    chart.xValueAxis.valueMin = first - padding
+    chart.xValueAxis.valueMax = last + padding
+    chart.xValueAxis.labelTextFormat = lambda ordinal: date.fromordinal(int(ordinal)).strftime('%b %Y')
+    chart.xValueAxis.labels.fontSize = 8
+    
+    drawing.add(chart)
+    drawing.add(String(
+        width - 20, height - 12, f"Latest: {points[-1][1]:.1f}%",
+        textAnchor='end', fontName='Helvetica-Bold', fontSize=10
+    ))
+    return drawing
+
+
+# Human-readable labels for scorecard fields, shared read-only across reports
+_FIELD_LABELS = {
+    "security": {
+        "sast": "Static Application Security Testing (SAST)",
+        "dast": "Dynamic Application Security Testing (DAST)", 
+        "sast_dast_in_ci": "Security Testing Integrated in CI/CD",
+        "triaging_findings": "Security Findings Triaged & Remediated",
+        "secrets_scanning": "Secrets Scanning in CI",
+        "sca_tool_used": "Software Composition Analysis (SCA) Tool",
+        "cve_alerts": "Critical CVE Auto-Alerts",
+        "pr_enforcement": "Dependency Scanning in Pull Requests",
+        "training": "Developer Security Training",
+        "threat_modeling": "Threat Modeling Process",
+        "bug_bounty_policy": "Bug Bounty or Disclosure Policy",
+        "compliance": "Compliance Standards (SOC2, FedRAMP, etc.)",
+        "secure_design_reviews": "Security in Design Reviews",
+        "predeployment_threat_modeling": "Pre-deployment Threat Modeling"
+    },
+    "automation": {
+        "ci_pipeline": "Continuous Integration Pipeline",
+        "automated_testing": "Automated Testing Suite",
+        "deployment_automation": "Automated Deployment Process",
+        "monitoring_alerts": "Automated Monitoring & Alerts",
+        "infrastructure_as_code": "Infrastructure as Code"
+    },
+    "performance": {
+        "load_testing": "Load Testing Implementation",
+        "performance_monitoring": "Performance Monitoring Tools",
+        "caching_strategy": "Caching Strategy Implementation",
+        "database_optimization": "Database Performance Optimization",
+        "cdn_usage": "Content Delivery Network Usage"
+    },
+    "cicd": {
+        "automated_builds": "Automated Build Process",
+        "automated_tests": "Automated Testing in Pipeline",
+        "code_quality_gates": "Code Quality Gates",
+        "deployment_pipeline": "Deployment Pipeline",
+        "rollback_strategy": "Rollback Strategy",
+        "environment_parity": "Environment Parity"
     }
-    return labels.get(category, {})
+}
+FIELD_LABELS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    category: MappingProxyType(labels) for category, labels in _FIELD_LABELS.items()
+})
+_NO_LABELS: Mapping[str, str] = MappingProxyType({})
+
+
+def get_field_labels(category: str) -> Mapping[str, str]:
+    """Get human-readable labels for scorecard fields"""
+    return FIELD_LABELS.get(category, _NO_LABELS)
 
 
 def get_score_interpretation(score: float) -> str:
@@ -198,117 +360,6 @@ def get_score_interpretation(score: float) -> str:
         return "🔄 <b>Needs Improvement (50-59%)</b>: Major gaps identified. Immediate action recommended."
     else:
         return "🚨 <b>Critical (0-49%)</b>: Significant deficiencies requiring urgent attention and comprehensive remediation."
-    
-    # Story list to hold PDF elements
-    story = []
-    
-    # Title
-    story.append(Paragraph(f"📊 {scorecard.project.name}", title_style))
-    story.append(Paragraph(f"Scorecard Report - {scorecard.date.strftime('%B %d, %Y')}", subtitle_style))
-    
-    # Scores section
-    story.append(Paragraph("Performance Scores", section_style))
-    
-    # Create scores table
-    scores_data = [
-        ['Area', 'Score', 'Rating'],
-        ['🤖 Automation', f"{int(scorecard.automation_score)}%", get_score_rating(scorecard.automation_score)],
-        ['⚡ Performance', f"{int(scorecard.performance_score)}%", get_score_rating(scorecard.performance_score)],
-        ['🔒 Security', f"{int(scorecard.security_score)}%", get_score_rating(scorecard.security_score)],
-        ['🔄 CI/CD', f"{int(scorecard.cicd_score)}%", get_score_rating(scorecard.cicd_score)]
-    ]
-    
-    scores_table = Table(scores_data, colWidths=[2*inch, 1*inch, 1.5*inch])
-    scores_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 11),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-    ]))
-    
-    # Add row-specific styling based on scores
-    for i, row_data in enumerate(scores_data[1:], 1):
-        score = float(row_data[1].replace('%', ''))
-        if score >= 80:
-            bg_color = colors.HexColor('#d4edda')
-        elif score >= 60:
-            bg_color = colors.HexColor('#fff3cd')
-        else:
-            bg_color = colors.HexColor('#f8d7da')
-        
-        scores_table.setStyle(TableStyle([('BACKGROUND', (1, i), (2, i), bg_color)]))
-    
-    story.append(scores_table)
-    story.append(Spacer(1, 20))
-    
-    # Feedback section
-    if scorecard.feedback:
-        story.append(Paragraph("Feedback & Recommendations", section_style))
-        
-        for feedback in scorecard.feedback:
-            # Create feedback table for each item
-            feedback_data = [
-                ['Area:', feedback.area.title()],
-            ]
-            
-            if feedback.comment:
-                feedback_data.append(['Comment:', feedback.comment])
-            
-            if feedback.tool_recommendation:
-                feedback_data.append(['Tools:', feedback.tool_recommendation])
-            
-            if feedback.marked_for_improvement:
-                feedback_data.append(['Status:', '⚠️ Marked for Improvement'])
-            
-            feedback_table = Table(feedback_data, colWidths=[1.2*inch, 4.8*inch])
-            feedback_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('LEFTPADDING', (0, 0), (-1, -1), 8),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
-            
-            # Highlight improvement items
-            if feedback.marked_for_improvement:
-                feedback_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#fdf2f2')),
-                    ('LINEBELOW', (0, 0), (-1, -1), 2, colors.HexColor('#e74c3c'))
-                ]))
-            
-            story.append(feedback_table)
-            story.append(Spacer(1, 10))
-    
-    # Footer
-    story.append(Spacer(1, 30))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#666666'),
-        alignment=1
-    )
-    story.append(Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", footer_style))
-    story.append(Paragraph("Software Scorecard Dashboard", footer_style))
-    
-    # Build the PDF
-    doc.build(story)
-    
-    # Get the PDF bytes
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_bytes
 
 
 def get_score_rating(score: float) -> str:
@@ -0,0 +1,446 @@
+"""
+PDF render jobs for StackHealth Scorecard Platform
+Renders scorecard reports in a local process pool and caches them content-addressed on disk
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from pdf_generator import REPORT_CATEGORIES, generate_pdf_report, generate_portfolio_report
+
+logger = logging.getLogger(__name__)
+
+# PDF rendering configuration
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "./data/pdf_cache")
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", "2"))
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+PDF_CACHE_MAX_AGE_SECONDS = float(os.getenv("PDF_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+# Artifacts used this recently are never pruned, so a download in progress keeps its file
+PDF_CACHE_GRACE_SECONDS = 300
+PDF_CACHE_PRUNE_INTERVAL_SECONDS = 60
+MAX_TRACKED_JOBS = 1000
+ZIP_COPY_CHUNK_SIZE = 64 * 1024
+
+# Bump when the report layout changes so cached artifacts are re-rendered
+RENDERER_VERSION = "3"
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class ProductSnapshot(NamedTuple):
+    name: str
+
+
+class ReportSnapshot(NamedTuple):
+    """Picklable copy of everything a scorecard report renders"""
+    id: int
+    product: ProductSnapshot
+    category: str
+    date: date
+    score: float
+    breakdown: Dict[str, Any]
+    feedback: Optional[str]
+    tool_suggestions: Optional[str]
+
+
+def snapshot_scorecard(scorecard) -> ReportSnapshot:
+    """Copy the rendered fields off an ORM scorecard"""
+    return ReportSnapshot(
+        id=scorecard.id,
+        product=ProductSnapshot(name=scorecard.product.name),
+        category=scorecard.category,
+        date=scorecard.date,
+        score=scorecard.score,
+        breakdown=scorecard.breakdown,
+        feedback=scorecard.feedback,
+        tool_suggestions=scorecard.tool_suggestions
+    )
+
+
+def snapshot_row(row) -> ReportSnapshot:
+    """Build a snapshot from a crud.get_report_rows row"""
+    return ReportSnapshot(
+        id=row.id,
+        product=ProductSnapshot(name=row.product_name),
+        category=row.category,
+        date=row.date,
+        score=row.score,
+        breakdown=row.breakdown,
+        feedback=row.feedback,
+        tool_suggestions=row.tool_suggestions
+    )
+
+
+class CategorySeries(NamedTuple):
+    """One category of a portfolio report: its trend plus the latest commentary"""
+    category: str
+    points: Tuple[Tuple[date, float], ...]
+    feedback: Optional[str]
+    tool_suggestions: Optional[str]
+
+
+class PortfolioSnapshot(NamedTuple):
+    """Picklable copy of everything a product portfolio report renders"""
+    product_id: int
+    product: ProductSnapshot
+    categories: Tuple[CategorySeries, ...]
+
+
+def snapshot_portfolio(product, rows) -> PortfolioSnapshot:
+    """Group crud.get_portfolio_rows rows into one series per report category"""
+    points = {category: [] for category in REPORT_CATEGORIES}
+    latest = {}
+    for row in rows:
+        points.setdefault(row.category, []).append((row.date, row.score))
+        # Rows are date-ordered, so the last one per category is the latest
+        latest[row.category] = row
+
+    categories = []
+    for category, category_points in points.items():
+        row = latest.get(category)
+        categories.append(CategorySeries(
+            category=category,
+            points=tuple(category_points),
+            feedback=row.feedback if row else None,
+            tool_suggestions=row.tool_suggestions if row else None
+        ))
+    return PortfolioSnapshot(
+        product_id=product.id,
+        product=ProductSnapshot(name=product.name),
+        categories=tuple(categories)
+    )
+
+
+def _digest(*inputs: Any) -> str:
+    encoded = json.dumps([RENDERER_VERSION, *inputs], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+
+def artifact_path(snapshot: ReportSnapshot) -> str:
+    """Content-addressed artifact path: scorecard id plus a hash of the rendered inputs"""
+    digest = _digest(
+        snapshot.product.name, snapshot.category, snapshot.date.isoformat(),
+        snapshot.score, snapshot.breakdown, snapshot.feedback, snapshot.tool_suggestions
+    )
+    return os.path.join(PDF_CACHE_DIR, f"scorecard-{snapshot.id}-{digest}.pdf")
+
+
+def portfolio_artifact_path(snapshot: PortfolioSnapshot) -> str:
+    """Content-addressed artifact path for a product portfolio report"""
+    digest = _digest(snapshot.product.name, snapshot.categories)
+    return os.path.join(PDF_CACHE_DIR, f"portfolio-{snapshot.product_id}-{digest}.pdf")
+
+
+def _write_atomically(path: str, pdf_data: bytes) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pdf_data)
+    os.replace(tmp_path, path)
+    return path
+
+
+def prune_cache(
+    cache_dir: Optional[str] = None,
+    max_bytes: int = PDF_CACHE_MAX_BYTES,
+    max_age_seconds: float = PDF_CACHE_MAX_AGE_SECONDS
+) -> int:
+    """Delete artifacts unused for max_age_seconds, then least recently used ones over max_bytes.
+
+    Superseded artifacts (edited or rescored scorecards) are never requested
+    again, so they age out here. Returns the number of files removed.
+    """
+    now = time.time()
+    artifacts = []
+    try:
+        with os.scandir(cache_dir or PDF_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pdf") and entry.is_file():
+                    stat = entry.stat()
+                    artifacts.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+    except FileNotFoundError:
+        return 0
+
+    artifacts.sort()
+    total = sum(size for _, size, _ in artifacts)
+    removed = 0
+    for used_at, size, path in artifacts:
+        if now - used_at < PDF_CACHE_GRACE_SECONDS:
+            break
+        if total <= max_bytes and now - used_at < max_age_seconds:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def _mark_used(path: str) -> None:
+    """Record a cache hit in the access time, leaving the render time alone"""
+    try:
+        os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns))
+    except FileNotFoundError:
+        pass
+
+
+def render_to_file(snapshot: ReportSnapshot, path: str) -> str:
+    """Render a report and atomically move it into place (runs in a worker process)"""
+    return _write_atomically(path, generate_pdf_report(snapshot))
+
+
+def render_portfolio_to_file(snapshot: PortfolioSnapshot, path: str) -> str:
+    """Render a portfolio report and atomically move it into place (runs in a worker process)"""
+    return _write_atomically(path, generate_portfolio_report(snapshot))
+
+
+class PdfJob:
+    """A tracked render job"""
+
+    def __init__(self, scorecard_id: Optional[int], path: str, future: Optional[Future] = None):
+        self.id = uuid.uuid4().hex
+        self.scorecard_id = scorecard_id
+        self.path = path
+        self.future = future
+
+    @property
+    def status(self) -> str:
+        if self.future is None:
+            return DONE
+        if not self.future.done():
+            return PENDING
+        return FAILED if self.error else DONE
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.future is None or not self.future.done():
+            return None
+        if self.future.cancelled():
+            return "Render cancelled"
+        exception = self.future.exception()
+        return str(exception) if exception is not None else None
+
+
+class PdfRenderQueue:
+    """Process-pool render queue that deduplicates in-flight renders per artifact"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: "OrderedDict[str, PdfJob]" = OrderedDict()
+        self._in_flight: Dict[str, PdfJob] = {}
+        self._next_prune = 0.0
+        # Reentrant: done callbacks run inline when a render finishes before submit returns
+        self._lock = threading.RLock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _start(self, render, snapshot, path: str, scorecard_id: Optional[int]) -> PdfJob:
+        """Start render(snapshot, path) unless the artifact is cached or already being rendered.
+
+        Callers hold the lock.
+        """
+        job = self._in_flight.get(path)
+        if job is not None and not job.future.done():
+            return job
+
+        if os.path.exists(path):
+            _mark_used(path)
+            return PdfJob(scorecard_id, path)
+
+        future = self._get_executor().submit(render, snapshot, path)
+        job = PdfJob(scorecard_id, path, future)
+        self._in_flight[path] = job
+        future.add_done_callback(lambda _, path=path: self._finish(path))
+        return job
+
+    def start(self, snapshot: ReportSnapshot) -> PdfJob:
+        """Queue a scorecard render for a caller that awaits it itself, without tracking it"""
+        with self._lock:
+            return self._start(render_to_file, snapshot, artifact_path(snapshot), snapshot.id)
+
+    def submit(self, snapshot: ReportSnapshot) -> PdfJob:
+        """Queue a scorecard render and track it for polling"""
+        with self._lock:
+            job = self.start(snapshot)
+            self._jobs[job.id] = job
+            while len(self._jobs) > MAX_TRACKED_JOBS:
+                self._jobs.popitem(last=False)
+            return job
+
+    def _finish(self, path: str) -> None:
+        with self._lock:
+            self._in_flight.pop(path, None)
+            prune = time.monotonic() >= self._next_prune
+            if prune:
+                self._next_prune = time.monotonic() + PDF_CACHE_PRUNE_INTERVAL_SECONDS
+        if prune:
+            # New artifacts are the only thing that grows the cache, so bound it as they land
+            try:
+                prune_cache()
+            except OSError as e:
+                logger.warning(f"Failed to prune PDF cache: {e}")
+
+    def get(self, job_id: str) -> Optional[PdfJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    async def render(self, snapshot: ReportSnapshot) -> str:
+        """Return the artifact path, rendering it in the pool if it is not cached"""
+        job = self.start(snapshot)
+        if job.future is not None:
+            await asyncio.wrap_future(job.future)
+        return job.path
+
+    async def render_portfolio(self, snapshot: PortfolioSnapshot) -> str:
+        """Return the portfolio artifact path, rendering it in the pool if it is not cached"""
+        with self._lock:
+            job = self._start(
+                render_portfolio_to_file, snapshot, portfolio_artifact_path(snapshot), None
+            )
+        if job.future is not None:
+            await asyncio.wrap_future(job.future)
+        return job.path
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+render_queue = PdfRenderQueue(PDF_RENDER_WORKERS)
+
+
+class _ZipStream(io.RawIOBase):
+    """Unseekable sink that hands written ZIP bytes back to the caller in chunks"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def export_entry_name(snapshot: ReportSnapshot) -> str:
+    product = re.sub(r"[^A-Za-z0-9._-]+", "_", snapshot.product.name).strip("_") or "product"
+    return f"{product}/{snapshot.category}_{snapshot.date}_{snapshot.id}.pdf"
+
+
+def _open_entry(archive: zipfile.ZipFile, name: str, path: str):
+    pdf = open(path, "rb")
+    try:
+        return archive.open(name, "w"), pdf
+    except BaseException:
+        pdf.close()
+        raise
+
+
+def _copy_chunk(pdf, entry) -> bool:
+    chunk = pdf.read(ZIP_COPY_CHUNK_SIZE)
+    if not chunk:
+        return False
+    entry.write(chunk)
+    return True
+
+
+def _close_entry(entry, pdf) -> None:
+    try:
+        entry.close()
+    finally:
+        pdf.close()
+
+
+async def _next_snapshot(snapshots: AsyncIterator[ReportSnapshot]) -> Optional[ReportSnapshot]:
+    try:
+        return await snapshots.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def stream_reports_zip(
+    snapshots: AsyncIterator[ReportSnapshot],
+    queue: Optional[PdfRenderQueue] = None,
+    window: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Render reports in parallel and stream them into a ZIP archive in input order.
+
+    Snapshots are pulled lazily, at most ``window`` renders are in flight, and each
+    finished PDF is copied from its cached artifact in chunks, so memory stays
+    bounded regardless of export size. Export renders are not tracked for polling,
+    so a large export cannot evict the jobs clients are waiting on.
+    """
+    queue = queue or render_queue
+    window = window or queue.workers * 2
+    stream = _ZipStream()
+    archive = zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED)  # PDFs are already compressed
+    failures = []
+
+    pending = deque()
+    while len(pending) < window:
+        snapshot = await _next_snapshot(snapshots)
+        if snapshot is None:
+            break
+        pending.append((snapshot, queue.start(snapshot)))
+
+    while pending:
+        snapshot, job = pending.popleft()
+        try:
+            if job.future is not None:
+                await asyncio.wrap_future(job.future)
+        except Exception as e:
+            logger.error(f"Failed to render PDF for scorecard {snapshot.id}: {e}")
+            failures.append(f"{export_entry_name(snapshot)}: {e}")
+            job = None
+
+        # Keep the window full while this entry is copied out
+        next_snapshot = await _next_snapshot(snapshots)
+        if next_snapshot is not None:
+            pending.append((next_snapshot, queue.start(next_snapshot)))
+
+        if job is None:
+            continue
+        # File reads and ZIP writes (CRC, headers) run in the threadpool, one chunk per call
+        entry, pdf = await run_in_threadpool(_open_entry, archive, export_entry_name(snapshot), job.path)
+        try:
+            while await run_in_threadpool(_copy_chunk, pdf, entry):
+                yield stream.drain()
+        finally:
+            await run_in_threadpool(_close_entry, entry, pdf)
+        yield stream.drain()
+
+    if failures:
+        archive.writestr("ERRORS.txt", "\n".join(failures) + "\n")
+    await run_in_threadpool(archive.close)
+    yield stream.drain()
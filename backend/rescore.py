@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Bulk rescoring of historical scorecards for StackHealth Scorecard Platform
+Recomputes stored scores, feedback and tool suggestions after rubric weights change
+"""
+
+import argparse
+import logging
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+import crud
+import data_versions
+import database
+import scoring
+import summary
+from response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+_scorecards = database.Scorecard.__table__
+
+
+class RescoreCounts(NamedTuple):
+    """Rows rewritten, and rows left unchanged because their feedback could not be generated"""
+    rescored: int
+    skipped: int
+
+
+def weight_vector(rubric: scoring.Rubric) -> np.ndarray:
+    """Build the per-column weight vector for a compiled rubric"""
+    return np.array(
+        [1 if entry.kind == scoring.ORDINAL else entry.weight for _, entry in rubric.fields],
+        dtype=np.float64
+    )
+
+
+def encode_breakdowns(
+    breakdowns: List[Dict[str, Any]],
+    rubric: scoring.Rubric
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode breakdowns into an (rows x fields) value matrix and presence mask.
+
+    Boolean fields encode as 1 when the practice is present, penalty fields as 1
+    when the anti-pattern is present, and ordinal fields as their mapped points.
+    """
+    values = np.zeros((len(breakdowns), len(rubric.fields)), dtype=np.float64)
+    present = np.zeros(values.shape, dtype=bool)
+
+    for row, breakdown in enumerate(breakdowns):
+        for col, (field, entry) in enumerate(rubric.fields):
+            if field not in breakdown:
+                continue
+            value = breakdown[field]
+            present[row, col] = True
+            if entry.kind == scoring.ORDINAL:
+                values[row, col] = entry.values.get(value, 0)
+            elif entry.kind == scoring.PENALTY:
+                values[row, col] = 0 if value else 1
+            else:
+                values[row, col] = 1 if value else 0
+
+    return values, present
+
+
+def score_matrix(values: np.ndarray, present: np.ndarray, rubric: scoring.Rubric) -> List[float]:
+    """Score an encoded chunk with a single matrix-weight-vector product"""
+    totals = values @ weight_vector(rubric)
+    percentages = np.maximum(totals / rubric.max_score * 100, 0)
+    percentages[~present.any(axis=1)] = 0.0
+    # Round in Python so results match scoring.score exactly
+    return [round(float(percentage), 2) for percentage in percentages]
+
+
+def rescore_category(
+    db: Session,
+    category: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> RescoreCounts:
+    """Rescore every stored scorecard in a category, streaming in id-ordered chunks.
+
+    A row whose feedback cannot be generated (a malformed breakdown) is logged
+    and skipped, so it cannot abort a rescore whose earlier chunks are committed.
+    """
+    rubric = scoring.get_rubric(category)
+    update_stmt = (
+        update(_scorecards)
+        .where(_scorecards.c.id == bindparam("_id"))
+        .values(
+            score=bindparam("_score"),
+            feedback=bindparam("_feedback"),
+            tool_suggestions=bindparam("_tool_suggestions")
+        )
+    )
+
+    last_id = 0
+    rescored = 0
+    skipped = 0
+    while True:
+        rows = db.execute(
+            select(_scorecards.c.id, _scorecards.c.breakdown)
+            .where(_scorecards.c.category == category, _scorecards.c.id > last_id)
+            .order_by(_scorecards.c.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+
+        breakdowns = [row.breakdown or {} for row in rows]
+        values, present = encode_breakdowns(breakdowns, rubric)
+        scores = score_matrix(values, present, rubric)
+
+        params = []
+        for row, breakdown, score in zip(rows, breakdowns, scores):
+            try:
+                feedback, tool_suggestions = crud.generate_feedback_and_suggestions(
+                    breakdown, category, score
+                )
+            except Exception as e:
+                logger.warning(f"Skipping {category} scorecard {row.id}: {e}")
+                skipped += 1
+                continue
+            params.append({
+                "_id": row.id,
+                "_score": score,
+                "_feedback": feedback,
+                "_tool_suggestions": tool_suggestions
+            })
+
+        if params:
+            db.connection().execute(update_stmt, params)
+            data_versions.bump(db, data_versions.SCORECARDS)
+            db.commit()
+
+        rescored += len(params)
+        last_id = rows[-1].id
+        logger.info(f"Rescored {rescored} {category} scorecards")
+
+    # Stored scores changed, so the materialized summary and cached trends must follow
+    summary.rebuild_summaries(db, category=category)
+    response_cache.invalidate_category(category)
+    return RescoreCounts(rescored, skipped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rescore stored scorecards with the current rubric")
+    parser.add_argument("--category", required=True, choices=sorted(scoring.CATEGORY_WEIGHTS))
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    db = database.SessionLocal()
+    try:
+        counts = rescore_category(db, args.category, chunk_size=args.chunk_size)
+        logger.info(
+            f"Rescoring completed: {counts.rescored} {args.category} scorecards updated, "
+            f"{counts.skipped} skipped"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,320 @@
+"""
+Response cache for StackHealth Scorecard Platform
+Caches trend aggregations per (product, category) with write-through invalidation
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+from fastapi.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+# "memory://" keeps a per-worker LRU; "redis://host:port/db" shares entries
+# between workers; an empty value disables the cache
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "memory://")
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+# How long a worker may hold the compute lock for one key before others give up waiting
+RESPONSE_CACHE_LOCK_SECONDS = float(os.getenv("RESPONSE_CACHE_LOCK_SECONDS", "5"))
+
+KEY_PREFIX = "stackhealth:cache:"
+LOCK_POLL_SECONDS = 0.05
+
+
+class MemoryBackend:
+    """Thread-safe TTL + LRU store for a single worker process.
+
+    Generation counters live outside the LRU so eviction can never reset them
+    and resurrect entries written under an older generation.
+    """
+
+    name = "memory"
+    blocking = False
+    shared = False
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._memory_bytes += len(key) + len(value)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._memory_bytes -= len(key) + len(value)
+
+    def get_counters(self, keys: List[str]) -> List[int]:
+        with self._lock:
+            return [self._counters.get(key, 0) for key in keys]
+
+    def incr(self, key: str) -> None:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+    def acquire(self, key: str, ttl_seconds: float) -> bool:
+        # In-process callers are already coalesced by ResponseCache
+        return True
+
+    def release(self, key: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "memory_bytes": self._memory_bytes}
+
+
+class RedisBackend:
+    """Store shared by every worker through a Redis-compatible server"""
+
+    name = "redis"
+    blocking = True
+    shared = True
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("RESPONSE_CACHE_URL uses redis but the redis package is not installed") from exc
+        return cls(redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.client.set(key, value, px=int(ttl_seconds * 1000))
+
+    def get_counters(self, keys: List[str]) -> List[int]:
+        return [int(value or 0) for value in self.client.mget(keys)]
+
+    def incr(self, key: str) -> None:
+        self.client.incr(key)
+
+    def acquire(self, key: str, ttl_seconds: float) -> bool:
+        return bool(self.client.set(key, b"1", nx=True, px=int(ttl_seconds * 1000)))
+
+    def release(self, key: str) -> None:
+        self.client.delete(key)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{KEY_PREFIX}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": sum(1 for _ in self.client.scan_iter(match=f"{KEY_PREFIX}entry:*")),
+            "memory_bytes": int(self.client.info("memory").get("used_memory", 0))
+        }
+
+
+class ResponseCache:
+    """Cache of JSON-ready endpoint results scoped to one (product, category) pair.
+
+    Keys embed a generation counter for the pair and one for its category, so a
+    write invalidates every cached window of that pair with a single increment,
+    on whichever backend, without scanning keys. Concurrent misses for the same
+    key are computed once per worker, and once across workers when the backend
+    is shared.
+
+    A per-worker backend never sees invalidations made by other workers, so its
+    keys also carry the caller's data version (the scorecards table version
+    that the ETag is built from): a write anywhere makes every worker recompute
+    instead of serving an old body under a new ETag.
+    """
+
+    def __init__(self, backend, ttl_seconds: float, lock_seconds: float = RESPONSE_CACHE_LOCK_SECONDS):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+
+    async def _call(self, method, *args):
+        if self.backend.blocking:
+            return await run_in_threadpool(method, *args)
+        return method(*args)
+
+    @staticmethod
+    def _generation_keys(product_id: int, category: str) -> List[str]:
+        return [f"{KEY_PREFIX}gen:{category}", f"{KEY_PREFIX}gen:{category}:{product_id}"]
+
+    async def _entry_key(
+        self, namespace: str, product_id: int, category: str, params: tuple, data_version: int
+    ) -> str:
+        generations = await self._call(self.backend.get_counters, self._generation_keys(product_id, category))
+        parts = [namespace, category, product_id, *generations, *params]
+        if not self.backend.shared:
+            parts.append(data_version)
+        return f"{KEY_PREFIX}entry:" + ":".join(str(part) for part in parts)
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        product_id: int,
+        category: str,
+        params: tuple,
+        compute: Callable[[], Awaitable[Any]],
+        data_version: int = 0
+    ) -> Any:
+        """Return the cached value for the key, computing and storing it on a miss.
+
+        compute must return a JSON-serializable value. Backend errors fall back
+        to computing the value uncached.
+        """
+        try:
+            key = await self._entry_key(namespace, product_id, category, params, data_version)
+            cached = await self._call(self.backend.get, key)
+        except Exception as exc:
+            logger.warning(f"Response cache unavailable: {exc}")
+            return await compute()
+        if cached is not None:
+            self.hits += 1
+            return json.loads(cached)
+        self.misses += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._fill(key, compute)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception retrieved when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _fill(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Compute a missed key, letting only one worker at a time aggregate it"""
+        lock_key = f"{key}:lock"
+        try:
+            acquired = await self._call(self.backend.acquire, lock_key, self.lock_seconds)
+            deadline = time.monotonic() + self.lock_seconds
+            while not acquired and time.monotonic() < deadline:
+                # Another worker is computing this key; wait for its result
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+                cached = await self._call(self.backend.get, key)
+                if cached is not None:
+                    self.coalesced += 1
+                    return json.loads(cached)
+                acquired = await self._call(self.backend.acquire, lock_key, self.lock_seconds)
+        except Exception as exc:
+            logger.warning(f"Response cache unavailable: {exc}")
+            return await compute()
+
+        try:
+            value = await compute()
+            try:
+                await self._call(self.backend.set, key, json.dumps(value).encode(), self.ttl_seconds)
+            except Exception as exc:
+                logger.warning(f"Response cache unavailable: {exc}")
+            return value
+        finally:
+            if acquired:
+                try:
+                    await self._call(self.backend.release, lock_key)
+                except Exception as exc:
+                    logger.warning(f"Response cache unavailable: {exc}")
+
+    def invalidate(self, product_id: int, category: str) -> None:
+        """Drop every cached entry of one (product, category) pair"""
+        self._incr(self._generation_keys(product_id, category)[1])
+
+    def invalidate_category(self, category: str) -> None:
+        """Drop every cached entry of a category, for all products"""
+        self._incr(self._generation_keys(0, category)[0])
+
+    def _incr(self, key: str) -> None:
+        try:
+            self.backend.incr(key)
+        except Exception as exc:
+            # The write is committed; entries of this pair age out with the TTL
+            logger.warning(f"Response cache invalidation failed: {exc}")
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        stats = {
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+        try:
+            stats.update(self.backend.stats())
+        except Exception as exc:
+            stats["error"] = str(exc)
+        return stats
+
+
+def build_response_cache(url: str = RESPONSE_CACHE_URL) -> ResponseCache:
+    """Build the cache for a RESPONSE_CACHE_URL; an empty URL disables storage"""
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        backend = RedisBackend.from_url(url)
+    elif url in ("", "none"):
+        backend = MemoryBackend(max_entries=0)
+    elif url.startswith("memory://"):
+        backend = MemoryBackend(RESPONSE_CACHE_MAX_ENTRIES)
+    else:
+        raise ValueError(f"Unsupported RESPONSE_CACHE_URL: {url}")
+    return ResponseCache(backend, RESPONSE_CACHE_TTL_SECONDS)
+
+
+response_cache = build_response_cache()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Literal
 from datetime import date, datetime
 
 
@@ -172,13 +172,20 @@ class Scorecard(ScorecardBase):
 
 
 # Response schemas
-class ScorecardWithProduct(BaseModel):
+# Lightweight scorecard row for list views (GET /scorecards?fields=summary)
+class ScorecardSummary(BaseModel):
     id: int
     product_id: int
     product_name: str
     category: str
     date: date
     score: float
+
+    class Config:
+        from_attributes = True
+
+
+class ScorecardWithProduct(ScorecardSummary):
     breakdown: Dict[str, Any]
     feedback: Optional[str] = None
     tool_suggestions: Optional[str] = None
@@ -192,3 +199,74 @@ class TrendData(BaseModel):
     date: date
     score: float
     category: str
+
+
+class TrendSeriesKey(BaseModel):
+    product_id: int
+    category: str
+
+
+class TrendBatchRequest(BaseModel):
+    pairs: Union[Literal["all"], List[TrendSeriesKey]] = "all"
+    quarters: int = 4
+
+
+# Columnar series: dates[i] pairs with scores[i]
+class TrendSeries(TrendSeriesKey):
+    dates: List[date]
+    scores: List[float]
+
+
+class TrendBatchResponse(BaseModel):
+    series: List[TrendSeries]
+
+
+class ProductCategorySummary(BaseModel):
+    product_id: int
+    product_name: str
+    category: str
+    latest_score: float
+    latest_date: date
+    scorecard_count: int
+    mean_score: float
+    min_score: float
+    max_score: float
+
+    class Config:
+        from_attributes = True
+
+
+class BulkScorecardItemResult(BaseModel):
+    index: int
+    status: str  # "created" or "error"
+    id: Optional[int] = None
+    score: Optional[float] = None
+    error: Optional[str] = None
+
+
+class BulkScorecardResult(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkScorecardItemResult]
+
+
+class RescoreResult(BaseModel):
+    category: str
+    rescored: int
+    skipped: int = 0
+
+
+class PdfJob(BaseModel):
+    job_id: str
+    scorecard_id: int
+    status: str  # "pending", "done", "failed"
+    error: Optional[str] = None
+    download_url: str
+
+
+class ReportExportRequest(BaseModel):
+    product_ids: Optional[List[int]] = None
+    categories: Optional[List[str]] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    latest_only: bool = False
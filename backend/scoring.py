@@ -0,0 +1,164 @@
+"""
+Compiled scoring engine for scorecard categories.
+
+Each category rubric is compiled once at import into a flat table of
+``field -> RubricField(kind, weight, values, max)`` entries, so scoring a
+breakdown is a single pass over that table with no per-call dict building.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Field kinds
+BOOLEAN = "boolean"  # Positive weight awarded when the practice is present
+PENALTY = "penalty"  # Negative weight applied when the practice is absent
+ORDINAL = "ordinal"  # String value mapped to points through a value map
+
+# Rubric weights for independent category scoring
+CATEGORY_WEIGHTS: Dict[str, Dict[str, int]] = {
+    "security": {
+        # Static & Dynamic Testing (12 points = 40%)
+        "sast": 3, "dast": 3, "sast_dast_in_ci": 4, "triaging_findings": 2,
+        # Dependency & Secrets Management (8 points = 27%)
+        "secrets_scanning": 2, "sca_tool_used": 3, "cve_alerts": 3,
+        # Security Culture & Governance (10 points = 33%)
+        "threat_modeling": 3, "compliance": 2, "training": 2,
+        "bug_bounty_policy": 1, "security_champions": 2
+    },
+    "automation": {
+        # Test Automation Foundation (15 points = 37.5%)
+        "automated_testing": 2, "testing_framework": 3, "dedicated_environment": 2,
+        "source_controlled": 3, "quick_setup": 1, "external_updates": 2, "test_reporting": 2,
+        # Test Design & Maintenance (13 points = 32.5%)
+        "seeded_data": 2, "test_independence": -5, "data_reseeding": 3,
+        "test_subsets": 3, "rapid_updates": 2, "database_automation": 2,
+        "cross_browser_testing": 2, "parallel_execution": 2, "flakiness_management": 2,
+        # CI/CD Integration & Deployment Testing (12 points = 30%)
+        "post_deploy_sanity": 3, "sanity_independence": -2, "smoke_testing": 3,
+        "performance_integration": 2, "security_integration": 2, "notification_integration": 1,
+        "test_dashboard": 2, "automated_scheduling": 1
+    },
+    "performance": {
+        # Performance Strategy & Planning (10 points = 33%)
+        "performance_requirements": 3, "regular_testing": 2, "performance_budget": 2, "trend_analysis": 3,
+        # Testing Implementation & Tools (12 points = 40%)
+        "dedicated_tools": 2, "ci_integration": 4, "production_like_env": 3, "load_testing": 3,
+        # Monitoring & Observability (8 points = 27%)
+        "realtime_monitoring": 2, "core_metrics": 2, "resource_utilization": 1,
+        "dashboard_viz": 2, "automated_alerting": 1
+    },
+    "cicd": {
+        # DORA Metrics (20 points = 44%)
+        "deployment_frequency": 5, "lead_time": 5, "recovery_time": 5, "change_failure_rate": 5,
+        # Pipeline Foundation (15 points = 33%)
+        "automated_builds": 3, "automated_tests": 4, "code_quality_gates": 3,
+        "security_integration": 3, "artifact_management": 2,
+        # Deployment & Release Management (10 points = 23%)
+        "automated_deployment": 3, "environment_promotion": 2, "rollback_capability": 3,
+        "feature_flags": 2
+    }
+}
+
+# Maximum base score per category (bonuses can exceed this)
+CATEGORY_MAX_SCORES: Dict[str, int] = {
+    "security": 30,
+    "automation": 40,
+    "performance": 30,
+    "cicd": 45
+}
+
+DEFAULT_MAX_SCORE = 100
+
+# DORA metrics map string values to scores
+DORA_METRICS = ("deployment_frequency", "lead_time", "recovery_time", "change_failure_rate")
+DORA_SCORES: Dict[str, int] = {
+    "on-demand": 5, "daily": 4, "weekly": 2, "monthly": 1,
+    "<1hour": 5, "<1day": 4, "<1week": 2, ">1week": 1,
+    "0-5%": 5, "6-15%": 4, "16-30%": 2, ">30%": 1
+}
+DORA_MAX_SCORE = 5
+
+
+class RubricField(NamedTuple):
+    """A single compiled rubric entry"""
+    kind: str
+    weight: int
+    values: Optional[Dict[Any, int]]
+    max: int
+
+
+class Rubric(NamedTuple):
+    """A compiled category rubric"""
+    category: str
+    max_score: int
+    fields: Tuple[Tuple[str, RubricField], ...]
+
+
+def compile_rubric(category: str) -> Rubric:
+    """Compile a category's weights into a flat scoring table"""
+    fields = []
+    for field, weight in CATEGORY_WEIGHTS.get(category, {}).items():
+        if weight == 0:
+            continue
+        if category == "cicd" and field in DORA_METRICS:
+            entry = RubricField(ORDINAL, weight, DORA_SCORES, DORA_MAX_SCORE)
+        elif weight < 0:
+            entry = RubricField(PENALTY, weight, None, abs(weight))
+        else:
+            entry = RubricField(BOOLEAN, weight, None, weight)
+        fields.append((field, entry))
+
+    return Rubric(
+        category=category,
+        max_score=CATEGORY_MAX_SCORES.get(category, DEFAULT_MAX_SCORE),
+        fields=tuple(fields)
+    )
+
+
+RUBRICS: Dict[str, Rubric] = {category: compile_rubric(category) for category in CATEGORY_WEIGHTS}
+_EMPTY_RUBRIC = compile_rubric("")
+
+_MISSING = object()
+
+
+def get_rubric(category: str) -> Rubric:
+    """Get the compiled rubric for a category (empty for unknown categories)"""
+    return RUBRICS.get(category, _EMPTY_RUBRIC)
+
+
+def _score_with_rubric(breakdown: Dict[str, Any], rubric: Rubric) -> float:
+    total_weighted_score = 0
+    total_possible_score = 0
+
+    for field, entry in rubric.fields:
+        value = breakdown.get(field, _MISSING)
+        if value is _MISSING:
+            continue
+
+        if entry.kind == ORDINAL:
+            total_weighted_score += entry.values.get(value, 0)
+        elif entry.kind == PENALTY:
+            if not value:  # Anti-pattern is present
+                total_weighted_score += entry.weight
+        elif value:
+            total_weighted_score += entry.weight
+        total_possible_score += entry.max
+
+    if total_possible_score == 0:
+        return 0.0
+
+    # For categories with bonuses (automation, cicd), allow scores > 100%
+    percentage_score = (total_weighted_score / rubric.max_score) * 100
+
+    # Ensure score doesn't go below 0 due to penalties
+    return round(max(0, percentage_score), 2)
+
+
+def score(breakdown: Dict[str, Any], category: str) -> float:
+    """Calculate category score as percentage (0-100%) based on breakdown fields"""
+    return _score_with_rubric(breakdown, get_rubric(category))
+
+
+def score_many(breakdowns: Iterable[Dict[str, Any]], category: str) -> List[float]:
+    """Score a batch of breakdowns for the same category"""
+    rubric = get_rubric(category)
+    return [_score_with_rubric(breakdown, rubric) for breakdown in breakdowns]
@@ -5,6 +5,7 @@ This script creates initial admin user and sample products when the application
 """
 
 import database
+import data_versions
 import auth
 from sqlalchemy.orm import Session
 import logging
@@ -18,7 +19,7 @@ def seed_database():
     logger.info("Starting database seeding...")
     
     # Create database tables if they don't exist
-    database.Base.metadata.create_all(bind=database.engine)
+    database.create_tables()
     logger.info("Database tables created/verified")
     
     # Create database session
@@ -64,6 +65,7 @@ def seed_database():
                 )
                 db.add(product)
             
+            data_versions.bump(db, data_versions.PRODUCTS)
             db.commit()
             logger.info(f"Created {len(sample_products)} sample products")
         else:
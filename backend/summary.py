@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Materialized latest-score summary for StackHealth Scorecard Platform
+Maintains one row per product and category with the latest score and running statistics
+"""
+
+import argparse
+import logging
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.orm import Session, joinedload
+
+import database
+
+logger = logging.getLogger(__name__)
+
+_scorecards = database.Scorecard.__table__
+_summary = database.ProductCategorySummary.__table__
+
+
+class _Batch:
+    """Statistics of new scorecards for one (product, category), in insertion order"""
+
+    def __init__(self, scorecard):
+        self.latest_score = scorecard.score
+        self.latest_date = scorecard.date
+        self.count = 1
+        self.total = scorecard.score
+        self.min_score = scorecard.score
+        self.max_score = scorecard.score
+
+    def add(self, scorecard) -> None:
+        # Newer (or same-day, later-inserted) scorecards replace the latest score
+        if scorecard.date >= self.latest_date:
+            self.latest_score = scorecard.score
+            self.latest_date = scorecard.date
+        self.count += 1
+        self.total += scorecard.score
+        self.min_score = min(self.min_score, scorecard.score)
+        self.max_score = max(self.max_score, scorecard.score)
+
+
+def _fold_stmt(db: Session):
+    """Upsert that folds a batch of statistics into the summary row in one statement.
+
+    The new values are computed by the database from the row as it stands at
+    write time, so concurrent writers cannot lose each other's updates, and two
+    first writes for the same pair cannot collide on the primary key.
+    """
+    stmt = database.upsert(db, _summary)
+    new, old = stmt.excluded, _summary.c
+    newer = new.latest_date >= old.latest_date
+    count = old.scorecard_count + new.scorecard_count
+    return stmt.on_conflict_do_update(
+        index_elements=[old.product_id, old.category],
+        set_={
+            "latest_score": case((newer, new.latest_score), else_=old.latest_score),
+            "latest_date": case((newer, new.latest_date), else_=old.latest_date),
+            "scorecard_count": count,
+            "mean_score": (
+                old.mean_score * old.scorecard_count + new.mean_score * new.scorecard_count
+            ) / count,
+            "min_score": case((new.min_score < old.min_score, new.min_score), else_=old.min_score),
+            "max_score": case((new.max_score > old.max_score, new.max_score), else_=old.max_score),
+            "updated_at": new.updated_at
+        }
+    )
+
+
+def record_scorecard(db: Session, scorecard: database.Scorecard) -> None:
+    """Fold a newly created scorecard into its summary row.
+
+    Runs inside the caller's transaction; the caller commits.
+    """
+    record_scorecards(db, [scorecard])
+
+
+def record_scorecards(db: Session, scorecards: Iterable) -> None:
+    """Fold a batch of new scorecards, in insertion order, into their summary rows.
+
+    The batch is reduced to one row per (product, category) and written with a
+    single atomic upsert. Runs inside the caller's transaction; the caller commits.
+    """
+    batches = {}
+    for scorecard in scorecards:
+        key = (scorecard.product_id, scorecard.category)
+        if key in batches:
+            batches[key].add(scorecard)
+        else:
+            batches[key] = _Batch(scorecard)
+    if not batches:
+        return
+
+    updated_at = datetime.utcnow()
+    db.execute(_fold_stmt(db), [
+        {
+            "product_id": product_id,
+            "category": category,
+            "latest_score": batch.latest_score,
+            "latest_date": batch.latest_date,
+            "scorecard_count": batch.count,
+            "mean_score": batch.total / batch.count,
+            "min_score": batch.min_score,
+            "max_score": batch.max_score,
+            "updated_at": updated_at
+        }
+        for (product_id, category), batch in batches.items()
+    ])
+
+
+def get_summaries(db: Session, category: Optional[str] = None) -> List[database.ProductCategorySummary]:
+    """Get summary rows with their products, ordered by product and category"""
+    query = db.query(database.ProductCategorySummary).options(
+        joinedload(database.ProductCategorySummary.product)
+    )
+    if category:
+        query = query.filter(database.ProductCategorySummary.category == category)
+    return query.order_by(
+        database.ProductCategorySummary.product_id, database.ProductCategorySummary.category
+    ).all()
+
+
+def rebuild_summaries(db: Session, category: Optional[str] = None) -> int:
+    """Recompute summary rows from the scorecards table in one INSERT ... SELECT"""
+    group = (_scorecards.c.product_id, _scorecards.c.category)
+
+    # Latest scorecard per group (same tie-break as record_scorecard: latest insert wins)
+    ranked = select(
+        *group,
+        _scorecards.c.score,
+        _scorecards.c.date,
+        func.row_number().over(
+            partition_by=group,
+            order_by=(_scorecards.c.date.desc(), _scorecards.c.id.desc())
+        ).label("latest_rank")
+    )
+    stats = select(
+        *group,
+        func.count().label("scorecard_count"),
+        func.avg(_scorecards.c.score).label("mean_score"),
+        func.min(_scorecards.c.score).label("min_score"),
+        func.max(_scorecards.c.score).label("max_score")
+    )
+    if category:
+        ranked = ranked.where(_scorecards.c.category == category)
+        stats = stats.where(_scorecards.c.category == category)
+    ranked = ranked.subquery()
+    stats = stats.group_by(*group).subquery()
+
+    rows = select(
+        stats.c.product_id,
+        stats.c.category,
+        ranked.c.score,
+        ranked.c.date,
+        stats.c.scorecard_count,
+        stats.c.mean_score,
+        stats.c.min_score,
+        stats.c.max_score,
+        func.current_timestamp()
+    ).join(
+        ranked,
+        (ranked.c.product_id == stats.c.product_id)
+        & (ranked.c.category == stats.c.category)
+        & (ranked.c.latest_rank == 1)
+    )
+
+    clear = delete(_summary)
+    if category:
+        clear = clear.where(_summary.c.category == category)
+    db.execute(clear)
+    result = db.execute(insert(_summary).from_select(
+        [
+            "product_id", "category", "latest_score", "latest_date", "scorecard_count",
+            "mean_score", "min_score", "max_score", "updated_at"
+        ],
+        rows
+    ))
+    db.commit()
+    return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the product/category summary table")
+    parser.add_argument("--category", help="Only rebuild summaries for this category")
+    args = parser.parse_args()
+
+    db = database.SessionLocal()
+    try:
+        rebuilt = rebuild_summaries(db, category=args.category)
+        logger.info(f"Summary rebuild completed: {rebuilt} rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,15 +1,21 @@
 import pytest
 import os
 import sys
+from datetime import date, timedelta
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import app
-from database import get_db, Base
+import database
+import schemas
+from database import get_async_db, get_db, Base
+from auth import principal_cache
+from response_cache import response_cache
 
 # Test database URL
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -19,6 +25,10 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async read path on the same test database
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 def override_get_db():
     try:
@@ -28,17 +38,80 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-performance", action="store_true", default=False,
+        help="run the timing benchmarks marked performance (skipped by default)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-performance"):
+        return
+    skip_performance = pytest.mark.skip(reason="timing benchmark; pass --run-performance to run")
+    for item in items:
+        if item.get_closest_marker("performance"):
+            item.add_marker(skip_performance)
 
 
 @pytest.fixture
 def client():
     Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+    response_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+class QueryCounter:
+    """Count SQL statements executed against the sync and async test engines"""
+
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.count = 0
+        self.statements = []
+        for target in (engine, async_engine.sync_engine):
+            event.listen(target, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        for target in (engine, async_engine.sync_engine):
+            event.remove(target, "before_cursor_execute", self._before_cursor_execute)
+
+
+@pytest.fixture
+def query_counter():
+    return QueryCounter()
+
+
 @pytest.fixture
 def test_user_data():
     return {
@@ -81,3 +154,84 @@ def sample_scorecard_data():
             "sast_dast_in_ci": True
         }
     }
+
+
+# Seeding helpers shared across test modules
+
+SECURITY_FIELDS = list(schemas.SecurityScorecard.model_fields)
+
+
+def create_product(client, name="Bulk Product"):
+    """Create a product through the API and return its id"""
+    return client.post("/products", json={"name": name}).json()["id"]
+
+
+def security_item(product_id, day, passed):
+    """A security scorecard payload dated 2025-04-<day> with the first `passed` fields true"""
+    return {
+        "product_id": product_id,
+        "category": "security",
+        "date": f"2025-04-{day:02d}",
+        "breakdown": {field: i < passed for i, field in enumerate(SECURITY_FIELDS)}
+    }
+
+
+def seed_rows(count):
+    """Insert products with one scorecard each directly into the test database"""
+    db = TestingSessionLocal()
+    try:
+        for i in range(count):
+            product = database.Product(name=f"Product {i}")
+            product.scorecards.append(database.Scorecard(
+                category="security", date=date(2025, 1, 1), score=50.0, breakdown={"sast": True}
+            ))
+            db.add(product)
+        db.commit()
+    finally:
+        db.close()
+
+
+def seed_export_rows():
+    """Insert two products with three scorecards of mixed categories; returns their ids"""
+    db = TestingSessionLocal()
+    try:
+        alpha = database.Product(name="Alpha")
+        beta = database.Product(name="Beta")
+        alpha.scorecards.append(database.Scorecard(
+            category="security", date=date(2025, 1, 10), score=40.0,
+            breakdown={"sast": True, "dast": False}, feedback="Needs DAST"
+        ))
+        alpha.scorecards.append(database.Scorecard(
+            category="cicd", date=date(2025, 2, 10), score=70.0,
+            breakdown={"deployment_frequency": "daily", "automated_builds": True}
+        ))
+        beta.scorecards.append(database.Scorecard(
+            category="security", date=date(2025, 3, 10), score=90.0,
+            breakdown={"sast": True, "dast": True}
+        ))
+        db.add_all([alpha, beta])
+        db.commit()
+        return alpha.id, beta.id
+    finally:
+        db.close()
+
+
+def seed_export_history(count):
+    """Bulk insert `count` scorecards for one product straight into the test database"""
+    db = TestingSessionLocal()
+    try:
+        product = database.Product(name="Export History")
+        db.add(product)
+        db.commit()
+        breakdown = {field: True for field in ("sast", "dast", "sast_dast_in_ci", "triaging_findings")}
+        db.execute(database.Scorecard.__table__.insert(), [
+            {
+                "product_id": product.id, "category": "security", "score": 50.0,
+                "date": date(2020, 1, 1) + timedelta(days=i % 1500), "breakdown": breakdown,
+                "feedback": "✅ Good scorecard performance\n⚠️ Consider adding DAST"
+            }
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
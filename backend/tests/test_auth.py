@@ -1,5 +1,6 @@
 import pytest
-from tests.conftest import client, test_user_data
+from auth import principal_cache
+from tests.conftest import client, test_user_data, authenticated_client, query_counter
 
 
 class TestAuth:
@@ -62,3 +63,92 @@ class TestAuth:
         client.headers.update({"Authorization": "Bearer invalid_token"})
         response = client.get("/products")
         assert response.status_code == 401
+
+
+class TestPrincipalCache:
+    """Test the authenticated principal cache"""
+
+    def test_repeat_requests_skip_user_lookup(self, authenticated_client, query_counter):
+        """Test that a cached principal avoids the admin_users query"""
+        authenticated_client.get("/auth/me")
+
+        with query_counter:
+            response = authenticated_client.get("/auth/me")
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+        assert not any("admin_users" in s for s in query_counter.statements)
+
+        stats = authenticated_client.get("/health").json()["auth_cache"]
+        assert stats["hits"] >= 1
+        assert stats["misses"] >= 1
+
+    def test_admin_changes_invalidate_cache(self, authenticated_client):
+        """Test that granting admin takes effect without waiting for the TTL"""
+        user_id = authenticated_client.get("/auth/me").json()["id"]
+        assert authenticated_client.get("/auth/users").status_code == 403
+
+        response = authenticated_client.post(
+            "/auth/setup-first-admin", json={"user_id": user_id, "is_admin": True}
+        )
+        assert response.status_code == 200
+        assert authenticated_client.get("/auth/users").status_code == 200
+
+        authenticated_client.post("/auth/manage-admin", json={"user_id": user_id, "is_admin": False})
+        assert authenticated_client.get("/auth/users").status_code == 403
+
+    def test_async_endpoints_resolve_users_on_async_session(self, authenticated_client, monkeypatch):
+        """Test that async endpoints authenticate without the sync user lookup"""
+        import auth
+
+        def sync_lookup(*args, **kwargs):
+            raise AssertionError("sync session used on the async path")
+
+        principal_cache.clear()
+        monkeypatch.setattr(auth, "get_user_by_email", sync_lookup)
+        assert authenticated_client.get("/products").status_code == 200
+        assert principal_cache.stats()["misses"] == 1
+
+    def test_cache_expiry_and_eviction(self):
+        """Test TTL expiry and LRU eviction"""
+        from datetime import datetime
+        from auth import Principal, PrincipalCache
+
+        principal = Principal(1, "a@example.com", True, False, datetime.utcnow())
+        cache = PrincipalCache(ttl_seconds=-1, max_size=10)
+        cache.set("a", principal)
+        assert cache.get("a") is None
+
+        cache = PrincipalCache(ttl_seconds=60, max_size=2)
+        cache.set("a", principal)
+        cache.set("b", principal)
+        cache.get("a")
+        cache.set("c", principal)
+        assert cache.get("b") is None
+        assert cache.get("a") == principal
+
+
+class TestPasswordPool:
+    """Test bounded password hashing and verification"""
+
+    def test_login_returns_503_when_pool_saturated(self, client, test_user_data, monkeypatch):
+        """Test that logins beyond the pool's capacity are rejected instead of queued"""
+        from concurrent.futures import ThreadPoolExecutor
+        import passwords
+
+        client.post("/auth/register", json=test_user_data)
+        pool = passwords.PasswordPool(workers=1, queue_limit=0)
+        monkeypatch.setattr(passwords, "password_pool", pool)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                responses = list(executor.map(
+                    lambda _: client.post("/auth/login", json=test_user_data), range(4)
+                ))
+        finally:
+            pool.shutdown()
+
+        status_codes = sorted(response.status_code for response in responses)
+        assert 200 in status_codes
+        assert 503 in status_codes
+        assert set(status_codes) <= {200, 503}
+        busy = next(response for response in responses if response.status_code == 503)
+        assert busy.headers["Retry-After"] == "1"
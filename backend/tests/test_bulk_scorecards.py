@@ -0,0 +1,129 @@
+import json
+
+import pytest
+import crud
+import main
+import summary
+from tests.conftest import authenticated_client, create_product, query_counter, security_item, TestingSessionLocal
+
+
+class TestBulkScorecards:
+    """Test bulk scorecard ingestion"""
+
+    def test_json_array_with_partial_failures(self, authenticated_client):
+        """Test that valid items are created and each invalid item is reported"""
+        product_id = create_product(authenticated_client)
+        items = [
+            security_item(product_id, 1, 10),
+            security_item(999, 2, 5),
+            dict(security_item(product_id, 3, 5), category="bogus"),
+            {"product_id": product_id, "category": "security"},
+            security_item(product_id, 4, 3),
+        ]
+
+        response = authenticated_client.post("/scorecards/bulk", json=items)
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["created"], body["failed"]) == (2, 3)
+        assert [result["status"] for result in body["results"]] == [
+            "created", "error", "error", "error", "created"
+        ]
+        assert body["results"][1]["error"] == "Product not found"
+        assert "Invalid category" in body["results"][2]["error"]
+        assert "date" in body["results"][3]["error"]
+
+        # Scores match the single-scorecard path and rows are readable
+        first = authenticated_client.get(f"/scorecards/{body['results'][0]['id']}").json()
+        assert first["score"] == body["results"][0]["score"]
+        assert first["score"] == crud.calculate_score(items[0]["breakdown"], "security")
+        assert first["feedback"]
+        last = authenticated_client.get(f"/scorecards/{body['results'][4]['id']}").json()
+        assert (last["date"], last["score"]) == ("2025-04-04", body["results"][4]["score"])
+
+    def test_ndjson_with_malformed_line(self, authenticated_client):
+        """Test NDJSON bodies, including per-line parse errors"""
+        product_id = create_product(authenticated_client)
+        lines = [json.dumps(security_item(product_id, day, day)) for day in (1, 2)]
+        body = "\n".join([lines[0], "{not json", lines[1], ""])
+
+        response = authenticated_client.post(
+            "/scorecards/bulk", content=body, headers={"Content-Type": "application/x-ndjson"}
+        )
+        results = response.json()["results"]
+        assert [result["status"] for result in results] == ["created", "error", "created"]
+        assert results[1]["error"].startswith("Invalid JSON")
+
+    def test_summary_matches_rebuild(self, authenticated_client):
+        """Test that bulk inserts keep the summary identical to a full rebuild"""
+        product_id = create_product(authenticated_client)
+        authenticated_client.post("/scorecards", json=security_item(product_id, 15, 4))
+        items = [security_item(product_id, day, passed) for day, passed in [(10, 2), (20, 9), (5, 12)]]
+        authenticated_client.post("/scorecards/bulk", json=items)
+
+        db = TestingSessionLocal()
+        try:
+            def rows():
+                return [(s.latest_score, s.scorecard_count, round(s.mean_score, 6)) for s in summary.get_summaries(db)]
+
+            maintained = rows()
+            summary.rebuild_summaries(db)
+            rebuilt = rows()
+        finally:
+            db.close()
+        assert maintained == rebuilt
+        assert maintained[0][1] == 4
+
+    def test_query_count_independent_of_batch_size(self, authenticated_client, query_counter):
+        """Test that the product check, insert and summary update do not grow per item"""
+        product_id = create_product(authenticated_client)
+        authenticated_client.get("/auth/me")  # Warm the principal cache
+        # The first scorecard write creates the scorecards data version counter
+        authenticated_client.post("/scorecards/bulk", json=[security_item(product_id, 1, 1)])
+
+        counts = {}
+        for size in (2, 40):
+            items = [security_item(product_id, 1 + i % 28, i % 14) for i in range(size)]
+            with query_counter:
+                response = authenticated_client.post("/scorecards/bulk", json=items)
+            assert response.json()["created"] == size
+            counts[size] = query_counter.count
+
+        assert counts[2] == counts[40]
+
+    def test_rejects_oversized_and_malformed_bodies(self, authenticated_client, monkeypatch):
+        """Test the item and byte limits and non-array bodies"""
+        monkeypatch.setattr(main, "MAX_BULK_SCORECARDS", 2)
+        assert authenticated_client.post("/scorecards/bulk", json=[{}] * 3).status_code == 413
+        ndjson = {"Content-Type": "application/x-ndjson"}
+        assert authenticated_client.post("/scorecards/bulk", content="{}\n" * 3, headers=ndjson).status_code == 413
+        assert authenticated_client.post("/scorecards/bulk", json={"product_id": 1}).status_code == 400
+
+        monkeypatch.setattr(main, "MAX_BULK_BODY_BYTES", 64)
+        response = authenticated_client.post("/scorecards/bulk", content=b"[" + b" " * 100 + b"]")
+        assert response.status_code == 413
+        assert "bytes" in response.json()["detail"]
+
+        def chunked():
+            yield b"["
+            yield b" " * 100
+            yield b"]"
+
+        assert authenticated_client.post("/scorecards/bulk", content=chunked()).status_code == 413
+
+    def test_item_that_fails_to_score_is_reported(self, authenticated_client, monkeypatch):
+        """Test that an item whose feedback generation raises fails alone instead of the request"""
+        product_id = create_product(authenticated_client)
+        generate = crud.generate_feedback_and_suggestions
+
+        def flaky(breakdown, category, score):
+            if not any(breakdown.values()):
+                raise TypeError("'<=' not supported between instances of 'str' and 'int'")
+            return generate(breakdown, category, score)
+
+        monkeypatch.setattr(crud, "generate_feedback_and_suggestions", flaky)
+        items = [security_item(product_id, 1, 5), security_item(product_id, 2, 0)]
+        response = authenticated_client.post("/scorecards/bulk", json=items)
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["status"] for result in results] == ["created", "error"]
+        assert results[1]["error"].startswith("Could not score scorecard")
@@ -0,0 +1,81 @@
+import pytest
+import zstandard
+from starlette.applications import Starlette
+from starlette.responses import FileResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from compression import CompressionMiddleware, negotiate_encoding
+from tests.conftest import authenticated_client, seed_export_history, seed_export_rows
+
+
+class TestCompression:
+    """Test response compression negotiation, thresholds and streaming"""
+
+    def test_negotiate_encoding(self):
+        """Test server preference, q-values and wildcards"""
+        preference = ["zstd", "br", "gzip"]
+        assert negotiate_encoding("gzip, deflate, br", preference) == "br"
+        assert negotiate_encoding("gzip;q=0.5, zstd", preference) == "zstd"
+        assert negotiate_encoding("br;q=0, gzip", preference) == "gzip"
+        assert negotiate_encoding("*", preference) == "zstd"
+        assert negotiate_encoding("identity", preference) is None
+        assert negotiate_encoding("", preference) is None
+
+    def test_large_json_compressed_with_weak_etag(self, authenticated_client):
+        """Test that a large list is compressed and its ETag still revalidates"""
+        seed_export_history(200)
+
+        response = authenticated_client.get("/scorecards", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert len(response.json()) == 100
+        assert response.num_bytes_downloaded * 5 < len(response.content)
+
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert authenticated_client.get("/scorecards", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_small_and_identity_responses_not_compressed(self, authenticated_client):
+        """Test the minimum size threshold and clients that refuse encodings"""
+        assert "Content-Encoding" not in authenticated_client.get("/").headers
+
+        seed_export_history(200)
+        response = authenticated_client.get("/scorecards", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "Content-Encoding" not in response.headers
+
+    def test_preferred_encodings(self, authenticated_client):
+        """Test that zstd and brotli are used when the client accepts them"""
+        seed_export_history(200)
+
+        response = authenticated_client.get("/scorecards", headers={"Accept-Encoding": "br, gzip"})
+        assert response.headers["Content-Encoding"] == "br"
+        assert len(response.json()) == 100
+
+        with authenticated_client.stream("GET", "/scorecards", headers={"Accept-Encoding": "zstd, br"}) as response:
+            raw = b"".join(response.iter_raw())
+        assert response.headers["Content-Encoding"] == "zstd"
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(raw).startswith(b'[{"id":')
+
+    def test_streamed_export_compressed_per_chunk(self, authenticated_client):
+        """Test that streaming exports are compressed without a Content-Length"""
+        seed_export_rows()
+
+        response = authenticated_client.get(
+            "/scorecards/export", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        assert [line[:7] for line in response.text.splitlines()] == ['{"id": '] * 3
+
+    def test_file_response_compressed(self, tmp_path):
+        """Test that FileResponse bodies such as PDF reports are compressed as a stream"""
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.4\n" + b"0 0 m 100 100 l S\n" * 10000)
+        app = Starlette(routes=[Route("/report", lambda request: FileResponse(path, media_type="application/pdf"))])
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+        response = TestClient(app).get("/report", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.content == path.read_bytes()
+        assert response.num_bytes_downloaded < path.stat().st_size // 10
+        assert response.headers["ETag"].startswith('W/"') and response.headers["ETag"].endswith('"')
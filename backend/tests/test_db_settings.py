@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from db_settings import (
+    DatabaseSettings, async_url, build_async_engine, build_engine, engine_options, pool_stats
+)
+from tests.conftest import client, db_session
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "10000")
+    return DatabaseSettings.from_env()
+
+
+class TestDatabaseSettings:
+    """Test per-backend engine tuning"""
+
+    def test_sqlite_pragmas_applied_per_connection(self, tmp_path, settings):
+        """Test that file databases get WAL, NORMAL sync, busy timeout and mmap"""
+        engine = build_engine(f"sqlite:///{tmp_path / 'tuned.db'}", settings)
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 10000
+            assert conn.execute(text("PRAGMA mmap_size")).scalar() == settings.sqlite_mmap_size
+        engine.dispose()
+
+    def test_concurrent_sqlite_writes_wait_instead_of_failing(self, tmp_path, settings):
+        """Test that parallel writers queue on the busy timeout rather than raising 'database is locked'"""
+        engine = build_engine(f"sqlite:///{tmp_path / 'writes.db'}", settings)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE events (id INTEGER PRIMARY KEY, worker INTEGER)"))
+
+        errors = []
+
+        def write(worker):
+            try:
+                for _ in range(25):
+                    with engine.begin() as conn:
+                        conn.execute(text("INSERT INTO events (worker) VALUES (:w)"), {"w": worker})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM events")).scalar() == 200
+        engine.dispose()
+
+    def test_postgres_gets_pooled_pre_pinged_connections(self, settings):
+        """Test that server databases get pool sizing and a statement timeout"""
+        options = engine_options("postgresql://user:pass@db/stackhealth", settings)
+        assert options["pool_size"] == 7
+        assert options["max_overflow"] == settings.max_overflow
+        assert options["pool_recycle"] == settings.pool_recycle
+        assert options["pool_pre_ping"] is False
+        assert options["connect_args"] == {"options": "-c statement_timeout=30000"}
+
+    def test_async_urls_and_engine(self, tmp_path, settings):
+        """Test that the async path swaps in aiosqlite/asyncpg and keeps the tuning"""
+        import asyncio
+
+        assert async_url("sqlite:///./data/scorecard.db") == "sqlite+aiosqlite:///./data/scorecard.db"
+        assert async_url("postgresql+psycopg2://u:p@db/sh") == "postgresql+asyncpg://u:p@db/sh"
+        assert engine_options("postgresql+asyncpg://u:p@db/sh", settings)["connect_args"] == {
+            "server_settings": {"statement_timeout": "30000"}
+        }
+
+        async def journal_mode():
+            engine = build_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", settings)
+            try:
+                async with engine.connect() as conn:
+                    return (await conn.execute(text("PRAGMA journal_mode"))).scalar(), type(engine.pool).__name__
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(journal_mode()) == ("wal", "AsyncAdaptedQueuePool")
+
+    def test_pool_metrics_on_detailed_health(self, client, tmp_path, settings):
+        """Test that pool counters are reported"""
+        engine = build_engine(f"sqlite:///{tmp_path / 'pool.db'}", settings)
+        with engine.connect():
+            stats = pool_stats(engine)
+        assert stats["backend"] == "sqlite"
+        assert stats["checkedout"] == 1
+        engine.dispose()
+
+        pool = client.get("/health/detailed").json()["database"]["pool"]
+        assert {"backend", "pool_class", "status"} <= set(pool)
+
+    def test_backends_without_async_driver_fall_back_to_sync(self, db_session):
+        """Test that an unknown backend keeps the async read path working on the sync session"""
+        import asyncio
+        import crud
+        import database
+
+        assert database.default_async_url("mssql+pyodbc://u:p@db/sh") is None
+
+        from tests.conftest import TestingSessionLocal
+
+        product = database.Product(name="Fallback")
+        db_session.add(product)
+        db_session.commit()
+        adapter = database.SyncSessionAdapter(TestingSessionLocal)
+        assert [row.name for row in asyncio.run(crud.get_products_async(adapter))] == ["Fallback"]
+        assert asyncio.run(crud.get_product_by_id_async(adapter, product.id)).name == "Fallback"
@@ -0,0 +1,62 @@
+import pytest
+import data_versions
+from tests.conftest import authenticated_client, create_product, query_counter, security_item, TestingSessionLocal
+
+
+class TestConditionalGet:
+    """Test ETags and 304 responses driven by data versions"""
+
+    def test_products_not_modified_until_a_write(self, authenticated_client, query_counter):
+        """Test that a matching If-None-Match costs one version lookup and a write invalidates it"""
+        create_product(authenticated_client, "ETag Product")
+        first = authenticated_client.get("/products")
+        etag = first.headers["ETag"]
+        assert etag.startswith('"') and first.headers["Cache-Control"] == "private, no-cache"
+
+        with query_counter:
+            cached = authenticated_client.get("/products", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+        assert query_counter.count == 1
+
+        create_product(authenticated_client, "Another Product")
+        refreshed = authenticated_client.get("/products", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["ETag"] != etag
+        assert len(refreshed.json()) == 2
+
+    def test_etag_varies_with_query_and_accepts_weak_or_wildcard_tags(self, authenticated_client):
+        """Test that different queries get different tags and If-None-Match uses weak comparison"""
+        product_id = create_product(authenticated_client)
+        etag = authenticated_client.get("/scorecards").headers["ETag"]
+        assert authenticated_client.get("/scorecards", params={"product_id": product_id}).headers["ETag"] != etag
+
+        for header in (f"W/{etag}", f'"other", {etag}', "*"):
+            assert authenticated_client.get("/scorecards", headers={"If-None-Match": header}).status_code == 304
+        assert authenticated_client.get("/scorecards", headers={"If-None-Match": '"other"'}).status_code == 200
+
+    def test_scorecard_and_trend_tags_follow_scorecard_writes(self, authenticated_client):
+        """Test that single and bulk scorecard writes invalidate scorecard and trend tags"""
+        product_id = create_product(authenticated_client)
+        scorecard_id = authenticated_client.post("/scorecards", json=security_item(product_id, 1, 5)).json()["id"]
+        paths = [f"/scorecards/{scorecard_id}", f"/trends/{product_id}/security"]
+        etags = {path: authenticated_client.get(path).headers["ETag"] for path in paths}
+        for path, etag in etags.items():
+            assert authenticated_client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+        authenticated_client.post("/scorecards/bulk", json=[security_item(product_id, 2, 7)])
+        for path, etag in etags.items():
+            assert authenticated_client.get(path, headers={"If-None-Match": etag}).status_code == 200
+
+    def test_bump_creates_and_increments_counters(self, authenticated_client):
+        """Test that versions start at zero and increase with each committed bump"""
+        db = TestingSessionLocal()
+        try:
+            assert data_versions.get_versions(db, "widgets") == {"widgets": 0}
+            data_versions.bump(db, "widgets")
+            data_versions.bump(db, "widgets")
+            db.commit()
+            assert data_versions.get_versions(db, "widgets") == {"widgets": 2}
+        finally:
+            db.close()
@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+
+import pytest
+from tests.conftest import authenticated_client, seed_export_rows
+
+
+class TestScorecardExport:
+    """Test streamed NDJSON/CSV scorecard exports"""
+
+    def test_ndjson_export(self, authenticated_client):
+        """Test that every scorecard is exported in id order with a nested breakdown"""
+        seed_export_rows()
+
+        response = authenticated_client.get("/scorecards/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [record["product_name"] for record in records] == ["Alpha", "Alpha", "Beta"]
+        assert records[0]["breakdown"] == {"sast": True, "dast": False}
+        assert records[0]["date"] == "2025-01-10"
+
+    def test_flattened_csv_export_with_filters(self, authenticated_client):
+        """Test CSV export with breakdown columns and product/category/date filters"""
+        alpha_id, _ = seed_export_rows()
+
+        response = authenticated_client.get("/scorecards/export", params={
+            "format": "csv", "flatten": True, "category": "security", "date_to": "2025-02-28"
+        })
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["product_id"] == str(alpha_id)
+        assert (rows[0]["breakdown.sast"], rows[0]["breakdown.dast"]) == ("True", "False")
+        assert "breakdown.deployment_frequency" not in rows[0]
+
+        unflattened = authenticated_client.get("/scorecards/export", params={
+            "format": "csv", "product_id": alpha_id
+        })
+        rows = list(csv.DictReader(io.StringIO(unflattened.text)))
+        assert [row["category"] for row in rows] == ["security", "cicd"]
+        assert json.loads(rows[1]["breakdown"]) == {"deployment_frequency": "daily", "automated_builds": True}
+
+    def test_export_validation(self, authenticated_client):
+        """Test that unknown formats and categories are rejected"""
+        assert authenticated_client.get("/scorecards/export", params={"format": "xml"}).status_code == 400
+        assert authenticated_client.get("/scorecards/export", params={"category": "bogus"}).status_code == 400
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import pytest
+import database
+from tests.conftest import authenticated_client, TestingSessionLocal
+
+
+def seed_scorecards(count, product_name="Paged Product", start=date(2025, 1, 1)):
+    """Insert one product with scorecards spread over consecutive pairs of days"""
+    db = TestingSessionLocal()
+    try:
+        product = database.Product(name=product_name)
+        for i in range(count):
+            product.scorecards.append(database.Scorecard(
+                category="security", date=start + timedelta(days=i // 2), score=float(i),
+                breakdown={"sast": True}
+            ))
+        db.add(product)
+        db.commit()
+    finally:
+        db.close()
+
+
+def walk(client, path, limit):
+    """Follow X-Next-Cursor headers until the last page"""
+    ids, cursor, pages = [], "", 0
+    while cursor is not None:
+        response = client.get(path, params={"cursor": cursor, "limit": limit})
+        assert response.status_code == 200
+        ids.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        pages += 1
+    return ids, pages
+
+
+class TestKeysetPagination:
+    """Test opt-in cursor pagination on list endpoints"""
+
+    def test_scorecard_cursor_walk_matches_offset_order(self, authenticated_client):
+        """Test that walking cursors returns every scorecard once in offset order"""
+        seed_scorecards(11)
+
+        ids, pages = walk(authenticated_client, "/scorecards", limit=4)
+        expected = [item["id"] for item in authenticated_client.get("/scorecards").json()]
+        assert ids == expected
+        assert len(set(ids)) == 11
+        assert pages == 3
+
+    def test_scorecard_cursor_stable_under_inserts(self, authenticated_client):
+        """Test that rows inserted mid-scan do not shift later pages"""
+        seed_scorecards(6)
+
+        first = authenticated_client.get("/scorecards", params={"cursor": "", "limit": 3})
+        seen = [item["id"] for item in first.json()]
+        seed_scorecards(4, product_name="Newer Product", start=date(2026, 1, 1))
+
+        second = authenticated_client.get(
+            "/scorecards", params={"cursor": first.headers["X-Next-Cursor"], "limit": 3}
+        )
+        assert len(second.json()) == 3
+        assert not set(seen) & {item["id"] for item in second.json()}
+        assert "X-Next-Cursor" not in second.headers
+
+    def test_product_cursor_walk(self, authenticated_client):
+        """Test cursor pagination over products"""
+        for i in range(5):
+            authenticated_client.post("/products", json={"name": f"Product {i}"})
+
+        ids, _ = walk(authenticated_client, "/products", limit=2)
+        expected = [item["id"] for item in authenticated_client.get("/products").json()]
+        assert ids == expected
+
+    @pytest.mark.parametrize("path", ["/products", "/scorecards"])
+    def test_invalid_cursor(self, authenticated_client, path):
+        """Test that a malformed cursor is rejected"""
+        response = authenticated_client.get(path, params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
@@ -0,0 +1,248 @@
+import io
+import os
+import time
+import zipfile
+from datetime import date
+
+import pytest
+import crud
+import database
+import pdf_jobs
+from tests.conftest import authenticated_client, db_session, TestingSessionLocal
+
+
+@pytest.fixture
+def pdf_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_jobs, "PDF_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def seed_scorecard(score=72.5):
+    db = TestingSessionLocal()
+    try:
+        product = database.Product(name="PDF Product")
+        scorecard = database.Scorecard(
+            category="security", date=date(2025, 6, 1), score=score,
+            breakdown={"sast": True, "dast": False}, feedback="✅ Good", tool_suggestions="• Use ZAP"
+        )
+        product.scorecards.append(scorecard)
+        db.add(product)
+        db.commit()
+        return scorecard.id
+    finally:
+        db.close()
+
+
+def wait_for_job(client, job_id, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/pdf-jobs/{job_id}").json()
+        if job["status"] != pdf_jobs.PENDING:
+            return job
+        time.sleep(0.1)
+    raise AssertionError("PDF job did not finish")
+
+
+class TestPdfJobs:
+    """Test queued PDF rendering and the artifact cache"""
+
+    def test_enqueue_poll_and_download(self, authenticated_client, pdf_cache_dir):
+        """Test that a queued render can be polled and then downloaded"""
+        scorecard_id = seed_scorecard()
+
+        response = authenticated_client.post(f"/scorecards/{scorecard_id}/pdf")
+        assert response.status_code == 202
+        job = wait_for_job(authenticated_client, response.json()["job_id"])
+        assert job["status"] == pdf_jobs.DONE
+        assert job["download_url"] == f"/scorecards/{scorecard_id}/pdf"
+
+        download = authenticated_client.get(job["download_url"])
+        assert download.status_code == 200
+        assert download.headers["content-type"] == "application/pdf"
+        assert download.content.startswith(b"%PDF")
+        assert len(list(pdf_cache_dir.glob("*.pdf"))) == 1
+
+    def test_repeat_downloads_reuse_artifact(self, authenticated_client, pdf_cache_dir):
+        """Test that unchanged scorecards are served from the cache without re-rendering"""
+        scorecard_id = seed_scorecard()
+
+        first = authenticated_client.get(f"/scorecards/{scorecard_id}/pdf")
+        artifact = next(pdf_cache_dir.glob("*.pdf"))
+        rendered_at = artifact.stat().st_mtime_ns
+
+        second = authenticated_client.get(f"/scorecards/{scorecard_id}/pdf")
+        assert second.content == first.content
+        assert artifact.stat().st_mtime_ns == rendered_at
+
+        job = authenticated_client.post(f"/scorecards/{scorecard_id}/pdf").json()
+        assert job["status"] == pdf_jobs.DONE
+
+    def test_artifact_key_tracks_rendered_inputs(self):
+        """Test that any change to rendered inputs changes the artifact path"""
+        snapshot = pdf_jobs.ReportSnapshot(
+            1, pdf_jobs.ProductSnapshot("P"), "security", date(2025, 1, 1), 50.0, {"sast": True}, None, None
+        )
+        assert pdf_jobs.artifact_path(snapshot) == pdf_jobs.artifact_path(snapshot)
+        assert pdf_jobs.artifact_path(snapshot) != pdf_jobs.artifact_path(snapshot._replace(score=60.0))
+
+    def test_rendering_is_deterministic(self):
+        """Test that a snapshot always renders to the same bytes, so cached artifacts never go stale"""
+        from pdf_generator import generate_pdf_report
+
+        snapshot = pdf_jobs.ReportSnapshot(
+            1, pdf_jobs.ProductSnapshot("P"), "security", date(2025, 1, 1), 50.0, {"sast": True}, None, None
+        )
+        first = generate_pdf_report(snapshot)
+        time.sleep(1)
+        assert generate_pdf_report(snapshot) == first
+
+    def test_prune_cache_bounds_age_and_size(self, pdf_cache_dir):
+        """Test that stale artifacts and least recently used ones over the size bound are removed"""
+        now = time.time()
+        for name, age in [("stale", 90), ("old", 40), ("recent", 20), ("fresh", 0)]:
+            path = pdf_cache_dir / f"{name}.pdf"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (now - age * 60, now - age * 60))
+
+        # "fresh" is inside the grace period and survives even over the bound
+        removed = pdf_jobs.prune_cache(str(pdf_cache_dir), max_bytes=150, max_age_seconds=60 * 60)
+        assert removed == 3
+        assert sorted(path.stem for path in pdf_cache_dir.glob("*.pdf")) == ["fresh"]
+
+    def test_unknown_scorecard_and_job(self, authenticated_client):
+        """Test 404s for missing scorecards and jobs"""
+        assert authenticated_client.post("/scorecards/999/pdf").status_code == 404
+        assert authenticated_client.get("/scorecards/999/pdf").status_code == 404
+        assert authenticated_client.get("/pdf-jobs/unknown").status_code == 404
+
+
+class TestReportExport:
+    """Test streamed bulk PDF export"""
+
+    def test_export_zip_contains_matching_reports(self, authenticated_client, pdf_cache_dir):
+        """Test that the export streams one PDF per matching scorecard"""
+        db = TestingSessionLocal()
+        try:
+            product = database.Product(name="Export / Product")
+            for day, category in [(1, "security"), (2, "security"), (3, "cicd")]:
+                product.scorecards.append(database.Scorecard(
+                    category=category, date=date(2025, 3, day), score=float(day * 10), breakdown={"sast": True}
+                ))
+            db.add(product)
+            db.commit()
+        finally:
+            db.close()
+
+        response = authenticated_client.post("/reports/export", json={})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = archive.namelist()
+            assert len(names) == 3
+            assert all(name.startswith("Export_Product/") for name in names)
+            assert all(archive.read(name).startswith(b"%PDF") for name in names)
+
+        latest = authenticated_client.post(
+            "/reports/export", json={"latest_only": True, "categories": ["security"]}
+        )
+        with zipfile.ZipFile(io.BytesIO(latest.content)) as archive:
+            assert [name.split("/")[1].split("_")[1] for name in archive.namelist()] == ["2025-03-02"]
+
+    def test_export_pages_rows_without_tracking_jobs(self, authenticated_client, pdf_cache_dir, monkeypatch):
+        """Test that an export spanning several row pages keeps order and leaves polled jobs alone"""
+        monkeypatch.setattr(crud, "REPORT_EXPORT_PAGE_SIZE", 2)
+        db = TestingSessionLocal()
+        try:
+            for name in ["Beta", "Alpha"]:
+                product = database.Product(name=name)
+                for day in [1, 2]:
+                    product.scorecards.append(database.Scorecard(
+                        category="security", date=date(2025, 3, day), score=50.0, breakdown={}
+                    ))
+                product.scorecards.append(database.Scorecard(
+                    category="cicd", date=date(2025, 3, 1), score=50.0, breakdown={}
+                ))
+                db.add(product)
+            db.commit()
+        finally:
+            db.close()
+        tracked = dict(pdf_jobs.render_queue._jobs)
+
+        response = authenticated_client.post("/reports/export", json={})
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = [name.rsplit("_", 1)[0] for name in archive.namelist()]
+        assert names == [
+            "Alpha/cicd_2025-03-01", "Alpha/security_2025-03-01", "Alpha/security_2025-03-02",
+            "Beta/cicd_2025-03-01", "Beta/security_2025-03-01", "Beta/security_2025-03-02"
+        ]
+        assert pdf_jobs.render_queue._jobs == tracked
+
+    def test_export_filters(self, authenticated_client):
+        """Test export validation and empty results"""
+        assert authenticated_client.post("/reports/export", json={"categories": ["bogus"]}).status_code == 400
+        assert authenticated_client.post("/reports/export", json={"product_ids": [999]}).status_code == 404
+
+
+class TestPortfolioReport:
+    """Test the multi-category product portfolio report"""
+
+    def seed_portfolio(self):
+        from datetime import timedelta
+
+        today = date.today()
+        db = TestingSessionLocal()
+        try:
+            product = database.Product(name="Portfolio Product")
+            for days_ago, category, score in [(60, "security", 40.0), (30, "security", 55.0), (10, "cicd", 80.0)]:
+                product.scorecards.append(database.Scorecard(
+                    category=category, date=today - timedelta(days=days_ago), score=score,
+                    breakdown={"sast": True}, feedback=f"{category} {score}", tool_suggestions="• Tool"
+                ))
+            db.add(product)
+            db.commit()
+            return product.id
+        finally:
+            db.close()
+
+    def test_portfolio_rows_carry_latest_commentary_only(self, db_session):
+        """Test that one query returns every point but only the latest feedback per category"""
+        product_id = self.seed_portfolio()
+        rows = crud.get_portfolio_rows(db_session, product_id)
+
+        assert [(row.category, row.score) for row in rows] == [
+            ("cicd", 80.0), ("security", 40.0), ("security", 55.0)
+        ]
+        assert [row.feedback for row in rows] == ["cicd 80.0", None, "security 55.0"]
+
+        snapshot = pdf_jobs.snapshot_portfolio(database.Product(id=product_id, name="P"), rows)
+        assert [series.category for series in snapshot.categories] == [
+            "automation", "performance", "security", "cicd"
+        ]
+        security = snapshot.categories[2]
+        assert [score for _, score in security.points] == [40.0, 55.0]
+        assert security.feedback == "security 55.0"
+        assert snapshot.categories[0].points == ()
+
+    def test_portfolio_rendering_is_deterministic(self):
+        """Test that a portfolio snapshot always renders to the same bytes"""
+        from pdf_generator import generate_portfolio_report
+
+        snapshot = pdf_jobs.PortfolioSnapshot(1, pdf_jobs.ProductSnapshot("P"), (
+            pdf_jobs.CategorySeries("security", ((date(2025, 1, 1), 40.0), (date(2025, 2, 1), 55.0)), None, None),
+        ))
+        first = generate_portfolio_report(snapshot)
+        time.sleep(1)
+        assert generate_portfolio_report(snapshot) == first
+
+    def test_download_portfolio_pdf(self, authenticated_client, pdf_cache_dir):
+        """Test that the portfolio renders one cover page plus a page per category"""
+        product_id = self.seed_portfolio()
+
+        response = authenticated_client.get(f"/products/{product_id}/report")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
+        assert response.content.count(b"/Type /Page\n") == 5
+        assert len(list(pdf_cache_dir.glob("portfolio-*.pdf"))) == 1
+
+        assert authenticated_client.get("/products/999/report").status_code == 404
@@ -0,0 +1,404 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import event
+from auth import principal_cache
+from tests.conftest import (
+    authenticated_client, client, engine, seed_export_history, seed_rows, test_user_data, TestingSessionLocal
+)
+
+SIMULATED_DB_LATENCY = 0.01  # seconds per statement, roughly a networked Postgres round trip
+THREADPOOL_SIZE = 40  # Starlette's (anyio's) default worker thread limit
+
+
+class InFlight:
+    """Simulated statement latency that records how many statements waited at once.
+
+    Overlap is a property of how requests are scheduled, not of machine speed,
+    so benchmarks assert on it instead of on wall-clock ratios.
+    """
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def wait(self, seconds):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        try:
+            time.sleep(seconds)
+        finally:
+            with self._lock:
+                self.current -= 1
+
+    def reset(self):
+        with self._lock:
+            self.peak = self.current
+
+
+def measure_throughput(client, path, concurrency, requests_per_client=10):
+    """Issue requests from `concurrency` threads and return requests per second"""
+    def run_client(_):
+        for _ in range(requests_per_client):
+            assert client.get(path).status_code == 200
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(run_client, range(concurrency)))
+    return concurrency * requests_per_client / (time.perf_counter() - start)
+
+
+@pytest.fixture
+def slow_database():
+    """Add fixed latency to every statement on the test engine"""
+    in_flight = InFlight()
+
+    def add_latency(*args):
+        in_flight.wait(SIMULATED_DB_LATENCY)
+
+    event.listen(engine, "before_cursor_execute", add_latency)
+    yield in_flight
+    event.remove(engine, "before_cursor_execute", add_latency)
+
+
+@pytest.mark.performance
+class TestConcurrencyBenchmarks:
+    """Benchmark request throughput under concurrent clients"""
+
+    def test_authenticated_throughput_scales_with_clients(self, authenticated_client, slow_database, monkeypatch):
+        """Test that auth database lookups do not serialize requests on the event loop"""
+        # Force a user lookup on every request
+        monkeypatch.setattr(principal_cache, "max_size", 0)
+        peaks = {}
+        for concurrency in (1, 4, 8):
+            slow_database.reset()
+            rps = measure_throughput(authenticated_client, "/auth/me", concurrency)
+            peaks[concurrency] = slow_database.peak
+            print(f"/auth/me concurrency={concurrency}: {rps:.1f} req/s, "
+                  f"{peaks[concurrency]} lookups in flight at peak")
+
+        # A blocked event loop runs one lookup at a time; the threadpool overlaps them
+        assert peaks[1] == 1
+        assert peaks[8] >= 4
+
+
+@pytest.mark.performance
+class TestLoginStormBenchmarks:
+    """Benchmark API latency during a burst of logins"""
+
+    def test_login_storm_does_not_stall_reads(self, authenticated_client, test_user_data, monkeypatch):
+        """Test that bcrypt work stays in the password pool while reads are served"""
+        import statistics
+        import passwords
+
+        # Pool workers run their own copy of pwd_context; only in-process verifies are counted
+        in_process = []
+        verify = passwords.pwd_context.verify
+        monkeypatch.setattr(passwords.pwd_context, "verify", lambda *args: in_process.append(1) or verify(*args))
+
+        def timed(request):
+            start = time.perf_counter()
+            response = request()
+            return response.status_code, time.perf_counter() - start
+
+        def login(_):
+            return timed(lambda: authenticated_client.post("/auth/login", json=test_user_data))
+
+        def read(_):
+            return timed(lambda: authenticated_client.get("/products"))
+
+        with ThreadPoolExecutor(max_workers=24) as pool:
+            logins = pool.map(login, range(16))
+            reads = pool.map(read, range(40))
+            logins, reads = list(logins), list(reads)
+
+        login_latency = statistics.median(latency for _, latency in logins)
+        read_latency = statistics.median(latency for _, latency in reads)
+        print(f"login storm: {sum(code == 200 for code, _ in logins)}/16 logins ok, "
+              f"median login {login_latency * 1000:.0f} ms, median /products {read_latency * 1000:.0f} ms")
+
+        assert all(code in (200, 503) for code, _ in logins)
+        assert all(code == 200 for code, _ in reads)
+        assert not in_process
+
+
+@pytest.mark.performance
+class TestPdfRenderBenchmarks:
+    """Benchmark single-report PDF rendering"""
+
+    def test_pdf_render_time_and_allocations(self):
+        """Report per-PDF render time and allocations with the shared style registry"""
+        import statistics
+        import tracemalloc
+        from datetime import date
+        import pdf_generator
+        import pdf_jobs
+
+        snapshot = pdf_jobs.ReportSnapshot(
+            1, pdf_jobs.ProductSnapshot("Benchmark Product"), "security", date(2025, 1, 1), 81.5,
+            {field: i % 2 == 0 for i, field in enumerate(pdf_generator.get_field_labels("security"))},
+            "✅ Excellent scorecard performance!\n❌ No DAST", "• Consider OWASP ZAP"
+        )
+        pdf_generator.generate_pdf_report(snapshot)  # Warm the registry and font caches
+        assert pdf_generator._build_report_styles() is pdf_generator._build_report_styles()
+
+        timings, allocations = [], []
+        for _ in range(20):
+            tracemalloc.start()
+            start = time.perf_counter()
+            pdf = pdf_generator.generate_pdf_report(snapshot)
+            timings.append(time.perf_counter() - start)
+            allocations.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            assert pdf.startswith(b"%PDF")
+
+        print(f"PDF render: median {statistics.median(timings) * 1000:.1f} ms, "
+              f"median peak allocations {statistics.median(allocations) / 1024:.0f} KiB")
+
+
+# Seconds per statement: slow enough that 40 threads saturate before a single CPU core does
+ASYNC_BENCH_LATENCY = 0.25
+ASYNC_BENCH_POOL_SIZE = 250  # larger than the threadpool so the session path is the bottleneck
+
+
+async def measure_async_throughput(app, path, concurrency, requests_per_client=1, headers=None):
+    """Issue requests from `concurrency` coroutines in one event loop and return requests per second"""
+    import asyncio
+    import httpx
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench", headers=headers) as client:
+        async def run_client():
+            for _ in range(requests_per_client):
+                response = await client.get(path)
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run_client() for _ in range(concurrency)))
+        return concurrency * requests_per_client / (time.perf_counter() - start)
+
+
+@pytest.fixture
+def session_paths(authenticated_client):
+    """Dependencies serving main.app's async endpoints through the sync and async session paths.
+
+    The sync path runs each statement on a sync Session in the threadpool, as the
+    fallback for databases without an async driver does. Statement latency is
+    added in the driver's own thread (the request thread for the sync path,
+    aiosqlite's connection thread for the async path), so neither path blocks
+    the event loop while waiting on the database.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+    from sqlalchemy.util import await_only
+    import database
+
+    seed_rows(50)
+
+    in_flight = InFlight()
+
+    def add_latency(_statement):
+        in_flight.wait(ASYNC_BENCH_LATENCY)
+
+    sync_engine = create_engine(
+        "sqlite:///./test.db", connect_args={"check_same_thread": False},
+        pool_size=ASYNC_BENCH_POOL_SIZE, max_overflow=0
+    )
+    async_engine = create_async_engine(
+        "sqlite+aiosqlite:///./test.db", poolclass=AsyncAdaptedQueuePool,
+        pool_size=ASYNC_BENCH_POOL_SIZE, max_overflow=0
+    )
+
+    @event.listens_for(sync_engine, "connect")
+    def trace_sync(dbapi_connection, _):
+        dbapi_connection.set_trace_callback(add_latency)
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def trace_async(dbapi_connection, _):
+        await_only(dbapi_connection.driver_connection.set_trace_callback(add_latency))
+
+    SyncSession = sessionmaker(bind=sync_engine)
+    AsyncSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def sync_db():
+        yield database.SyncSessionAdapter(SyncSession)
+
+    async def async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    yield {"sync": sync_db, "async": async_db}, in_flight
+
+    import asyncio
+    asyncio.run(async_engine.dispose())
+    sync_engine.dispose()
+
+
+@pytest.mark.performance
+class TestAsyncSessionBenchmarks:
+    """Benchmark the async session path against the sync (threadpool) path"""
+
+    def test_async_reads_scale_past_the_threadpool(self, authenticated_client, session_paths):
+        """Test that authenticated async reads are not capped by Starlette's 40-thread pool"""
+        import asyncio
+        from database import get_async_db
+        from main import app
+
+        dependencies, in_flight = session_paths
+        headers = {"Authorization": authenticated_client.headers["Authorization"]}
+        default = app.dependency_overrides[get_async_db]
+        peaks = {}
+        try:
+            for concurrency in (50, 200, 1000):
+                for path, dependency in dependencies.items():
+                    app.dependency_overrides[get_async_db] = dependency
+                    in_flight.reset()
+                    rps = asyncio.run(measure_async_throughput(
+                        app, "/scorecards?limit=20", concurrency, headers=headers
+                    ))
+                    peaks[path, concurrency] = in_flight.peak
+                    print(f"{path} concurrency={concurrency}: {rps:.1f} req/s, "
+                          f"{in_flight.peak} statements in flight at peak")
+        finally:
+            app.dependency_overrides[get_async_db] = default
+
+        # Sync statements each hold a pool thread; async ones are bounded by the connection pool only
+        assert peaks["sync", 1000] <= THREADPOOL_SIZE
+        assert peaks["async", 1000] > THREADPOOL_SIZE
+
+
+@pytest.mark.performance
+class TestExportBenchmarks:
+    """Benchmark streamed scorecard exports"""
+
+    def test_export_memory_independent_of_row_count(self, client):
+        """Test that peak memory while streaming does not grow with the number of rows"""
+        import tracemalloc
+        import crud
+        import exports
+        from sqlalchemy import delete
+        import database
+
+        peaks = {}
+        for count in (2000, 10000):
+            seed_export_history(count)
+            db = TestingSessionLocal()
+            try:
+                start = time.perf_counter()
+                tracemalloc.start()
+                exported = 0
+                rows = crud.iter_export_rows(db, batch_size=500)
+                for chunk in exports.stream_csv(rows, flatten=True, batch_size=500):
+                    exported += chunk.count("\r\n")  # CSV row terminator; feedback holds bare newlines
+                peaks[count] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                elapsed = time.perf_counter() - start
+
+                db.execute(delete(database.Scorecard))
+                db.execute(delete(database.Product))
+                db.commit()
+            finally:
+                db.close()
+            print(f"CSV export of {count} rows: {elapsed * 1000:.0f} ms, peak {peaks[count] / 1024:.0f} KiB")
+            assert exported == count + 1  # header
+
+        assert peaks[10000] < peaks[2000] * 1.5
+
+
+@pytest.mark.performance
+class TestSerializationBenchmarks:
+    """Benchmark list response serialization"""
+
+    def test_direct_rows_skip_model_encoding(self, authenticated_client, monkeypatch):
+        """Report the cost of Pydantic model encoding that list endpoints no longer pay"""
+        import json
+        import statistics
+        import crud
+        import fastapi.routing
+        import schemas
+        from fastapi.encoders import jsonable_encoder
+        from fastapi.responses import ORJSONResponse
+
+        seed_export_history(10000)
+        db = TestingSessionLocal()
+        try:
+            all_rows = crud.get_scorecards_by_product(db, limit=10000)
+        finally:
+            db.close()
+
+        def models_path(rows):
+            # The previous path: ORM row -> Pydantic model -> jsonable_encoder -> json.dumps
+            models = [schemas.ScorecardWithProduct(**row._asdict()) for row in rows]
+            return json.dumps(jsonable_encoder(models)).encode()
+
+        def direct_path(rows):
+            return ORJSONResponse([row._asdict() for row in rows]).body
+
+        def median_time(serialize, rows):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                serialize(rows)
+                timings.append(time.perf_counter() - start)
+            return statistics.median(timings)
+
+        speedups = {}
+        for count in (100, 1000, 10000):
+            rows = all_rows[:count]
+            assert json.loads(models_path(rows)) == json.loads(direct_path(rows))
+            before, after = median_time(models_path, rows), median_time(direct_path, rows)
+            speedups[count] = before / after
+            print(f"{count} rows: models {before * 1000:.1f} ms, direct {after * 1000:.1f} ms "
+                  f"({speedups[count]:.1f}x)")
+
+        # The endpoint hands its rows straight to orjson: no response_model validation or encoding
+        serialized = []
+        serialize_response = fastapi.routing.serialize_response
+
+        async def counting_serialize_response(*args, **kwargs):
+            serialized.append(1)
+            return await serialize_response(*args, **kwargs)
+
+        monkeypatch.setattr(fastapi.routing, "serialize_response", counting_serialize_response)
+        response = authenticated_client.get("/scorecards", params={"limit": 1000})
+        assert len(response.json()) == 1000
+        assert not serialized
+
+
+MOBILE_LINK_BYTES_PER_SECOND = 10_000_000 / 8  # a 10 Mbit/s mobile connection
+
+
+@pytest.mark.performance
+class TestCompressionBenchmarks:
+    """Benchmark response size and end-to-end latency per content coding"""
+
+    def test_scorecard_list_bandwidth_and_latency(self, authenticated_client):
+        """Report wire size, server time and estimated mobile latency for a 1000-row page"""
+        import statistics
+
+        seed_export_history(1000)
+        results = {}
+        for encoding in ("identity", "gzip", "br", "zstd"):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                with authenticated_client.stream(
+                    "GET", "/scorecards", params={"limit": 1000},
+                    headers={"Accept-Encoding": encoding}
+                ) as response:
+                    wire_bytes = sum(len(chunk) for chunk in response.iter_raw())
+                timings.append(time.perf_counter() - start)
+            assert response.headers.get("Content-Encoding", "identity") == encoding
+
+            server = statistics.median(timings)
+            results[encoding] = wire_bytes
+            print(f"/scorecards?limit=1000 {encoding}: {wire_bytes / 1024:.0f} KiB, server {server * 1000:.1f} ms, "
+                  f"~{(server + wire_bytes / MOBILE_LINK_BYTES_PER_SECOND) * 1000:.0f} ms at 10 Mbit/s")
+
+        for encoding in ("gzip", "br", "zstd"):
+            assert results["identity"] > results[encoding] * 5
@@ -0,0 +1,22 @@
+import pytest
+from tests.conftest import authenticated_client, query_counter, seed_rows
+
+
+class TestQueryCounts:
+    """Test that list endpoints use a constant number of queries"""
+
+    @pytest.mark.parametrize("path", ["/products", "/scorecards"])
+    def test_query_count_independent_of_page_size(self, authenticated_client, query_counter, path):
+        """Test that query count does not grow with the number of rows returned"""
+        seed_rows(20)
+        authenticated_client.get(path)  # Warm the principal cache
+
+        counts = {}
+        for limit in (1, 20):
+            with query_counter:
+                response = authenticated_client.get(path, params={"limit": limit})
+            assert response.status_code == 200
+            assert len(response.json()) == limit
+            counts[limit] = query_counter.count
+
+        assert counts[1] == counts[20]
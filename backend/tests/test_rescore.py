@@ -0,0 +1,77 @@
+import random
+from datetime import date
+
+import pytest
+import database
+import rescore
+import scoring
+import summary
+from tests.conftest import db_session
+
+
+class TestRescore:
+    """Test vectorized bulk rescoring"""
+
+    @pytest.mark.parametrize("category", ["automation", "performance", "security", "cicd"])
+    def test_matrix_scores_match_scoring_engine(self, category):
+        """Test that matrix scoring matches per-breakdown scoring"""
+        rng = random.Random(42)
+        fields = list(scoring.CATEGORY_WEIGHTS[category]) + ["unknown_field"]
+        choices = [True, False, None, "daily", "<1hour", ">30%", "bogus"]
+        breakdowns = [
+            {field: rng.choice(choices) for field in rng.sample(fields, rng.randint(0, len(fields)))}
+            for _ in range(500)
+        ]
+
+        rubric = scoring.get_rubric(category)
+        values, present = rescore.encode_breakdowns(breakdowns, rubric)
+        assert values.shape == (500, len(rubric.fields))
+        assert rescore.score_matrix(values, present, rubric) == scoring.score_many(breakdowns, category)
+
+    def test_rescore_category_updates_stale_rows(self, db_session):
+        """Test that stale scores, feedback and suggestions are rewritten in chunks"""
+        product = database.Product(name="Rescore Product")
+        db_session.add(product)
+        db_session.commit()
+
+        breakdowns = [{"sast": True, "dast": bool(i % 2)} for i in range(7)]
+        for breakdown in breakdowns:
+            db_session.add(database.Scorecard(
+                product_id=product.id, category="security", date=date(2025, 1, 1),
+                score=-1, breakdown=breakdown, feedback="stale", tool_suggestions="stale"
+            ))
+        db_session.add(database.Scorecard(
+            product_id=product.id, category="cicd", date=date(2025, 1, 1),
+            score=-1, breakdown={"automated_builds": True}, feedback="stale"
+        ))
+        db_session.commit()
+
+        assert rescore.rescore_category(db_session, "security", chunk_size=3) == (7, 0)
+
+        db_session.expire_all()
+        security = db_session.query(database.Scorecard).filter_by(category="security").order_by(database.Scorecard.id).all()
+        assert [scorecard.score for scorecard in security] == scoring.score_many(breakdowns, "security")
+        assert all(scorecard.feedback != "stale" for scorecard in security)
+        cicd = db_session.query(database.Scorecard).filter_by(category="cicd").one()
+        assert cicd.score == -1
+
+    def test_rescore_skips_rows_that_fail_feedback(self, db_session):
+        """Test that a malformed row is skipped without aborting the rest of the rescore"""
+        product = database.Product(name="Rescore Product")
+        db_session.add(product)
+        db_session.commit()
+
+        breakdowns = [{"automated_builds": True}, {"lead_time": "2"}, {"automated_builds": False}]
+        for breakdown in breakdowns:
+            db_session.add(database.Scorecard(
+                product_id=product.id, category="cicd", date=date(2025, 1, 1),
+                score=-1, breakdown=breakdown, feedback="stale"
+            ))
+        db_session.commit()
+
+        assert rescore.rescore_category(db_session, "cicd", chunk_size=2) == (2, 1)
+
+        db_session.expire_all()
+        cicd = db_session.query(database.Scorecard).order_by(database.Scorecard.id).all()
+        assert [scorecard.feedback == "stale" for scorecard in cicd] == [False, True, False]
+        assert summary.get_summaries(db_session)[0].scorecard_count == 3
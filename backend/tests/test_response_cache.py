@@ -0,0 +1,214 @@
+import asyncio
+import fnmatch
+import time
+
+import pytest
+import rescore
+from response_cache import MemoryBackend, RedisBackend, ResponseCache, response_cache
+from tests.conftest import authenticated_client, create_product, query_counter, security_item, TestingSessionLocal
+
+
+class FakeRedis:
+    """In-process stand-in for the subset of the redis client the cache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] < time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    def get(self, key):
+        entry = self._live(key)
+        return entry[0] if entry else None
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, px=None, nx=False):
+        if nx and self._live(key):
+            return None
+        self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+        return True
+
+    def incr(self, key):
+        value = int(self.get(key) or 0) + 1
+        self.data[key] = (str(value).encode(), None)
+        return value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+    def info(self, section):
+        return {"used_memory": sum(len(key) + len(value) for key, (value, _) in self.data.items())}
+
+
+def trend_selects(counter):
+    return [s for s in counter.statements if "scorecards.score" in s]
+
+
+class TestResponseCacheEndpoints:
+    """Test cached trend and quarterly endpoints"""
+
+    @pytest.mark.parametrize("path", ["/trends/{}/security", "/quarterly-improvement/{}/security"])
+    def test_repeat_reads_skip_aggregation(self, authenticated_client, query_counter, path):
+        """Test that a repeated read is served from the cache with the same body"""
+        product_id = create_product(authenticated_client)
+        authenticated_client.post("/scorecards", json=security_item(product_id, 1, 5))
+
+        first = authenticated_client.get(path.format(product_id))
+        with query_counter:
+            second = authenticated_client.get(path.format(product_id))
+        assert second.json() == first.json()
+        assert not trend_selects(query_counter)
+        assert response_cache.stats()["hits"] == 1
+
+    def test_writes_invalidate_only_their_pair(self, authenticated_client, query_counter, monkeypatch):
+        """Test that single, bulk and rescore writes invalidate exactly the affected entries"""
+        # Per-worker backends recompute on any write; shared ones invalidate per pair
+        monkeypatch.setattr(response_cache, "backend", RedisBackend(FakeRedis()))
+        alpha = create_product(authenticated_client, "Alpha")
+        beta = create_product(authenticated_client, "Beta")
+        paths = [f"/trends/{alpha}/security", f"/trends/{alpha}/cicd", f"/trends/{beta}/security"]
+
+        def recomputed():
+            missed = []
+            for path in paths:
+                with query_counter:
+                    authenticated_client.get(path)
+                if trend_selects(query_counter):
+                    missed.append(path)
+            return missed
+
+        assert recomputed() == paths
+        assert recomputed() == []
+
+        authenticated_client.post("/scorecards", json=security_item(alpha, 1, 5))
+        assert recomputed() == [paths[0]]
+
+        authenticated_client.post("/scorecards/bulk", json=[security_item(beta, 2, 5)])
+        assert recomputed() == [paths[2]]
+
+        db = TestingSessionLocal()
+        try:
+            rescore.rescore_category(db, "security")
+        finally:
+            db.close()
+        assert recomputed() == [paths[0], paths[2]]
+
+    def test_memory_backend_recomputes_after_any_write(self, authenticated_client, query_counter):
+        """Test that a write another worker could have made is never answered from a local entry"""
+        alpha = create_product(authenticated_client, "Alpha")
+        beta = create_product(authenticated_client, "Beta")
+        path = f"/trends/{alpha}/security"
+        authenticated_client.get(path)
+
+        authenticated_client.post("/scorecards", json=security_item(beta, 1, 5))
+        with query_counter:
+            authenticated_client.get(path)
+        assert trend_selects(query_counter)
+
+    def test_stats_reported_on_health(self, authenticated_client):
+        """Test that hit ratio and memory use are exposed on the detailed health check"""
+        product_id = create_product(authenticated_client)
+        for _ in range(3):
+            authenticated_client.get(f"/trends/{product_id}/security")
+
+        stats = authenticated_client.get("/health/detailed").json()["response_cache"]
+        assert (stats["backend"], stats["hits"], stats["misses"], stats["entries"]) == ("memory", 2, 1, 1)
+        assert stats["hit_ratio"] == pytest.approx(0.6667)
+        assert stats["memory_bytes"] > 0
+
+
+class TestResponseCacheBackends:
+    """Test cache backends and miss coalescing"""
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        """Test LRU eviction and byte accounting"""
+        backend = MemoryBackend(max_entries=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"22", 60)
+        backend.get("a")
+        backend.set("c", b"333", 60)
+        assert (backend.get("a"), backend.get("b"), backend.get("c")) == (b"1", None, b"333")
+        assert backend.stats() == {"entries": 2, "memory_bytes": 2 + 4}
+
+    def test_concurrent_misses_compute_once(self):
+        """Test that simultaneous misses for one key in a worker share one computation"""
+        cache = ResponseCache(MemoryBackend(max_entries=16), ttl_seconds=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return [{"score": 1.0}]
+
+        async def run():
+            return await asyncio.gather(*(
+                cache.get_or_compute("trends", 1, "security", (4,), compute) for _ in range(10)
+            ))
+
+        assert asyncio.run(run()) == [[{"score": 1.0}]] * 10
+        assert len(calls) == 1
+        assert cache.stats()["coalesced"] == 9
+
+    def test_shared_backend_across_workers(self):
+        """Test that workers sharing a backend aggregate once and see each other's invalidations"""
+        client = FakeRedis()
+        workers = [ResponseCache(RedisBackend(client), ttl_seconds=60) for _ in range(2)]
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return len(calls)
+
+        async def run():
+            return await asyncio.gather(*(
+                worker.get_or_compute("trends", 1, "security", (4,), compute) for worker in workers
+            ))
+
+        assert asyncio.run(run()) == [1, 1]
+        assert len(calls) == 1
+
+        workers[0].invalidate(1, "security")
+        assert asyncio.run(workers[1].get_or_compute("trends", 1, "security", (4,), compute)) == 2
+        assert workers[1].stats()["entries"] == 2
+
+    def test_backend_errors_fall_back_to_computing(self):
+        """Test that an unreachable backend degrades to uncached reads"""
+        class DownRedis(FakeRedis):
+            def mget(self, keys):
+                raise ConnectionError("connection refused")
+
+        cache = ResponseCache(RedisBackend(DownRedis()), ttl_seconds=60)
+
+        async def compute():
+            return [1, 2]
+
+        assert asyncio.run(cache.get_or_compute("trends", 1, "security", (4,), compute)) == [1, 2]
+
+    def test_memory_backend_keys_on_data_version(self):
+        """Test that a per-worker cache recomputes when another worker bumps the data version"""
+        cache = ResponseCache(MemoryBackend(max_entries=16), ttl_seconds=60)
+        shared = ResponseCache(RedisBackend(FakeRedis()), ttl_seconds=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return len(calls)
+
+        def read(target, version):
+            return asyncio.run(target.get_or_compute("trends", 1, "security", (4,), compute, data_version=version))
+
+        # No local invalidation happened, but the scorecards version moved on
+        assert [read(cache, 1), read(cache, 1), read(cache, 2)] == [1, 1, 2]
+        # Shared backends rely on their own precise invalidation instead
+        assert [read(shared, 1), read(shared, 2)] == [3, 3]
@@ -0,0 +1,55 @@
+import pytest
+import scoring
+
+
+class TestScoringEngine:
+    """Test the compiled scoring engine"""
+
+    def test_rubrics_compiled_for_all_categories(self):
+        """Test that every category has a compiled rubric"""
+        for category in ["automation", "performance", "security", "cicd"]:
+            rubric = scoring.get_rubric(category)
+            assert rubric.category == category
+            assert len(rubric.fields) > 0
+
+    def test_security_full_marks(self):
+        """Test that a perfect security breakdown scores 100%"""
+        breakdown = {field: True for field in scoring.CATEGORY_WEIGHTS["security"]}
+        assert scoring.score(breakdown, "security") == 100.0
+
+    def test_penalty_fields_never_go_below_zero(self):
+        """Test that anti-pattern penalties are clamped at zero"""
+        breakdown = {"test_independence": False, "sanity_independence": False}
+        assert scoring.score(breakdown, "automation") == 0.0
+
+    def test_penalty_applied_when_anti_pattern_present(self):
+        """Test that a missing practice with negative weight reduces the score"""
+        good = {"automated_testing": True, "testing_framework": True, "test_independence": True}
+        bad = {"automated_testing": True, "testing_framework": True, "test_independence": False}
+        assert scoring.score(good, "automation") == 12.5
+        assert scoring.score(bad, "automation") == 0.0
+
+    def test_dora_metrics_use_value_map(self):
+        """Test that DORA metrics map string values to points"""
+        breakdown = {
+            "deployment_frequency": "on-demand",
+            "lead_time": "<1day",
+            "recovery_time": "unknown",
+        }
+        assert scoring.score(breakdown, "cicd") == 20.0
+
+    def test_unknown_category_and_fields(self):
+        """Test that unknown categories and unweighted fields score zero"""
+        assert scoring.score({"sast": True}, "unknown") == 0.0
+        assert scoring.score({"api_coverage": "80-100%"}, "automation") == 0.0
+
+    def test_score_many_matches_single_scoring(self):
+        """Test that batch scoring matches per-breakdown scoring"""
+        breakdowns = [
+            {"sast": True, "dast": False},
+            {"sast": True, "dast": True, "cve_alerts": True},
+            {},
+        ]
+        assert scoring.score_many(breakdowns, "security") == [
+            scoring.score(breakdown, "security") for breakdown in breakdowns
+        ]
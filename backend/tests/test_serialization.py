@@ -0,0 +1,37 @@
+import json
+
+import pytest
+import schemas
+from fastapi.encoders import jsonable_encoder
+from tests.conftest import authenticated_client, seed_export_rows
+
+
+class TestDirectSerialization:
+    """Test list endpoints that serialize rows without building Pydantic models"""
+
+    def test_scorecard_rows_match_schema_output(self, authenticated_client):
+        """Test that directly serialized rows equal the ScorecardWithProduct encoding"""
+        seed_export_rows()
+
+        response = authenticated_client.get("/scorecards")
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert [row["product_name"] for row in body] == ["Beta", "Alpha", "Alpha"]
+        for row in body:
+            model = schemas.ScorecardWithProduct(**row)
+            assert row == json.loads(json.dumps(jsonable_encoder(model)))
+
+    def test_products_keep_etag_and_cursor_headers(self, authenticated_client):
+        """Test that headers set before direct serialization are carried over"""
+        seed_export_rows()
+
+        response = authenticated_client.get("/products", params={"cursor": "", "limit": 1})
+        assert response.status_code == 200
+        assert set(response.json()[0]) == set(schemas.Product.model_fields)
+        assert response.headers["ETag"]
+        assert response.headers["X-Next-Cursor"]
+
+        next_page = authenticated_client.get(
+            "/products", params={"cursor": response.headers["X-Next-Cursor"], "limit": 1}
+        )
+        assert next_page.json()[0]["id"] != response.json()[0]["id"]
@@ -0,0 +1,61 @@
+import pytest
+import schemas
+from tests.conftest import authenticated_client, query_counter, seed_export_rows
+
+
+def scorecard_selects(counter):
+    return [s for s in counter.statements if "FROM scorecards" in s]
+
+
+class TestSparseFields:
+    """Test ?fields= column selection on GET /scorecards"""
+
+    def test_summary_fields_skip_large_columns(self, authenticated_client, query_counter):
+        """Test that fields=summary returns the summary schema and never reads breakdown or feedback"""
+        seed_export_rows()
+
+        with query_counter:
+            response = authenticated_client.get("/scorecards", params={"fields": "summary"})
+        assert response.status_code == 200
+        rows = response.json()
+        assert [list(row) for row in rows] == [list(schemas.ScorecardSummary.model_fields)] * 3
+        assert rows[0]["product_name"] == "Beta"
+
+        [select] = scorecard_selects(query_counter)
+        assert not any(column in select for column in ("breakdown", "feedback", "tool_suggestions"))
+
+    def test_explicit_fields_without_product_join(self, authenticated_client, query_counter):
+        """Test that id is always returned and the products join is only made when needed"""
+        seed_export_rows()
+
+        with query_counter:
+            response = authenticated_client.get(
+                "/scorecards", params={"fields": "score, date", "category": "security"}
+            )
+        assert response.json() == [
+            {"id": 3, "score": 90.0, "date": "2025-03-10"},
+            {"id": 1, "score": 40.0, "date": "2025-01-10"}
+        ]
+        [select] = scorecard_selects(query_counter)
+        assert "JOIN products" not in select
+
+    def test_fields_with_cursor_pagination(self, authenticated_client):
+        """Test that cursor pages return only the requested fields and still paginate"""
+        seed_export_rows()
+
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            response = authenticated_client.get(
+                "/scorecards", params={"fields": "score", "cursor": cursor, "limit": 2}
+            )
+            assert all(set(row) == {"id", "score"} for row in response.json())
+            seen.extend(row["id"] for row in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+        assert seen == [3, 2, 1]
+
+    def test_invalid_fields_rejected(self, authenticated_client):
+        """Test that unknown field names are rejected"""
+        response = authenticated_client.get("/scorecards", params={"fields": "score,password"})
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
@@ -0,0 +1,94 @@
+from datetime import date
+
+import pytest
+import crud
+import schemas
+import summary
+from tests.conftest import authenticated_client, db_session, TestingSessionLocal
+
+SECURITY_FIELDS = list(schemas.SecurityScorecard.model_fields)
+
+
+def create_security_scorecard(db, product_id, scorecard_date, passed):
+    """Create a scorecard through crud with the first `passed` security practices in place"""
+    breakdown = {field: i < passed for i, field in enumerate(SECURITY_FIELDS)}
+    return crud.create_scorecard(db, schemas.ScorecardCreate(
+        product_id=product_id, category="security", date=scorecard_date, breakdown=breakdown
+    ))
+
+
+def summary_rows(db):
+    return [
+        (s.product_id, s.category, s.latest_score, s.latest_date, s.scorecard_count,
+         round(s.mean_score, 6), s.min_score, s.max_score)
+        for s in summary.get_summaries(db)
+    ]
+
+
+class TestSummary:
+    """Test the materialized product/category summary"""
+
+    def test_summary_maintained_on_create(self, db_session):
+        """Test that creating scorecards keeps latest score and statistics current"""
+        product = crud.create_product(db_session, schemas.ProductCreate(name="Summary Product"))
+        middle = create_security_scorecard(db_session, product.id, date(2025, 2, 1), 6)
+        create_security_scorecard(db_session, product.id, date(2025, 1, 1), 2)
+        high = create_security_scorecard(db_session, product.id, date(2025, 3, 1), 10)
+
+        row = summary.get_summaries(db_session)[0]
+        assert row.latest_score == high.score
+        assert row.latest_date == date(2025, 3, 1)
+        assert row.scorecard_count == 3
+        assert row.max_score == high.score
+        assert row.min_score < middle.score
+
+    def test_rebuild_matches_incremental_maintenance(self, db_session):
+        """Test that a rebuild produces the same rows as write-time maintenance"""
+        first = crud.create_product(db_session, schemas.ProductCreate(name="First"))
+        second = crud.create_product(db_session, schemas.ProductCreate(name="Second"))
+        for i in range(6):
+            create_security_scorecard(db_session, first.id, date(2025, 1, 1 + i % 3), i)
+            create_security_scorecard(db_session, second.id, date(2025, 5, 1), 10 - i)
+
+        incremental = summary_rows(db_session)
+        assert summary.rebuild_summaries(db_session) == 2
+        db_session.expire_all()
+        assert summary_rows(db_session) == incremental
+
+    def test_interleaved_sessions_do_not_lose_updates(self, db_session):
+        """Test that a writer holding a stale summary row cannot overwrite a concurrent fold"""
+        product = crud.create_product(db_session, schemas.ProductCreate(name="Race Product"))
+        create_security_scorecard(db_session, product.id, date(2025, 1, 1), 2)
+
+        other = TestingSessionLocal()
+        try:
+            # The second session holds the summary row from before the first one writes again
+            stale = summary.get_summaries(other)[0]
+            assert stale.scorecard_count == 1
+            create_security_scorecard(db_session, product.id, date(2025, 3, 1), 8)
+            create_security_scorecard(other, product.id, date(2025, 2, 1), 4)
+        finally:
+            other.close()
+
+        db_session.expire_all()
+        row = summary.get_summaries(db_session)[0]
+        assert (row.scorecard_count, row.latest_date) == (3, date(2025, 3, 1))
+        incremental = summary_rows(db_session)
+        summary.rebuild_summaries(db_session)
+        db_session.expire_all()
+        assert summary_rows(db_session) == incremental
+
+    def test_summary_endpoint(self, authenticated_client):
+        """Test that /summary returns one row per product and category"""
+        db = TestingSessionLocal()
+        try:
+            product = crud.create_product(db, schemas.ProductCreate(name="Endpoint Product"))
+            create_security_scorecard(db, product.id, date(2025, 1, 1), 5)
+        finally:
+            db.close()
+
+        response = authenticated_client.get("/summary")
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert response.json()[0]["product_name"] == "Endpoint Product"
+        assert authenticated_client.get("/summary", params={"category": "cicd"}).json() == []
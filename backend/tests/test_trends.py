@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+
+import pytest
+import database
+from tests.conftest import authenticated_client, query_counter, TestingSessionLocal
+
+
+def seed_history(days_ago, category="security"):
+    """Insert a product with one scorecard per entry in days_ago and return its id"""
+    db = TestingSessionLocal()
+    try:
+        product = database.Product(name="Trend Product")
+        for i, offset in enumerate(days_ago):
+            product.scorecards.append(database.Scorecard(
+                category=category, date=date.today() - timedelta(days=offset), score=float(i * 10),
+                breakdown={"sast": True, "notes": "x" * 1000}, feedback="feedback"
+            ))
+        db.add(product)
+        db.commit()
+        return product.id
+    finally:
+        db.close()
+
+
+class TestTrends:
+    """Test trend and quarterly improvement endpoints"""
+
+    def test_trend_data_ordered_by_date(self, authenticated_client):
+        """Test that trend points come back oldest first with their scores"""
+        product_id = seed_history([30, 10, 20])
+
+        response = authenticated_client.get(f"/trends/{product_id}/security")
+        assert response.status_code == 200
+        assert [point["score"] for point in response.json()] == [0.0, 20.0, 10.0]
+        assert all(point["category"] == "security" for point in response.json())
+
+    @pytest.mark.parametrize("path", ["/trends/{}/security", "/quarterly-improvement/{}/security"])
+    def test_trend_queries_skip_large_columns(self, authenticated_client, query_counter, path):
+        """Test that trend queries only select the plotted columns"""
+        product_id = seed_history([5])
+
+        with query_counter:
+            response = authenticated_client.get(path.format(product_id))
+        assert response.status_code == 200
+
+        trend_selects = [s for s in query_counter.statements if "scorecards.score" in s]
+        assert trend_selects
+        assert not any("breakdown" in s or "feedback" in s for s in trend_selects)
+
+    def test_quarterly_improvement_latest_per_quarter(self, db_session):
+        """Test that SQL bucketing keeps only the most recent scorecard per calendar quarter"""
+        import crud
+
+        product = database.Product(name="Quarterly Product")
+        for offset in range(0, 900, 11):
+            product.scorecards.append(database.Scorecard(
+                category="cicd", date=date.today() - timedelta(days=offset), score=float(offset),
+                breakdown={}
+            ))
+        db_session.add(product)
+        db_session.commit()
+
+        for quarters in (1, 4, 8):
+            start_date = date.today() - timedelta(days=quarters * 365 // 4)
+            expected = {}
+            for scorecard in sorted(product.scorecards, key=lambda s: s.date):
+                if scorecard.date >= start_date:
+                    expected[(scorecard.date.year, (scorecard.date.month - 1) // 3)] = scorecard.date
+
+            rows = crud.get_quarterly_improvement_data(db_session, product.id, "cicd", quarters)
+            assert [row.date for row in rows] == sorted(expected.values())
+
+    def test_quarterly_improvement_keeps_first_of_same_day_scorecards(self, authenticated_client):
+        """Test that when a quarter's latest date has several scorecards, the first recorded one is used"""
+        product_id = seed_history([5, 5])
+        response = authenticated_client.get(f"/quarterly-improvement/{product_id}/security")
+        assert [point["score"] for point in response.json()] == [0.0]
+
+    def test_quarterly_improvement_rejects_invalid_quarters(self, authenticated_client):
+        """Test that the quarters parameter must be positive"""
+        product_id = seed_history([5])
+        response = authenticated_client.get(f"/quarterly-improvement/{product_id}/security?quarters=0")
+        assert response.status_code == 400
+
+    def test_trend_batch_single_query(self, authenticated_client, query_counter):
+        """Test that batch trends return columnar series from one grouped query"""
+        product_id = seed_history([30, 10, 20])
+
+        with query_counter:
+            response = authenticated_client.post("/trends/batch", json={"pairs": [
+                {"product_id": product_id, "category": "security"},
+                {"product_id": product_id, "category": "cicd"},
+            ]})
+        assert response.status_code == 200
+        trend_selects = [s for s in query_counter.statements if "scorecards.score" in s]
+        assert len(trend_selects) == 1
+
+        security, cicd = response.json()["series"]
+        single = authenticated_client.get(f"/trends/{product_id}/security").json()
+        assert security["dates"] == [point["date"] for point in single]
+        assert security["scores"] == [point["score"] for point in single]
+        assert cicd == {"product_id": product_id, "category": "cicd", "dates": [], "scores": []}
+
+    def test_trend_batch_all(self, authenticated_client):
+        """Test that "all" returns every product and category with data"""
+        product_id = seed_history([3, 2])
+
+        response = authenticated_client.post("/trends/batch", json={"pairs": "all"})
+        assert response.status_code == 200
+        assert [(s["product_id"], s["category"], len(s["scores"])) for s in response.json()["series"]] == [
+            (product_id, "security", 2)
+        ]
+
+    def test_trend_batch_invalid_category(self, authenticated_client):
+        """Test that batch requests validate categories"""
+        response = authenticated_client.post(
+            "/trends/batch", json={"pairs": [{"product_id": 1, "category": "bogus"}]}
+        )
+        assert response.status_code == 400
@@ -1,10 +1,17 @@
 // Software Scorecard Dashboard v2.0 - Frontend Application
+
+// How long the batched trend series may be reused before it is fetched again
+const TREND_SERIES_TTL_MS = 60 * 1000;
+
 class ScorecardDashboard {
     constructor() {
         this.baseURL = this.detectBaseURL();
         this.token = localStorage.getItem('authToken');
         this.currentUser = null;
         this.chart = null;
+        // Pending or loaded map of every trend series, keyed by "productId:category"
+        this.trendSeries = null;
+        this.trendSeriesFetchedAt = 0;
         
         this.init();
     }
@@ -234,6 +241,7 @@ class ScorecardDashboard {
         console.log('Current user:', this.currentUser);
         
         this.token = null;
+        this.trendSeries = null;
         localStorage.removeItem('authToken');
         delete axios.defaults.headers.common['Authorization'];
         
@@ -765,6 +773,7 @@ class ScorecardDashboard {
             });
 
             this.showAlert('Scorecard submitted successfully!', 'success');
+            this.trendSeries = null;
             document.getElementById('scorecardForm').reset();
             document.getElementById('scorecardFields').innerHTML = '';
             this.loadScorecards();
@@ -857,13 +866,32 @@ class ScorecardDashboard {
         }
 
         try {
-            const response = await axios.get(`${this.baseURL}/trends/${productId}/${category}?days=90`);
-            this.displayTrendChart(response.data, category);
+            const series = await this.getTrendSeries();
+            const match = series.get(`${productId}:${category}`) || { dates: [], scores: [] };
+            const data = match.dates.map((date, i) => ({ date, score: match.scores[i] }));
+            this.displayTrendChart(data, category);
         } catch (error) {
             console.error('Failed to load trends:', error);
         }
     }
 
+    async getTrendSeries() {
+        // One request serves every product/category selection until a scorecard is
+        // submitted, the trends tab is reopened, or the TTL expires
+        if (!this.trendSeries || Date.now() - this.trendSeriesFetchedAt > TREND_SERIES_TTL_MS) {
+            this.trendSeriesFetchedAt = Date.now();
+            this.trendSeries = axios.post(`${this.baseURL}/trends/batch`, { pairs: 'all' })
+                .then(response => new Map(
+                    response.data.series.map(item => [`${item.product_id}:${item.category}`, item])
+                ))
+                .catch(error => {
+                    this.trendSeries = null;
+                    throw error;
+                });
+        }
+        return this.trendSeries;
+    }
+
     displayTrendChart(data, category) {
         const ctx = document.getElementById('trendChart').getContext('2d');
         
@@ -1033,6 +1061,8 @@ class ScorecardDashboard {
         } else if (tabName === 'dashboard') {
             this.loadScorecards();
         } else if (tabName === 'trends') {
+            // Refetch trend series so scorecards added elsewhere show up
+            this.trendSeries = null;
             // Load products for trends selector
             this.loadProducts();
         }